@@ -4,6 +4,7 @@ from .core.events import events
 from .core.keyboard import keyboard
 from .core.macro import Macro, macro
 from .core.mouse import mouse
+from .core.timing import timing
 from .core.types import DisplayInfo, Key, MouseButton, Point, Rect, Size, WindowInfo, WindowState
 from .core.window import window
 
@@ -16,6 +17,7 @@ __all__ = [
     "window",
     "clipboard",
     "events",
+    "timing",
     "Macro",
     "macro",
     "Point",
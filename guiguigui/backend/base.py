@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Collection, Iterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any
 
+from ..core.motion import play_path
+from ..core.spatial import WindowGrid
 from ..core.types import (
     DisplayInfo,
+    EventFilter,
     Key,
     KeyboardEvent,
+    KeyboardState,
+    Modifier,
+    MotionReport,
     MouseButton,
     MouseEvent,
+    MouseState,
     Point,
     Rect,
     WindowInfo,
@@ -18,6 +27,13 @@ from ..core.types import (
 
 
 class Backend(ABC):
+    # Whether list_windows() returns the topmost window first
+    windows_topmost_first = True
+    # Hotkey that pastes the clipboard into the focused application
+    paste_keys: tuple[Key | str, ...] = (Key.CTRL, Key.V)
+    # Whether hooks apply an EventFilter themselves; otherwise Events filters in Python
+    hook_filters = False
+
     @abstractmethod
     def mouse_position(self) -> Point:
         pass
@@ -46,6 +62,29 @@ class Backend(ABC):
     def mouse_is_pressed(self, button: MouseButton) -> bool:
         pass
 
+    def mouse_state(self) -> MouseState:
+        """Snapshot of the pointer position and pressed buttons."""
+        buttons = set()
+        for button in MouseButton:
+            try:
+                if self.mouse_is_pressed(button):
+                    buttons.add(button)
+            except ValueError:
+                # Buttons the platform does not support are never pressed
+                pass
+        return MouseState(self.mouse_position(), frozenset(buttons))
+
+    def mouse_move_path(
+        self, points: Sequence[tuple[int, int]] | Any, timestamps: Sequence[float] | Any
+    ) -> MotionReport:
+        """Move the pointer through ``points``, reaching each at ``timestamps`` seconds.
+
+        ``points`` is a sequence of (x, y) pairs or an ``(n, 2)`` NumPy array,
+        as produced by ``core.motion.trajectory()``; timestamps are relative
+        to the call. Overdue points are dropped, the last one never is.
+        """
+        return play_path(points, timestamps, self.mouse_move_to)
+
     @abstractmethod
     def key_press(self, key: Key | str) -> None:
         pass
@@ -58,6 +97,18 @@ class Backend(ABC):
     def key_is_pressed(self, key: Key | str) -> bool:
         pass
 
+    def keyboard_state(self, keys: Collection[Key] | None = None) -> KeyboardState:
+        """Snapshot of the pressed keys, among ``keys`` if given."""
+        pressed = set()
+        for key in Key if keys is None else keys:
+            try:
+                if self.key_is_pressed(key):
+                    pressed.add(key)
+            except Exception:
+                # Keys the platform cannot map are never pressed
+                pass
+        return KeyboardState(frozenset(pressed))
+
     @abstractmethod
     def key_type_unicode(self, text: str) -> None:
         pass
@@ -70,6 +121,17 @@ class Backend(ABC):
     def get_displays(self) -> list[DisplayInfo]:
         pass
 
+    def probe_displays(self) -> list[DisplayInfo]:
+        """Re-detect connected displays, for backends where get_displays() may be stale."""
+        return self.get_displays()
+
+    def watch_displays(self, callback: Callable[[], None]) -> Any:
+        """Call ``callback()`` from a background thread when the display layout changes."""
+        raise NotImplementedError("Display watching not supported on this platform")
+
+    def unwatch_displays(self, watch_handle: Any) -> None:
+        raise NotImplementedError("Display watching not supported on this platform")
+
     @abstractmethod
     def get_primary_display(self) -> DisplayInfo:
         pass
@@ -86,10 +148,57 @@ class Backend(ABC):
     def get_active_window(self) -> WindowInfo | None:
         pass
 
+    def iter_windows(
+        self,
+        visible_only: bool = True,
+        pid: int | None = None,
+        class_name: str | None = None,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[WindowInfo]:
+        """Yield windows as their information becomes available.
+
+        ``pid`` and ``class_name`` are hints that let a backend skip windows
+        before reading all of their properties; callers must still check the
+        windows they receive. ``fields`` names the WindowInfo fields the caller
+        needs; backends may defer reading the others until they are accessed.
+        """
+        yield from self.list_windows(visible_only)
+
+    def get_window_info(self, handle: Any) -> WindowInfo | None:
+        """Return fresh information for a single window, or None if it is gone."""
+        for info in self.list_windows(visible_only=False):
+            if info.handle == handle:
+                return info
+        return None
+
+    def watch_windows(self, callback: Callable[[str, Any], None]) -> Any:
+        """Call ``callback(kind, handle)`` from a background thread as windows change.
+
+        ``kind`` is one of ``"created"``, ``"destroyed"``, ``"changed"``,
+        ``"active"`` or ``"restacked"``. ``"restacked"`` means the stacking
+        order changed; its handle is 0 and ``window_stacking()`` has the new order.
+        """
+        raise NotImplementedError("Window watching not supported on this platform")
+
+    def unwatch_windows(self, watch_handle: Any) -> None:
+        raise NotImplementedError("Window watching not supported on this platform")
+
     @abstractmethod
     def get_window_at(self, x: int, y: int) -> WindowInfo | None:
         pass
 
+    def get_windows_at(self, points: Sequence[Point | tuple[int, int]]) -> list[WindowInfo | None]:
+        """Hit-test many points against one snapshot of the visible windows."""
+        grid = WindowGrid(self.list_windows(visible_only=True), self.windows_topmost_first)
+        return grid.at_points(points)
+
+    def window_stacking(self) -> list[Any]:
+        """Return the top-level window handles, topmost first."""
+        handles = [w.handle for w in self.list_windows(visible_only=False)]
+        if not self.windows_topmost_first:
+            handles.reverse()
+        return handles
+
     @abstractmethod
     def focus_window(self, handle: Any) -> None:
         pass
@@ -130,6 +239,27 @@ class Backend(ABC):
     def clipboard_set_text(self, text: str) -> None:
         pass
 
+    def clipboard_wait_consumed(self, timeout: float = 2.0) -> bool:
+        """Wait until another application has read the text set by clipboard_set_text().
+
+        Returns False if that could not be observed within ``timeout``. Backends
+        that cannot observe clipboard reads wait a short fixed time instead.
+        """
+        time.sleep(min(timeout, 0.1))
+        return False
+
+    def clipboard_save(self) -> Any:
+        """Snapshot of the whole clipboard for ``clipboard_restore()``.
+
+        None if the backend cannot put every kind of content back as it was;
+        callers should then leave the clipboard alone rather than restore it.
+        """
+        return None
+
+    def clipboard_restore(self, saved: Any) -> None:
+        """Put back a snapshot returned by ``clipboard_save()``."""
+        raise NotImplementedError("Clipboard restore not supported on this platform")
+
     @abstractmethod
     def clipboard_clear(self) -> None:
         pass
@@ -138,12 +268,89 @@ class Backend(ABC):
     def clipboard_has_text(self) -> bool:
         pass
 
-    def hook_mouse(self, callback: Callable[[MouseEvent], bool]) -> Any:
+    def batch(self) -> AbstractContextManager[None]:
+        """Group input events so the backend can send them together."""
+        return nullcontext()
+
+    def sync(self) -> None:
+        """Wait until the input sent so far has been processed.
+
+        Backends that inject input synchronously have nothing to wait for.
+        """
+        return
+
+    def acknowledge(self, timeout: float = 1.0) -> float | None:
+        """Wait up to ``timeout`` seconds for the input sent so far to be delivered.
+
+        Returns the delivery latency in seconds, or None if delivery could not
+        be observed. Backends without a way to observe it sync and return None.
+        """
+        self.sync()
+        return None
+
+    def hook_mouse(
+        self, callback: Callable[[MouseEvent], bool], event_filter: EventFilter | None = None
+    ) -> Any:
+        """Call ``callback`` from a background thread for every global mouse event.
+
+        Backends with ``hook_filters`` only deliver events ``event_filter``
+        accepts and drop the others before building events for them.
+        """
         raise NotImplementedError("Mouse hook not supported on this platform")
 
-    def hook_keyboard(self, callback: Callable[[KeyboardEvent], bool]) -> Any:
+    def hook_keyboard(
+        self, callback: Callable[[KeyboardEvent], bool], event_filter: EventFilter | None = None
+    ) -> Any:
         raise NotImplementedError("Keyboard hook not supported on this platform")
 
+    def hook_mouse_batch(
+        self,
+        callback: Callable[[list[Any]], Any],
+        max_batch: int = 256,
+        max_latency: float = 0.01,
+        raw: bool = False,
+        event_filter: EventFilter | None = None,
+    ) -> Any:
+        """Deliver mouse events to ``callback`` in lists of at most ``max_batch``.
+
+        With ``raw`` the lists hold ``MouseEvent.row()`` tuples instead of
+        events. Backends that can batch wait at most ``max_latency`` seconds to
+        fill a list; this fallback delivers each ``hook_mouse()`` event as a
+        list of one, filtering in Python unless the backend has
+        ``hook_filters``. The handle is removed with ``unhook()``.
+        """
+        accept = (
+            event_filter.predicate() if event_filter is not None and not self.hook_filters else None
+        )
+
+        def deliver(ev: MouseEvent) -> bool:
+            if accept is None or accept(ev):
+                callback([ev.row() if raw else ev])
+            return True
+
+        if self.hook_filters and event_filter is not None:
+            return self.hook_mouse(deliver, event_filter)
+        return self.hook_mouse(deliver)
+
+    def hook_hotkey(self, key: Key | str, modifiers: Modifier, callback: Callable[[], Any]) -> Any:
+        """Call ``callback()`` whenever ``key`` is pressed with exactly ``modifiers`` held.
+
+        Backends that can grab hotkeys are only woken by the hotkey itself;
+        this fallback matches the presses reported by ``hook_keyboard()``. The
+        handle is removed with ``unhook()``.
+        """
+
+        def on_key(ev: KeyboardEvent) -> bool:
+            if ev.pressed and ev.key == key and ev.modifier_mask == modifiers:
+                callback()
+            return True
+
+        if self.hook_filters:
+            return self.hook_keyboard(
+                on_key, EventFilter(types=frozenset({"press"}), keys=frozenset({key}))
+            )
+        return self.hook_keyboard(on_key)
+
     def unhook(self, hook_handle: Any) -> None:
         raise NotImplementedError("Hook not supported on this platform")
 
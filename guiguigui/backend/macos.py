@@ -4,6 +4,7 @@ import time
 from typing import Any
 
 from ..core.errors import BackendCapabilityError
+from ..core.timing import timing
 from ..core.types import DisplayInfo, Key, MouseButton, Point, Rect, Size, WindowInfo, WindowState
 from .base import Backend
 
@@ -12,6 +13,7 @@ try:
     from Cocoa import (
         NSApplicationActivationPolicyRegular,
         NSPasteboard,
+        NSPasteboardItem,
         NSScreen,
         NSStringPboardType,
         NSWorkspace,
@@ -48,8 +50,15 @@ except ImportError as e:
 
 
 class MacOSBackend(Backend):
+    paste_keys = (Key.CMD, Key.V)
+
     def __init__(self) -> None:
         self._key_code_map = self._build_key_code_map()
+        # Last pointer position we set, reused by clicks and relative moves
+        # until it is older than pointer_ttl seconds
+        self.pointer_ttl = 0.05
+        self._pointer: Point | None = None
+        self._pointer_at = float("-inf")
         self._reverse_key_map = {v: k for k, v in self._key_code_map.items()}
 
     def _build_key_code_map(self) -> dict[str, int]:
@@ -145,16 +154,25 @@ class MacOSBackend(Backend):
         loc = CGEventGetLocation(event)
         return Point(int(loc.x), int(loc.y))
 
+    def _tracked_position(self) -> Point:
+        """Where we last moved the pointer, re-read once older than pointer_ttl."""
+        if self._pointer is None or time.monotonic() - self._pointer_at >= self.pointer_ttl:
+            self._pointer = self.mouse_position()
+            self._pointer_at = time.monotonic()
+        return self._pointer
+
     def mouse_move_to(self, x: int, y: int) -> None:
         event = CGEventCreateMouseEvent(None, kCGEventMouseMoved, (x, y), 0)
         CGEventPost(kCGHIDEventTap, event)
+        self._pointer = Point(x, y)
+        self._pointer_at = time.monotonic()
 
     def mouse_move_rel(self, dx: int, dy: int) -> None:
-        current = self.mouse_position()
+        current = self._tracked_position()
         self.mouse_move_to(current.x + dx, current.y + dy)
 
     def mouse_press(self, button: MouseButton) -> None:
-        pos = self.mouse_position()
+        pos = self._tracked_position()
         if button == MouseButton.LEFT:
             event = CGEventCreateMouseEvent(
                 None, kCGEventLeftMouseDown, (pos.x, pos.y), kCGMouseButtonLeft
@@ -172,7 +190,7 @@ class MacOSBackend(Backend):
         CGEventPost(kCGHIDEventTap, event)
 
     def mouse_release(self, button: MouseButton) -> None:
-        pos = self.mouse_position()
+        pos = self._tracked_position()
         if button == MouseButton.LEFT:
             event = CGEventCreateMouseEvent(
                 None, kCGEventLeftMouseUp, (pos.x, pos.y), kCGMouseButtonLeft
@@ -227,6 +245,8 @@ class MacOSBackend(Backend):
         return False
 
     def key_type_unicode(self, text: str) -> None:
+        """Type text one key event at a time, pausing for the timing profile's ``key_hold``."""
+        timings = timing.current()
         for char in text:
             if char.lower() in self._key_code_map:
                 key_code = self._key_code_map[char.lower()]
@@ -237,16 +257,16 @@ class MacOSBackend(Backend):
                     shift_code = self._key_code_map["shift"]
                     shift_down = CGEventCreateKeyboardEvent(None, shift_code, True)
                     CGEventPost(kCGHIDEventTap, shift_down)
-                    time.sleep(0.01)
+                    timing.pause(timings.key_hold, timings)
 
                 CGEventPost(kCGHIDEventTap, down_event)
-                time.sleep(0.01)
+                timing.pause(timings.key_hold, timings)
                 CGEventPost(kCGHIDEventTap, up_event)
 
                 if char.isupper():
                     shift_up = CGEventCreateKeyboardEvent(None, shift_code, False)
                     CGEventPost(kCGHIDEventTap, shift_up)
-                    time.sleep(0.01)
+                    timing.pause(timings.key_hold, timings)
             else:
                 space_code = self._key_code_map["space"]
                 down_event = CGEventCreateKeyboardEvent(None, space_code, True)
@@ -258,7 +278,7 @@ class MacOSBackend(Backend):
                 CGEventKeyboardSetUnicodeString(up_event, len(char), char)
 
                 CGEventPost(kCGHIDEventTap, down_event)
-                time.sleep(0.01)
+                timing.pause(timings.key_hold, timings)
                 CGEventPost(kCGHIDEventTap, up_event)
 
     def get_keyboard_layout(self) -> str:
@@ -360,52 +380,58 @@ class MacOSBackend(Backend):
         return Rect(min_x, min_y, max_x - min_x, max_y - min_y)
 
     def list_windows(self, visible_only: bool = True) -> list[WindowInfo]:
+        windows: list[WindowInfo] = []
+        for window in self._copy_window_list(visible_only):
+            window_info = self._window_info(dict(window), visible_only)
+            if window_info is not None:
+                windows.append(window_info)
+
+        return windows
+
+    @staticmethod
+    def _copy_window_list(visible_only: bool) -> list[Any]:
         options = kCGWindowListOptionOnScreenOnly if visible_only else 0
         options |= kCGWindowListExcludeDesktopElements
+        return CGWindowListCopyWindowInfo(options, kCGNullWindowID) or []
+
+    @staticmethod
+    def _window_bounds(window_dict: dict[str, Any]) -> Rect:
+        bounds_dict = window_dict.get("kCGWindowBounds", {})
+        return Rect(
+            int(bounds_dict.get("X", 0)),
+            int(bounds_dict.get("Y", 0)),
+            int(bounds_dict.get("Width", 0)),
+            int(bounds_dict.get("Height", 0)),
+        )
 
-        window_list = CGWindowListCopyWindowInfo(options, kCGNullWindowID)
-        windows: list[WindowInfo] = []
+    def _window_info(self, window_dict: dict[str, Any], visible_only: bool) -> WindowInfo | None:
+        owner_name = window_dict.get("kCGWindowOwnerName", "")
+        window_name = window_dict.get("kCGWindowName", "")
+        window_number = window_dict.get("kCGWindowNumber", 0)
+        owner_pid = window_dict.get("kCGWindowOwnerPID", 0)
 
-        if not window_list:
-            return windows
+        rect = self._window_bounds(window_dict)
 
-        for window in window_list:
-            window_dict = dict(window)
+        layer = window_dict.get("kCGWindowLayer", 0)
+        is_on_screen = window_dict.get("kCGWindowIsOnscreen", False)
 
-            owner_name = window_dict.get("kCGWindowOwnerName", "")
-            window_name = window_dict.get("kCGWindowName", "")
-            window_number = window_dict.get("kCGWindowNumber", 0)
-            owner_pid = window_dict.get("kCGWindowOwnerPID", 0)
-
-            bounds_dict = window_dict.get("kCGWindowBounds", {})
-            x = int(bounds_dict.get("X", 0))
-            y = int(bounds_dict.get("Y", 0))
-            width = int(bounds_dict.get("Width", 0))
-            height = int(bounds_dict.get("Height", 0))
-
-            layer = window_dict.get("kCGWindowLayer", 0)
-            is_on_screen = window_dict.get("kCGWindowIsOnscreen", False)
-
-            if width == 0 or height == 0:
-                continue
-
-            window_info = WindowInfo(
-                handle=window_number,
-                title=window_name,
-                class_name=owner_name,
-                pid=owner_pid,
-                process_name=owner_name,
-                rect=Rect(x, y, width, height),
-                client_rect=Rect(x, y, width, height),
-                state=WindowState.NORMAL,
-                is_visible=is_on_screen and visible_only,
-                is_active=False,
-                is_always_on_top=layer > 0,
-                opacity=window_dict.get("kCGWindowAlpha", 1.0),
-            )
-            windows.append(window_info)
+        if rect.width == 0 or rect.height == 0:
+            return None
 
-        return windows
+        return WindowInfo(
+            handle=window_number,
+            title=window_name,
+            class_name=owner_name,
+            pid=owner_pid,
+            process_name=owner_name,
+            rect=rect,
+            client_rect=Rect(rect.x, rect.y, rect.width, rect.height),
+            state=WindowState.NORMAL,
+            is_visible=is_on_screen and visible_only,
+            is_active=False,
+            is_always_on_top=layer > 0,
+            opacity=window_dict.get("kCGWindowAlpha", 1.0),
+        )
 
     def get_active_window(self) -> WindowInfo | None:
         workspace = NSWorkspace.sharedWorkspace()
@@ -425,12 +451,19 @@ class MacOSBackend(Backend):
         return None
 
     def get_window_at(self, x: int, y: int) -> WindowInfo | None:
-        windows = self.list_windows(visible_only=True)
+        """Get the frontmost on-screen window containing the point.
+
+        The window list is already ordered front to back, so only the bounds
+        are checked and a WindowInfo is built for the hit alone.
+        """
         point = Point(x, y)
 
-        for window in windows:
-            if window.rect.contains(point):
-                return window
+        for window in self._copy_window_list(visible_only=True):
+            window_dict = dict(window)
+            if self._window_bounds(window_dict).contains(point):
+                window_info = self._window_info(window_dict, visible_only=True)
+                if window_info is not None:
+                    return window_info
 
         return None
 
@@ -485,6 +518,27 @@ class MacOSBackend(Backend):
         pasteboard.clearContents()
         pasteboard.setString_forType_(text, NSStringPboardType)
 
+    def clipboard_save(self) -> Any:
+        """Every pasteboard item as its data for each of its types."""
+        pasteboard = NSPasteboard.generalPasteboard()
+        return [
+            [(kind, item.dataForType_(kind)) for kind in item.types()]
+            for item in pasteboard.pasteboardItems() or ()
+        ]
+
+    def clipboard_restore(self, saved: Any) -> None:
+        pasteboard = NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        items = []
+        for representations in saved:
+            item = NSPasteboardItem.alloc().init()
+            for kind, data in representations:
+                if data is not None:
+                    item.setData_forType_(data, kind)
+            items.append(item)
+        if items:
+            pasteboard.writeObjects_(items)
+
     def clipboard_clear(self) -> None:
         pasteboard = NSPasteboard.generalPasteboard()
         pasteboard.clearContents()
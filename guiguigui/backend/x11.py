@@ -2,109 +2,1042 @@
 
 from __future__ import annotations
 
+import atexit
+import dataclasses
+import select
+import struct
+import sys
+import threading
 import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Collection, Iterator, Sequence
+from contextlib import contextmanager
 from typing import Any
 
-from ..core.types import DisplayInfo, Key, MouseButton, Point, Rect, Size, WindowInfo, WindowState
+from ..core.errors import BackendCapabilityError, GuiGuiGuiError
+from ..core.motion import play_path, trajectory
+from ..core.spatial import WindowGrid
+from ..core.types import (
+    MOUSE_EVENT_BUTTONS,
+    WINDOW_INFO_FIELDS,
+    DisplayInfo,
+    EventFilter,
+    Key,
+    KeyboardEvent,
+    KeyboardState,
+    LazyWindowInfo,
+    Modifier,
+    MotionReport,
+    MouseButton,
+    MouseEvent,
+    MouseState,
+    Point,
+    Rect,
+    Size,
+    WindowInfo,
+    WindowState,
+)
 from .base import Backend
 
 try:
-    from Xlib import XK, X, display
-    from Xlib.ext import randr
+    # Event readers poll their connection on a background thread while callers
+    # send requests on it; python-xlib only locks its connections when this is
+    # imported before the first Display is created.
+    import Xlib.threaded  # noqa: F401
+    from Xlib import XK, X, display, error
+    from Xlib.ext import randr, record
     from Xlib.ext.xtest import fake_input
-    from Xlib.protocol import event
+    from Xlib.protocol import event, request
 except ImportError as e:
     raise ImportError(
         "python-xlib is required for X11 backend. Install with: pip install python-xlib"
     ) from e
 
-
-class X11Backend(Backend):
-    """X11 backend implementation using python-xlib."""
+# Upper bound on the property data read per window while enumerating, in 32-bit units
+_PROPERTY_LENGTH_CAP = 256
+
+# Keysyms for characters that are not typed through their Latin-1 or Unicode keysym
+_CHAR_KEYSYMS = {"\n": XK.XK_Return, "\r": XK.XK_Return, "\t": XK.XK_Tab}
+
+
+def _char_to_keysym(char: str) -> int:
+    """Return the keysym that types ``char``.
+
+    Latin-1 keysyms equal their code point; every other character has a
+    keysym in the Unicode range (0x01000000 + code point).
+    """
+    keysym = _CHAR_KEYSYMS.get(char)
+    if keysym is not None:
+        return keysym
+    code = ord(char)
+    if code < 0x20 or 0x7F <= code < 0xA0:
+        raise ValueError(f"Cannot type control character {char!r}")
+    if code <= 0xFF:
+        return code
+    return 0x01000000 | code
+
+
+def _keysym_to_char(keysym: int) -> str | None:
+    """Return the character a Latin-1 or Unicode keysym produces, if any."""
+    if 0x20 <= keysym <= 0x7E or 0xA0 <= keysym <= 0xFF:
+        return chr(keysym)
+    if keysym & 0xFF000000 == 0x01000000:
+        return chr(keysym & 0x00FFFFFF)
+    return None
+
+
+# Keysym names for Key members whose value is not itself a keysym name, in order of preference
+_KEY_KEYSYM_NAMES: dict[Key, tuple[str, ...]] = {
+    Key.ENTER: ("Return",),
+    Key.RETURN: ("Return",),
+    Key.TAB: ("Tab",),
+    Key.SPACE: ("space",),
+    Key.BACKSPACE: ("BackSpace",),
+    Key.DELETE: ("Delete",),
+    Key.ESC: ("Escape",),
+    Key.ESCAPE: ("Escape",),
+    Key.SHIFT: ("Shift_L",),
+    Key.CTRL: ("Control_L",),
+    Key.CONTROL: ("Control_L",),
+    Key.ALT: ("Alt_L",),
+    Key.OPTION: ("Alt_L",),
+    Key.CMD: ("Super_L",),
+    Key.COMMAND: ("Super_L",),
+    Key.WIN: ("Super_L",),
+    Key.WINDOWS: ("Super_L",),
+    Key.SUPER: ("Super_L",),
+    Key.META: ("Meta_L", "Alt_L"),
+    Key.LEFT: ("Left",),
+    Key.RIGHT: ("Right",),
+    Key.UP: ("Up",),
+    Key.DOWN: ("Down",),
+    Key.HOME: ("Home",),
+    Key.END: ("End",),
+    Key.PAGEUP: ("Page_Up",),
+    Key.PAGEDOWN: ("Page_Down",),
+    Key.CAPSLOCK: ("Caps_Lock",),
+    Key.NUMLOCK: ("Num_Lock",),
+    Key.SCROLLLOCK: ("Scroll_Lock",),
+}
+
+# Candidate keysyms for every Key member; letters, digits and F-keys are named by their value
+_KEY_KEYSYMS: dict[Key, tuple[int, ...]] = {
+    key: tuple(
+        XK.string_to_keysym(name)
+        for name in _KEY_KEYSYM_NAMES.get(
+            key, (key.value.upper() if len(key.value) > 1 else key.value,)
+        )
+    )
+    for key in Key
+}
+
+# Key reported for a keysym by hooks; the first member in Key order wins (ENTER over
+# RETURN), except that the Super key is SUPER, as in the modifiers of key events
+_KEYSYM_KEYS: dict[int, Key] = {
+    **{keysym: key for key, keysyms in reversed(_KEY_KEYSYMS.items()) for keysym in keysyms},
+    XK.XK_Super_L: Key.SUPER,
+}
+
+
+def _keycode_names(display_: Any) -> dict[int, Key | str]:
+    """Name every keycode by its unshifted keysym: a Key member, its character, or the keysym name."""
+    info = display_.display.info
+    first = info.min_keycode
+    mapping = display_.get_keyboard_mapping(first, info.max_keycode - first + 1)
+    names: dict[int, Key | str] = {}
+    for keycode, row in enumerate(mapping, start=first):
+        keysym = row[0] if row else 0
+        if not keysym:
+            continue
+        names[keycode] = (
+            _KEYSYM_KEYS.get(keysym)
+            or _keysym_to_char(keysym)
+            or XK.keysym_to_string(keysym)
+            or str(keycode)
+        )
+    return names
+
+
+# Older spellings accepted as key names
+_KEY_NAME_ALIASES = {
+    "caps_lock": Key.CAPSLOCK,
+    "page_up": Key.PAGEUP,
+    "page_down": Key.PAGEDOWN,
+}
+
+
+def _key_keysyms(key: Key | str) -> tuple[int, ...]:
+    """Candidate keysyms for a Key member, a key name, a character or an X keysym name."""
+    if isinstance(key, Key):
+        return _KEY_KEYSYMS[key]
+    name = key.lower()
+    if name in _KEY_NAME_ALIASES:
+        return _KEY_KEYSYMS[_KEY_NAME_ALIASES[name]]
+    try:
+        return _KEY_KEYSYMS[Key(name)]
+    except ValueError:
+        pass
+    if len(key) == 1:
+        return (_char_to_keysym(key),)
+    keysym = XK.string_to_keysym(key)
+    if not keysym:
+        raise ValueError(f"Unknown key: {key}")
+    return (keysym,)
+
+
+def _x_modifier_mask(modifiers: int) -> int:
+    return sum(x_mask for bit, x_mask in _MODIFIER_X_MASKS.items() if modifiers & bit)
+
+
+def _hotkey_keycode(display_: Any, keysyms: tuple[int, ...]) -> int:
+    """The keycode of the first of ``keysyms`` on the keyboard, or 0."""
+    return next((code for keysym in keysyms if (code := display_.keysym_to_keycode(keysym))), 0)
+
+
+def _lock_mask_variants(display_: Any) -> tuple[int, ...]:
+    """Every combination of CapsLock and the modifier NumLock is mapped to."""
+    num_lock = display_.keysym_to_keycode(XK.XK_Num_Lock)
+    num_mask = 0
+    if num_lock:
+        for index, keycodes in enumerate(display_.get_modifier_mapping()):
+            if num_lock in keycodes:
+                num_mask = 1 << index
+                break
+    return tuple(sorted({0, X.LockMask, num_mask, X.LockMask | num_mask}))
+
+
+def _reply_arrived(req: Any) -> bool:
+    """Whether a deferred python-xlib request has its reply or error.
+
+    python-xlib only exposes a blocking ``reply()``; ``ReplyRequest`` stores
+    the parsed reply in ``_data`` and an X error in ``_error`` once the
+    display has read them, so those attributes are checked directly.
+    """
+    return req._data is not None or req._error is not None
+
+
+# X button numbers for each MouseButton
+_BUTTON_CODES = {
+    MouseButton.LEFT: 1,
+    MouseButton.MIDDLE: 2,
+    MouseButton.RIGHT: 3,
+    MouseButton.X1: 8,
+    MouseButton.X2: 9,
+}
+
+# Buttons the core pointer state mask reports
+_BUTTON_MASKS = {1: X.Button1Mask, 2: X.Button2Mask, 3: X.Button3Mask}
+
+# Row button code (index into MOUSE_EVENT_BUTTONS) for each X button number of
+# recorded events; wheel buttons 4-7 have none
+_BUTTON_ROW_CODES = {
+    code: MOUSE_EVENT_BUTTONS.index(button) for button, code in _BUTTON_CODES.items()
+}
+
+# X modifier mask of each Modifier bit
+_MODIFIER_X_MASKS = {
+    Modifier.SHIFT: X.ShiftMask,
+    Modifier.CTRL: X.ControlMask,
+    Modifier.ALT: X.Mod1Mask,
+    Modifier.SUPER: X.Mod4Mask,
+}
+
+# State bits that tell hotkeys apart; lock modifiers are ignored
+_HOTKEY_STATE_MASK = sum(_MODIFIER_X_MASKS.values())
+
+# Modifier mask for each value of the low byte of an X state mask
+_STATE_MODIFIER_MASKS = tuple(
+    Modifier(sum(bit for bit, x_mask in _MODIFIER_X_MASKS.items() if state & x_mask))
+    for state in range(256)
+)
+
+# The fields of a 32-byte core input event that hooks use: type, detail, time,
+# root_x, root_y and state. Recorded data is in our byte order unless the
+# reply says it is swapped.
+_RECORD_EVENT = struct.Struct("=BB2xI12xhh4xH2x")
+_RECORD_EVENT_SWAPPED = struct.Struct(("<" if sys.byteorder == "big" else ">") + "BB2xI12xhh4xH2x")
+
+# What a full hook ring does with a new event: discard the oldest or the new one
+_DROP_POLICIES = ("oldest", "newest")
+
+# RandR rotation bits to degrees
+_RANDR_ROTATIONS = {
+    randr.Rotate_0: 0,
+    randr.Rotate_90: 90,
+    randr.Rotate_180: 180,
+    randr.Rotate_270: 270,
+}
+
+# Number of windows whose requests are pipelined together by iter_windows()
+_ITER_BATCH_SIZE = 32
+
+# Window properties whose changes are reported by watch_windows()
+_WATCHED_WINDOW_PROPERTIES = frozenset({"_NET_WM_NAME", "WM_NAME", "WM_CLASS", "_NET_WM_STATE"})
+
+
+# Window fields grouped by the X requests that provide them
+_WINDOW_FIELD_GROUPS = {
+    "geometry": ("rect", "client_rect"),
+    "title": ("title",),
+    "class": ("class_name",),
+    "pid": ("pid",),
+    "state": ("state", "is_always_on_top"),
+    "active": ("is_active",),
+}
+
+# Window fields that are known without asking the server
+_WINDOW_FIELD_DEFAULTS = {
+    "title": "",
+    "class_name": "",
+    "pid": 0,
+    "process_name": "",
+    "rect": Rect(0, 0, 0, 0),
+    "client_rect": Rect(0, 0, 0, 0),
+    "state": WindowState.NORMAL,
+    "is_active": False,
+    "is_always_on_top": False,
+    "opacity": 1.0,
+}
+
+
+def _field_default(name: str) -> Any:
+    """A default for a window field; Rects are copied so records never share one."""
+    value = _WINDOW_FIELD_DEFAULTS.get(name)
+    return dataclasses.replace(value) if isinstance(value, Rect) else value
+
+
+def _field_groups(fields: Collection[str]) -> set[str]:
+    unknown = set(fields) - WINDOW_INFO_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown window fields: {', '.join(sorted(unknown))}")
+    return {group for group, names in _WINDOW_FIELD_GROUPS.items() if set(names) & set(fields)}
+
+
+class _LazyWindowBatch:
+    """Windows listed together, whose missing fields are fetched together.
+
+    Touching a missing field on one window fetches that field's group for every
+    window of the batch still lacking it, in one pipelined pass.
+    """
+
+    def __init__(self, backend: X11Backend) -> None:
+        self._backend = backend
+        self._windows: list[LazyWindowInfo] = []
+
+    def add(self, wid: int, **values: Any) -> LazyWindowInfo:
+        values.setdefault("process_name", "")  # Not easily available
+        values.setdefault("opacity", 1.0)
+        info = LazyWindowInfo(wid, self._load, **values)
+        self._windows.append(info)
+        return info
+
+    def _load(self, info: LazyWindowInfo, name: str) -> None:
+        groups = _field_groups([name])
+        targets = [w for w in self._windows if not w.is_loaded(name)]
+        fetched = self._backend._read_window_fields([w.handle for w in targets], groups)
+        for win in targets:
+            values = fetched.get(win.handle, {})
+            for group in groups:
+                for field in _WINDOW_FIELD_GROUPS[group]:
+                    setattr(win, field, values[field] if field in values else _field_default(field))
+        if not info.is_loaded(name):
+            setattr(info, name, _field_default(name))
+
+
+class _X11EventReader:
+    """Background thread dispatching events from a dedicated display connection.
+
+    Event selections and passive grabs made on ``self.display`` are delivered
+    here rather than to the backend's request connection, so waiting for events
+    never blocks input injection or queries.
+    """
 
     def __init__(self) -> None:
-        self._display = display.Display()
-        self._root = self._display.screen().root
-        self._key_code_map = self._build_key_code_map()
-
-    def _build_key_code_map(self) -> dict[str, int]:
-        """Build key name to keycode mapping using XKeysymToKeycode."""
-        key_map = {}
-
-        # Letters
-        for c in "abcdefghijklmnopqrstuvwxyz":
-            keysym = XK.string_to_keysym(c)
-            keycode = self._display.keysym_to_keycode(keysym)
-            if keycode:
-                key_map[c] = keycode
-
-        # Numbers
-        for i in range(10):
-            keysym = XK.string_to_keysym(str(i))
-            keycode = self._display.keysym_to_keycode(keysym)
-            if keycode:
-                key_map[str(i)] = keycode
-
-        # Special keys mapping
-        special_keys = {
-            "enter": "Return",
-            "return": "Return",
-            "tab": "Tab",
-            "space": "space",
-            "backspace": "BackSpace",
-            "delete": "Delete",
-            "esc": "Escape",
-            "escape": "Escape",
-            "shift": "Shift_L",
-            "ctrl": "Control_L",
-            "control": "Control_L",
-            "alt": "Alt_L",
-            "cmd": "Super_L",
-            "command": "Super_L",
-            "super": "Super_L",
-            "caps_lock": "Caps_Lock",
-            "left": "Left",
-            "right": "Right",
-            "up": "Up",
-            "down": "Down",
-            "home": "Home",
-            "end": "End",
-            "page_up": "Page_Up",
-            "page_down": "Page_Down",
-        }
+        self.display = display.Display()
+        self.root = self.display.screen().root
+        # Selections on windows that vanish in the meantime fail harmlessly
+        self.display.set_error_handler(lambda error, request: None)
+        self._handlers: dict[int, list[Callable[[Any], None]]] = {}
+        self._root_mask = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="guiguigui-x11-events", daemon=True)
+        self._thread.start()
+
+    def add_handler(self, event_type: int, handler: Callable[[Any], None]) -> None:
+        with self._lock:
+            self._handlers.setdefault(event_type, []).append(handler)
+
+    def remove_handler(self, event_type: int, handler: Callable[[Any], None]) -> None:
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def select_root_input(self, mask: int) -> None:
+        """Add ``mask`` to the events selected on the root window."""
+        with self._lock:
+            self._root_mask |= mask
+            self.root.change_attributes(event_mask=self._root_mask)
+        self.display.flush()
+
+    def _run(self) -> None:
+        fd = self.display.fileno()
+        while not self._stopped.is_set():
+            try:
+                select.select([fd], [], [], 0.1)
+                while self.display.pending_events():
+                    ev = self.display.next_event()
+                    with self._lock:
+                        handlers = list(self._handlers.get(ev.type, ()))
+                    for handler in handlers:
+                        try:
+                            handler(ev)
+                        except Exception:
+                            # A failing handler must not stop event delivery
+                            pass
+            except (OSError, error.ConnectionClosedError):
+                break
 
-        for key_name, x_key_name in special_keys.items():
-            keysym = XK.string_to_keysym(x_key_name)
-            keycode = self._display.keysym_to_keycode(keysym)
-            if keycode:
-                key_map[key_name] = keycode
+    def close(self) -> None:
+        self._stopped.set()
+        self._thread.join(timeout=1.0)
+        self.display.close()
+
+
+class _EventRing:
+    """Bounded queue of raw events between the record reader and the dispatcher.
+
+    When full, ``policy`` decides whether the oldest queued event or the new
+    one is dropped; either way ``dropped`` counts it.
+    """
+
+    def __init__(self, capacity: int, policy: str) -> None:
+        if policy not in _DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {policy!r}")
+        if capacity <= 0:
+            raise ValueError(f"Ring capacity must be positive, got {capacity}")
+        self._items: deque[tuple[int, ...]] = deque()
+        self._capacity = capacity
+        self._drop_newest = policy == "newest"
+        self._ready = threading.Condition()
+        self._closed = False
+        self.dropped = 0
+        # A lingering drain() is woken early once this many events are queued
+        self.wake_at = 1
+
+    def put(self, item: tuple[int, ...]) -> None:
+        with self._ready:
+            if len(self._items) >= self._capacity:
+                self.dropped += 1
+                if self._drop_newest:
+                    return
+                self._items.popleft()
+            self._items.append(item)
+            if len(self._items) == 1 or len(self._items) >= self.wake_at:
+                self._ready.notify()
+
+    def drain(self, linger: float = 0.0) -> list[tuple[int, ...]] | None:
+        """Wait for events and return all of them, or None once closed.
+
+        With ``linger``, keeps collecting for up to that many seconds after the
+        first event, or until ``wake_at`` events are queued.
+        """
+        with self._ready:
+            while not self._items and not self._closed:
+                self._ready.wait()
+            if linger > 0:
+                deadline = time.monotonic() + linger
+                while len(self._items) < self.wake_at and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._ready.wait(remaining)
+            if not self._items:
+                return None
+            items = list(self._items)
+            self._items.clear()
+            return items
 
-        # Function keys
-        for i in range(1, 13):
-            keysym = XK.string_to_keysym(f"F{i}")
-            keycode = self._display.keysym_to_keycode(keysym)
-            if keycode:
-                key_map[f"f{i}"] = keycode
+    def close(self) -> None:
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
 
-        return key_map
 
-    def _get_key_code(self, key: Key | str) -> int:
-        """Convert Key enum or string to X11 keycode."""
+@dataclasses.dataclass(frozen=True)
+class _BatchHook:
+    callback: Callable[[list[Any]], Any]
+    max_batch: int
+    max_latency: float
+    raw: bool
+
+
+@dataclasses.dataclass(eq=False)
+class _Hotkey:
+    """A hotkey registered with ``hook_hotkey()``; also its hook handle."""
+
+    keysyms: tuple[int, ...]
+    modifiers: int  # X modifier mask
+    callback: Callable[[], Any]
+    keycode: int = 0  # 0 while the key is not on the keyboard
+
+
+# X event types each EventFilter type selects, per hook kind
+_MOUSE_EVENT_TYPES = {"move": X.MotionNotify, "press": X.ButtonPress, "release": X.ButtonRelease}
+_KEY_EVENT_TYPES = {"press": X.KeyPress, "release": X.KeyRelease}
+
+
+def _filter_keycodes(
+    keys: Collection[Key | str], key_names: dict[int, Key | str]
+) -> frozenset[int]:
+    """Keycodes whose hook name is one of ``keys``; Key aliases (RETURN, CMD) count as their key."""
+    names: set[Key | str] = set(keys)
+    for key in keys:
         if isinstance(key, Key):
-            key_str = key.value.lower()
+            alias = _KEYSYM_KEYS.get(_KEY_KEYSYMS[key][0])
+            if alias is not None:
+                names.add(alias)
+    return frozenset(keycode for keycode, name in key_names.items() if name in names)
+
+
+def _record_ranges(types: Collection[int]) -> list[dict[str, Any]]:
+    """RECORD ranges covering exactly the device event ``types``, one per contiguous run."""
+    runs: list[list[int]] = []
+    for event_type in sorted(types):
+        if runs and runs[-1][1] == event_type - 1:
+            runs[-1][1] = event_type
+        else:
+            runs.append([event_type, event_type])
+    return [
+        {
+            "core_requests": (0, 0),
+            "core_replies": (0, 0),
+            "ext_requests": (0, 0, 0, 0),
+            "ext_replies": (0, 0, 0, 0),
+            "delivered_events": (0, 0),
+            "device_events": (first, last),
+            "errors": (0, 0),
+            "client_started": False,
+            "client_died": False,
+        }
+        for first, last in runs
+    ]
+
+
+class _HookFilter:
+    """An EventFilter compiled to X event types, button numbers or keycodes and raw bounds.
+
+    It is checked on the fields of recorded events before any event record is
+    built, and carries the motion sampling state of its hook.
+    """
+
+    __slots__ = ("types", "details", "bounds", "interval", "last_motion")
+
+    def __init__(
+        self, event_filter: EventFilter, keyboard: bool, key_names: dict[int, Key | str]
+    ) -> None:
+        names = _KEY_EVENT_TYPES if keyboard else _MOUSE_EVENT_TYPES
+        self.types = frozenset(code for name, code in names.items() if event_filter.wants(name))
+        # Keycodes of key events or button numbers of button events; None allows all
+        self.details: frozenset[int] | None = None
+        self.bounds: tuple[int, int, int, int] | None = None
+        if keyboard:
+            if event_filter.keys is not None:
+                self.details = _filter_keycodes(event_filter.keys, key_names)
+        else:
+            if event_filter.buttons is not None:
+                self.details = frozenset(_BUTTON_CODES[b] for b in event_filter.buttons)
+            region = event_filter.region
+            if region is not None:
+                self.bounds = (region.left, region.top, region.right, region.bottom)
+        # Server time is in milliseconds
+        self.interval = round(event_filter.motion_interval * 1000)
+        self.last_motion: int | None = None
+
+    def accepts(self, event_type: int, detail: int, server_time: int, x: int, y: int) -> bool:
+        if event_type not in self.types:
+            return False
+        motion = event_type == X.MotionNotify
+        if not motion and self.details is not None and detail not in self.details:
+            return False
+        bounds = self.bounds
+        if bounds is not None and not (bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]):
+            return False
+        if motion and self.interval:
+            last = self.last_motion
+            # Server time wraps around after about 49 days
+            if last is not None and (server_time - last) & 0xFFFFFFFF < self.interval:
+                return False
+            self.last_motion = server_time
+        return True
+
+
+class _X11Recorder:
+    """Global input capture through the RECORD extension.
+
+    Recording blocks the connection it is enabled on, so a data connection is
+    read by its own thread while a control connection creates and disables the
+    context. The context records the event types the first hooks want and is
+    widened in place when later hooks want more, so changing hooks never
+    leaves a gap in recording; types no hook wants any more stay recorded
+    until the last hook goes. The reader drops those, and key and button
+    events whose keycode or button no hook wants. It only unpacks the fields
+    hooks need into tuples and queues them on an ``_EventRing``; a dispatcher
+    thread checks each hook's ``_HookFilter`` on those fields, turns what
+    passes into ``MouseEvent``/``KeyboardEvent`` records and calls the
+    callbacks. Batch hooks get every drained run of mouse events in one call;
+    when they are the only hooks, the dispatcher lingers up to their smallest
+    ``max_latency`` to collect larger runs.
+    """
+
+    def __init__(self, capacity: int, policy: str) -> None:
+        self._ring = _EventRing(capacity, policy)
+        # handle -> (kind, callback or _BatchHook, filter)
+        self._handlers: dict[int, tuple[str, Any, EventFilter | None]] = {}
+        self._hook_filters: dict[int, _HookFilter | None] = {}
+        self._next_handle = 0
+        self._lock = threading.Lock()
+        # Copied on change so the dispatcher can iterate them without a lock
+        self._mouse_hooks: tuple[tuple[Callable[[MouseEvent], Any], _HookFilter | None], ...] = ()
+        self._keyboard_hooks: tuple[
+            tuple[Callable[[KeyboardEvent], Any], _HookFilter | None], ...
+        ] = ()
+        self._mouse_batches: tuple[tuple[_BatchHook, _HookFilter | None], ...] = ()
+        self._linger = 0.0
+        # Keycodes or buttons the reader keeps, for event types where not all are wanted
+        self._details: dict[int, frozenset[int]] = {}
+
+        self._control = display.Display()
+        if not self._control.has_extension("RECORD"):
+            self._control.close()
+            raise BackendCapabilityError("input hooks (RECORD extension)", "X11")
+        _watch_keyboard_mapping()
+        self._keymap_generation = _keymap_generation
+        self._key_names = _keycode_names(self._control)
+        self._data = display.Display()
+        self._record_types: frozenset[int] = frozenset()
+        self._context: int | None = None
+        self._reader: threading.Thread | None = None
+        # Guards handing a new context to the reader thread, which enables each in turn
+        self._reader_lock = threading.Lock()
+        self._context_generation = 0
+        # Set once the server reports that the current context is recording
+        self._recording = threading.Event()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name="guiguigui-x11-hooks", daemon=True
+        )
+        self._dispatcher.start()
+
+    @property
+    def dropped(self) -> int:
+        return self._ring.dropped
+
+    def add(self, kind: str, callback: Any, event_filter: EventFilter | None = None) -> int:
+        """Register a "mouse" or "keyboard" callback, or a "mouse_batch" ``_BatchHook``."""
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._handlers[handle] = (kind, callback, event_filter)
+            self._update_callbacks()
+        return handle
+
+    def remove(self, handle: Any) -> bool:
+        with self._lock:
+            if self._handlers.pop(handle, None) is None:
+                return False
+            self._hook_filters.pop(handle, None)
+            self._update_callbacks()
+        return True
+
+    def __bool__(self) -> bool:
+        return bool(self._handlers)
+
+    def _update_callbacks(self) -> None:
+        mouse: list[tuple[Any, _HookFilter | None]] = []
+        keyboard: list[tuple[Any, _HookFilter | None]] = []
+        batches: list[tuple[_BatchHook, _HookFilter | None]] = []
+        wanted: dict[int, set[int] | None] = {}
+        for handle, (kind, callback, event_filter) in self._handlers.items():
+            if handle not in self._hook_filters:
+                self._hook_filters[handle] = (
+                    None
+                    if event_filter is None
+                    else _HookFilter(event_filter, kind == "keyboard", self._key_names)
+                )
+            hook_filter = self._hook_filters[handle]
+            {"mouse": mouse, "keyboard": keyboard, "mouse_batch": batches}[kind].append(
+                (callback, hook_filter)
+            )
+            if hook_filter is not None:
+                types = hook_filter.types
+            elif kind == "keyboard":
+                types = frozenset(_KEY_EVENT_TYPES.values())
+            else:
+                types = frozenset(_MOUSE_EVENT_TYPES.values())
+            for event_type in types:
+                details = None
+                if hook_filter is not None and event_type != X.MotionNotify:
+                    details = hook_filter.details
+                if details is None:
+                    wanted[event_type] = None
+                elif event_type not in wanted:
+                    wanted[event_type] = set(details)
+                elif (known := wanted[event_type]) is not None:
+                    known |= details
+
+        self._mouse_hooks = tuple(mouse)
+        self._keyboard_hooks = tuple(keyboard)
+        self._mouse_batches = tuple(batches)
+        if batches and not mouse and not keyboard:
+            self._linger = min(hook.max_latency for hook, _ in batches)
+            self._ring.wake_at = min(hook.max_batch for hook, _ in batches)
         else:
-            key_str = str(key).lower()
+            self._linger = 0.0
+            self._ring.wake_at = 1
+        if not wanted:
+            self._stop_recording()
+        elif not self._record_types.issuperset(wanted):
+            self._record(self._record_types.union(wanted))
+        # Recorded types that no hook wants any more are dropped by the reader
+        kept = {t: wanted.get(t, set()) for t in self._record_types}
+        self._details = {t: frozenset(d) for t, d in kept.items() if d is not None}
+
+    def _record(self, types: frozenset[int]) -> None:
+        """Record ``types``, widening the live context if there is one."""
+        if self._context is not None:
+            # Widening the ranges of an enabled context does not interrupt recording
+            self._control.record_register_clients(
+                self._context, 0, [record.AllClients], _record_ranges(types)
+            )
+            self._control.sync()
+            self._record_types = types
+            return
+        context = self._control.record_create_context(0, [record.AllClients], _record_ranges(types))
+        self._control.sync()
+        self._record_types = types
+        self._recording.clear()
+        with self._reader_lock:
+            self._context = context
+            self._context_generation += 1
+            # A reader that outlived the previous context enables this one when it returns
+            if self._reader is None:
+                self._reader = threading.Thread(
+                    target=self._read, name="guiguigui-x11-record", daemon=True
+                )
+                self._reader.start()
+        # Events before StartOfData are not recorded, so a hook is not live until then
+        self._recording.wait(timeout=1.0)
+
+    def _stop_recording(self) -> None:
+        self._record_types = frozenset()
+        if self._context is None:
+            return
+        self._control.record_disable_context(self._context)
+        self._control.sync()
+        reader = self._reader
+        if reader is not None:
+            reader.join(timeout=1.0)
+        self._control.record_free_context(self._context)
+        with self._reader_lock:
+            self._context = None
+
+    def _refresh_keymap(self) -> None:
+        """Rename keycodes and recompile key filters after a keyboard mapping change."""
+        with self._lock:
+            self._keymap_generation = _keymap_generation
+            self._key_names = _keycode_names(self._control)
+            for handle, (kind, _, _) in self._handlers.items():
+                if kind == "keyboard":
+                    self._hook_filters.pop(handle, None)
+            self._update_callbacks()
+
+    def _read(self) -> None:
+        generation = None
+        while True:
+            with self._reader_lock:
+                if self._context is None or self._context_generation == generation:
+                    self._reader = None
+                    return
+                context, generation = self._context, self._context_generation
+            try:
+                # Returns once the context is disabled
+                self._data.record_enable_context(context, self._on_record)
+            except (OSError, error.ConnectionClosedError):
+                with self._reader_lock:
+                    self._reader = None
+                return
+
+    def _on_record(self, reply: Any) -> None:
+        if reply.category != record.FromServer:
+            if reply.category == record.StartOfData:
+                self._recording.set()
+            return
+        data = reply.data
+        unpacker = _RECORD_EVENT_SWAPPED if reply.client_swapped else _RECORD_EVENT
+        put = self._ring.put
+        # Keycode filters are stale after a mapping change until the dispatcher
+        # recompiles them, so keep every key event meanwhile
+        details = self._details if self._keymap_generation == _keymap_generation else {}
+        if not details:
+            for item in unpacker.iter_unpack(data[: len(data) - len(data) % 32]):
+                put(item)
+            return
+        for item in unpacker.iter_unpack(data[: len(data) - len(data) % 32]):
+            wanted = details.get(item[0] & 0x7F)
+            if wanted is None or item[1] in wanted:
+                put(item)
+
+    def _dispatch(self) -> None:
+        while True:
+            items = self._ring.drain(self._linger)
+            if items is None:
+                return
+            if self._keymap_generation != _keymap_generation:
+                try:
+                    self._refresh_keymap()
+                except Exception:
+                    # Keep the old names if the server cannot be reached
+                    pass
+            mouse_hooks = self._mouse_hooks
+            keyboard_hooks = self._keyboard_hooks
+            mouse_batches = self._mouse_batches
+            batches: list[list[Any]] = [[] for _ in mouse_batches]
+            for event_type, detail, server_time, x, y, state in items:
+                event_type &= 0x7F
+                if event_type <= X.KeyRelease:
+                    key_event = None
+                    for on_key, hook_filter in keyboard_hooks:
+                        if hook_filter is not None and not hook_filter.accepts(
+                            event_type, detail, server_time, x, y
+                        ):
+                            continue
+                        if key_event is None:
+                            key_event = KeyboardEvent(
+                                self._key_names.get(detail) or str(detail),
+                                event_type == X.KeyPress,
+                                _STATE_MODIFIER_MASKS[state & 0xFF],
+                                server_time / 1000,
+                            )
+                        self._call(on_key, key_event)
+                    continue
+                if event_type == X.MotionNotify:
+                    code = 0
+                else:
+                    code = _BUTTON_ROW_CODES.get(detail, -1)
+                    if code < 0:
+                        continue
+                pressed = event_type == X.ButtonPress
+                timestamp = server_time / 1000
+                mouse_event = None
+                row = None
+                for on_mouse, hook_filter in mouse_hooks:
+                    if hook_filter is not None and not hook_filter.accepts(
+                        event_type, detail, server_time, x, y
+                    ):
+                        continue
+                    if mouse_event is None:
+                        mouse_event = MouseEvent(
+                            x, y, MOUSE_EVENT_BUTTONS[code], pressed, timestamp
+                        )
+                    self._call(on_mouse, mouse_event)
+                for batch, (hook, hook_filter) in zip(batches, mouse_batches, strict=True):
+                    if hook_filter is not None and not hook_filter.accepts(
+                        event_type, detail, server_time, x, y
+                    ):
+                        continue
+                    if hook.raw:
+                        if row is None:
+                            row = (x, y, code, pressed, timestamp)
+                        batch.append(row)
+                    else:
+                        if mouse_event is None:
+                            mouse_event = MouseEvent(
+                                x, y, MOUSE_EVENT_BUTTONS[code], pressed, timestamp
+                            )
+                        batch.append(mouse_event)
+            for batch, (hook, _) in zip(batches, mouse_batches, strict=True):
+                for start in range(0, len(batch), hook.max_batch):
+                    self._call(hook.callback, batch[start : start + hook.max_batch])
+
+    @staticmethod
+    def _call(callback: Callable[[Any], Any], ev: Any) -> None:
+        try:
+            callback(ev)
+        except Exception:
+            # A failing callback must not stop event delivery
+            pass
+
+    def close(self) -> None:
+        try:
+            with self._lock:
+                self._stop_recording()
+            self._control.close()
+            self._data.close()
+        except Exception:
+            # The server may already be gone
+            pass
+        self._ring.close()
+        # A callback may unhook the last hook from the dispatcher itself
+        if threading.current_thread() is not self._dispatcher:
+            self._dispatcher.join(timeout=1.0)
+
+
+# Bumped on every keyboard MappingNotify; backends rebuild their key tables when it changes
+_keymap_generation = 0
+_keymap_reader: _X11EventReader | None = None
+_keymap_lock = threading.Lock()
+
+
+def _on_mapping_notify(ev: Any) -> None:
+    global _keymap_generation
+    if ev.request != X.MappingPointer:
+        _keymap_generation += 1
+
 
-        keycode = self._key_code_map.get(key_str)
+def _watch_keyboard_mapping() -> None:
+    """Start the process-wide reader that counts MappingNotify events."""
+    global _keymap_reader
+    with _keymap_lock:
+        if _keymap_reader is None:
+            _keymap_reader = _X11EventReader()
+            _keymap_reader.add_handler(X.MappingNotify, _on_mapping_notify)
+
+
+class X11Backend(Backend):
+    """X11 backend implementation using python-xlib."""
+
+    windows_topmost_first = False
+    hook_filters = True
+    # Raw events queued between the record reader and hook callbacks, and what
+    # to drop when callbacks fall that far behind ("oldest" or "newest")
+    hook_buffer_size = 8192
+    hook_drop_policy = "oldest"
+
+    def __init__(self) -> None:
+        self._display = display.Display()
+        self._root = self._display.screen().root
+        # Errors from requests sent without a sync are reported asynchronously
+        # through this handler instead of forcing a round trip per request.
+        self._x_errors: deque[Any] = deque(maxlen=64)
+        self._display.set_error_handler(self._on_x_error)
+        self._batch_depth = 0
+        # perf_counter() and first request serial of the input flushed since the
+        # last acknowledge()
+        self._input_sent_at: float | None = None
+        self._input_sent_serial: int | None = None
+        # Serial of the first request of the input not yet committed; errors
+        # raised by a confirm are limited to the requests from here on
+        self._input_serial: int | None = None
+        self._event_reader: _X11EventReader | None = None
+        self._recorder: _X11Recorder | None = None
+        # Hotkeys and the callbacks of each grabbed (keycode, modifiers) pair;
+        # grabs are repeated for every combination of the lock masks
+        self._hotkeys: list[_Hotkey] = []
+        self._hotkey_grabs: dict[tuple[int, int], tuple[_Hotkey, ...]] = {}
+        self._hotkey_lock = threading.Lock()
+        self._hotkey_lock_masks: tuple[int, ...] = (0,)
+        self._window_watchers: list[Callable[[str, Any], None]] = []
+        self._display_watchers: list[Callable[[], None]] = []
+        self._watched_clients: set[int] | None = None
+        # Key tables are rebuilt from the keyboard mapping after a MappingNotify
+        # (see _keymap_generation)
+        self._keymap_generation = -1
+        self._key_code_map: dict[Key | str, int] = {}
+        # keysym -> (keycode, needs Shift)
+        self._keysym_codes: dict[int, tuple[int, bool]] = {}
+        self._scratch_keycodes: list[int] = []
+        # keysym -> spare keycode it is bound to, least recently used first
+        self._scratch_bindings: OrderedDict[int, int] = OrderedDict()
+        self._scratch_exit_hook = False
+        # Shadow of the pointer and pressed keys and buttons, updated by our own
+        # injections and reconciled with the server once it is older than
+        # input_shadow_ttl seconds.
+        self.input_shadow_ttl = 0.05
+        self._shadow_pointer = Point(0, 0)
+        self._shadow_keys: set[int] = set()
+        self._shadow_buttons: set[int] = set()
+        self._shadow_synced_at = float("-inf")
+        self._load_keyboard_mapping()
+
+    def _load_keyboard_mapping(self) -> None:
+        """Rebuild the key tables from one GetKeyboardMapping request.
+
+        Records the keycode and Shift state producing each keysym on the first
+        two levels, the keycode for every Key member and every character the
+        layout produces, and the keycodes with no keysyms at all, which are
+        used to bind keysyms the layout cannot type.
+        """
+        _watch_keyboard_mapping()
+        generation = _keymap_generation
+        info = self._display.display.info
+        first = info.min_keycode
+        mapping = self._display.get_keyboard_mapping(first, info.max_keycode - first + 1)
+
+        bound = {keycode: keysym for keysym, keycode in self._scratch_bindings.items()}
+        codes: dict[int, tuple[int, bool]] = {}
+        scratch = []
+        for keycode, row in enumerate(mapping, start=first):
+            if keycode in bound:
+                if row and row[0] == bound[keycode]:
+                    scratch.append(keycode)
+                    continue
+                # Another client changed a keycode we had bound
+                del self._scratch_bindings[bound[keycode]]
+            if not any(row):
+                scratch.append(keycode)
+                continue
+            levels = list(row[:2])
+            if len(levels) == 1 or not levels[1]:
+                # A lone lowercase letter implies its uppercase form on level 2
+                lower = levels[0]
+                upper = ord(chr(lower).upper()) if 0x20 <= lower <= 0xFF else lower
+                levels = [lower, upper if upper != lower and upper <= 0xFF else 0]
+            for level, keysym in enumerate(levels):
+                if keysym and keysym not in codes:
+                    codes[keysym] = (keycode, level == 1)
+
+        key_map: dict[Key | str, int] = {}
+        keycode_keys: dict[int, list[Key]] = {}
+        for key, keysyms in _KEY_KEYSYMS.items():
+            code = next((codes[k] for k in keysyms if k in codes), None)
+            if code is not None:
+                key_map[key] = key_map[key.value] = code[0]
+                keycode_keys.setdefault(code[0], []).append(key)
+        for alias, key in _KEY_NAME_ALIASES.items():
+            if key in key_map:
+                key_map[alias] = key_map[key]
+        # Characters map to their key without Shift, as key_press() presses one key
+        for keysym, (keycode, _) in codes.items():
+            char = _keysym_to_char(keysym)
+            if char is not None:
+                key_map.setdefault(char, keycode)
+
+        self._keysym_codes = codes
+        self._key_code_map = key_map
+        self._keycode_keys = keycode_keys
+        self._scratch_keycodes = scratch
+        self._keymap_generation = generation
+
+    def _lookup_key_name(self, name: str) -> int | None:
+        """Resolve a key name missing from the table: other casing or an X keysym name."""
+        keycode = self._key_code_map.get(name.lower())
         if keycode is None:
-            # Try as single character
-            if len(key_str) == 1:
-                keysym = XK.string_to_keysym(key_str)
-                keycode = self._display.keysym_to_keycode(keysym)
+            code = self._keysym_codes.get(XK.string_to_keysym(name))
+            keycode = code[0] if code is not None else None
+        if keycode is not None:
+            self._key_code_map[name] = keycode
+        return keycode
 
+    def _get_key_code(self, key: Key | str) -> int:
+        """Convert Key enum or string to X11 keycode."""
+        if self._keymap_generation != _keymap_generation:
+            self._load_keyboard_mapping()
+        keycode = self._key_code_map.get(key)
+        if keycode is None and isinstance(key, str):
+            keycode = self._lookup_key_name(key)
         if keycode is None:
             raise ValueError(f"Unknown key: {key}")
-
         return keycode
 
     def _get_window_handle(self, window: WindowInfo | int) -> int:
@@ -141,143 +1074,371 @@ class X11Backend(Backend):
             # Ignore AttributeError from malformed error objects (e.g., BadRRModeError)
             pass
 
+    def _on_x_error(self, error: Any, request: Any) -> None:
+        """Collect X errors for requests that have no error handler of their own."""
+        self._x_errors.append(error)
+
+    def drain_errors(self) -> list[Any]:
+        """Return and clear the X errors collected since the last call."""
+        errors = list(self._x_errors)
+        self._x_errors.clear()
+        return errors
+
+    def _take_errors(self, start: int, end: int) -> list[Any]:
+        """Remove and return the collected errors of requests ``start`` up to ``end``.
+
+        Serials are compared modulo 2**16, as the server reports them.
+        """
+        span = (end - start) % 0x10000
+        taken = []
+        for error in self._x_errors:
+            serial = getattr(error, "sequence_number", None)
+            if serial is not None and (serial - start) % 0x10000 < span:
+                taken.append(error)
+        for error in taken:
+            self._x_errors.remove(error)
+        return taken
+
+    def _fake_input(self, event_type: int, **kwargs: Any) -> None:
+        """Queue an XTest event, noting where the uncommitted input starts."""
+        if self._input_serial is None:
+            self._input_serial = self._display.display.request_serial
+        fake_input(self._display, event_type, **kwargs)
+
+    def _commit(self, confirm: bool = False) -> None:
+        """Finish a high-level input operation.
+
+        Queued requests are flushed without waiting for the server, unless a
+        batch is open, in which case they are sent when the batch closes. With
+        ``confirm`` the display is synced once and the first X error raised by
+        the requests of this operation or batch is re-raised. Errors of other
+        requests stay collected for ``drain_errors()``.
+        """
+        if confirm:
+            start, end = self._input_serial, self._display.display.request_serial
+            self._mark_input_sent()
+            self._input_serial = None
+            self._safe_sync()
+            errors = self._take_errors(start, end) if start is not None else []
+            if errors:
+                raise errors[0]
+        elif self._batch_depth == 0:
+            self._mark_input_sent()
+            self._input_serial = None
+            self._safe_flush()
+
+    def _mark_input_sent(self) -> None:
+        if self._input_sent_at is None:
+            self._input_sent_at = time.perf_counter()
+            serial = self._input_serial
+            if serial is None:
+                serial = self._display.display.request_serial
+            self._input_sent_serial = serial
+
+    def acknowledge(self, timeout: float = 1.0) -> float | None:
+        """Wait until the server has processed the input sent so far.
+
+        A GetInputFocus request is queued behind the input and its reply
+        awaited; python-xlib has no timed reply(), so the socket is polled
+        until the reply is read or ``timeout`` expires. Returns the seconds
+        from the first input flushed since the previous call (or from this
+        call, if none was) to the reply, or None on timeout. The first X error
+        raised by the acknowledged requests is re-raised, as with ``confirm``;
+        errors of other requests stay collected for ``drain_errors()``.
+        """
+        start = time.perf_counter()
+        sent_at = self._input_sent_at if self._input_sent_at is not None else start
+        first_serial = self._input_sent_serial
+        marker = request.GetInputFocus(display=self._display.display, defer=True)
+        self._safe_flush()
+        fd = self._display.fileno()
+        deadline = start + timeout
+        while not _reply_arrived(marker):
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                # The next confirm measures from its own input, not this batch's
+                self._input_sent_at = None
+                self._input_sent_serial = None
+                return None
+            select.select([fd], [], [], remaining)
+            try:
+                self._display.pending_events()
+            except AttributeError:
+                # Malformed error objects from extensions, as in _safe_flush()
+                pass
+        latency = time.perf_counter() - sent_at
+        self._input_sent_at = None
+        self._input_sent_serial = None
+        errors = self._take_errors(first_serial, marker._serial) if first_serial is not None else []
+        if errors:
+            raise errors[0]
+        return latency
+
+    @contextmanager
+    def batch(self, confirm: bool = False) -> Iterator[None]:
+        """Queue every input event sent inside the block and flush them once."""
+        if self._batch_depth == 0 and self._input_serial is None:
+            self._input_serial = self._display.display.request_serial
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._commit(confirm)
+
+    def sync(self) -> None:
+        """Round-trip to the server so it has processed the input sent so far.
+
+        Inside a batch nothing has been sent yet, so there is nothing to wait for.
+        """
+        if self._batch_depth == 0:
+            self._safe_sync()
+
+    # Mouse methods
+    def _sync_input_shadow(self) -> None:
+        """Reconcile the input shadow with the server in one round trip.
+
+        QueryPointer and QueryKeymap are sent together; the server answers them
+        after any input still queued ahead of them.
+        """
+        pointer = request.QueryPointer(display=self._display.display, defer=True, window=self._root)
+        keymap = request.QueryKeymap(display=self._display.display, defer=True)
+        pointer.reply()
+        keymap.reply()
+        self._shadow_pointer = Point(pointer.root_x, pointer.root_y)
+        self._shadow_keys = {
+            byte * 8 + bit
+            for byte, bits in enumerate(keymap.map)
+            if bits
+            for bit in range(8)
+            if bits & (1 << bit)
+        }
+        # Buttons beyond 3 have no bit in the pointer mask, so keep what we sent
+        self._shadow_buttons = {b for b, mask in _BUTTON_MASKS.items() if pointer.mask & mask} | {
+            b for b in self._shadow_buttons if b not in _BUTTON_MASKS
+        }
+        self._shadow_synced_at = time.monotonic()
+
+    def _input_shadow(self) -> None:
+        """Bring the input shadow up to date if it is older than input_shadow_ttl."""
+        if time.monotonic() - self._shadow_synced_at >= self.input_shadow_ttl:
+            self._sync_input_shadow()
+
+    def _track_pointer(self, x: int, y: int) -> None:
+        # The server confines the pointer to the screen
+        screen = self._display.screen()
+        self._shadow_pointer = Point(
+            max(0, min(x, screen.width_in_pixels - 1)),
+            max(0, min(y, screen.height_in_pixels - 1)),
+        )
+
+    @staticmethod
+    def _button_code(button: MouseButton) -> int:
+        x_button = _BUTTON_CODES.get(button)
+        if x_button is None:
+            raise ValueError(f"Unsupported button: {button}")
+        return x_button
+
     # Mouse methods
     def mouse_position(self) -> Point:
         """Get current mouse position."""
-        pointer = self._root.query_pointer()
-        return Point(pointer.root_x, pointer.root_y)
+        self._input_shadow()
+        return self._shadow_pointer
+
+    def mouse_state(self) -> MouseState:
+        """Pointer position and pressed buttons from one shadow snapshot."""
+        self._input_shadow()
+        buttons = frozenset(b for b, code in _BUTTON_CODES.items() if code in self._shadow_buttons)
+        return MouseState(self._shadow_pointer, buttons)
 
-    def mouse_move_to(self, x: int, y: int, duration: float = 0.0) -> None:
+    def mouse_move_to(self, x: int, y: int, duration: float = 0.0, confirm: bool = False) -> None:
         """Move mouse to absolute position."""
         if duration > 0:
             start = self.mouse_position()
-            steps = max(10, int(duration * 60))  # 60 FPS
-            for i in range(1, steps + 1):
-                t = i / steps
-                cur_x = int(start.x + (x - start.x) * t)
-                cur_y = int(start.y + (y - start.y) * t)
-                fake_input(self._display, X.MotionNotify, x=cur_x, y=cur_y)
-                self._safe_sync()
-                time.sleep(duration / steps)
-        else:
-            fake_input(self._display, X.MotionNotify, x=x, y=y)
-            self._safe_sync()
-
-    def mouse_move_rel(self, dx: int, dy: int, duration: float = 0.0) -> None:
-        """Move mouse relative to current position."""
-        pos = self.mouse_position()
-        self.mouse_move_to(pos.x + dx, pos.y + dy, duration)
+            steps = max(10, round(duration * 60))
+            points, timestamps = trajectory(start, Point(x, y), duration, steps)
+            self.mouse_move_path(points, timestamps, confirm)
+            return
+        self._fake_input(X.MotionNotify, x=x, y=y)
+        self._track_pointer(x, y)
+        self._commit(confirm)
+
+    def mouse_move_path(
+        self,
+        points: Sequence[tuple[int, int]] | Any,
+        timestamps: Sequence[float] | Any,
+        confirm: bool = False,
+    ) -> MotionReport:
+        """Move the pointer through ``points``, reaching each at ``timestamps`` seconds.
+
+        Each frame is one XTest motion followed by a flush, even inside a
+        batch, since a timed path must reach the server on schedule. The
+        shadow pointer is updated once at the end.
+        """
+        last: tuple[int, int] | None = None
+
+        def send(px: int, py: int) -> None:
+            nonlocal last
+            self._fake_input(X.MotionNotify, x=px, y=py)
+            self._mark_input_sent()
+            self._safe_flush()
+            last = (px, py)
+
+        report = play_path(points, timestamps, send)
+        if last is not None:
+            self._track_pointer(*last)
+        self._commit(confirm)
+        return report
+
+    def mouse_move_rel(
+        self, dx: int, dy: int, duration: float = 0.0, confirm: bool = False
+    ) -> None:
+        """Move mouse relative to current position.
+
+        Without a duration this sends an XTest relative motion, so no pointer
+        query is needed. The server may apply pointer acceleration to it, so the
+        shadow position is reconciled on the next query instead of guessed.
+        """
+        if duration > 0:
+            pos = self.mouse_position()
+            self.mouse_move_to(pos.x + dx, pos.y + dy, duration, confirm)
+            return
+        self._fake_input(X.MotionNotify, detail=True, x=dx, y=dy)
+        self._shadow_synced_at = float("-inf")
+        self._commit(confirm)
 
-    def mouse_press(self, button: MouseButton) -> None:
+    def mouse_press(self, button: MouseButton, confirm: bool = False) -> None:
         """Press mouse button."""
-        button_map = {
-            MouseButton.LEFT: 1,
-            MouseButton.MIDDLE: 2,
-            MouseButton.RIGHT: 3,
-            MouseButton.X1: 8,
-            MouseButton.X2: 9,
-        }
-        x_button = button_map.get(button)
-        if x_button is None:
-            raise ValueError(f"Unsupported button: {button}")
-
-        fake_input(self._display, X.ButtonPress, detail=x_button)
-        self._safe_sync()
+        x_button = self._button_code(button)
+        self._fake_input(X.ButtonPress, detail=x_button)
+        self._shadow_buttons.add(x_button)
+        self._commit(confirm)
 
-    def mouse_release(self, button: MouseButton) -> None:
+    def mouse_release(self, button: MouseButton, confirm: bool = False) -> None:
         """Release mouse button."""
-        button_map = {
-            MouseButton.LEFT: 1,
-            MouseButton.MIDDLE: 2,
-            MouseButton.RIGHT: 3,
-            MouseButton.X1: 8,
-            MouseButton.X2: 9,
-        }
-        x_button = button_map.get(button)
-        if x_button is None:
-            raise ValueError(f"Unsupported button: {button}")
+        x_button = self._button_code(button)
+        self._fake_input(X.ButtonRelease, detail=x_button)
+        self._shadow_buttons.discard(x_button)
+        self._commit(confirm)
 
-        fake_input(self._display, X.ButtonRelease, detail=x_button)
-        self._safe_sync()
-
-    def mouse_scroll(self, dx: int, dy: int) -> None:
+    def mouse_scroll(self, dx: int, dy: int, confirm: bool = False) -> None:
         """Scroll mouse wheel."""
         # X11 scroll: button 4=up, 5=down, 6=left, 7=right
         if dy > 0:
             for _ in range(abs(dy)):
-                fake_input(self._display, X.ButtonPress, detail=4)
-                fake_input(self._display, X.ButtonRelease, detail=4)
+                self._fake_input(X.ButtonPress, detail=4)
+                self._fake_input(X.ButtonRelease, detail=4)
         elif dy < 0:
             for _ in range(abs(dy)):
-                fake_input(self._display, X.ButtonPress, detail=5)
-                fake_input(self._display, X.ButtonRelease, detail=5)
+                self._fake_input(X.ButtonPress, detail=5)
+                self._fake_input(X.ButtonRelease, detail=5)
 
         if dx > 0:
             for _ in range(abs(dx)):
-                fake_input(self._display, X.ButtonPress, detail=7)
-                fake_input(self._display, X.ButtonRelease, detail=7)
+                self._fake_input(X.ButtonPress, detail=7)
+                self._fake_input(X.ButtonRelease, detail=7)
         elif dx < 0:
             for _ in range(abs(dx)):
-                fake_input(self._display, X.ButtonPress, detail=6)
-                fake_input(self._display, X.ButtonRelease, detail=6)
+                self._fake_input(X.ButtonPress, detail=6)
+                self._fake_input(X.ButtonRelease, detail=6)
 
-        self._safe_sync()
+        self._commit(confirm)
 
     def mouse_is_pressed(self, button: MouseButton) -> bool:
         """Check if mouse button is pressed."""
-        pointer = self._root.query_pointer()
-        button_map = {
-            MouseButton.LEFT: X.Button1Mask,
-            MouseButton.MIDDLE: X.Button2Mask,
-            MouseButton.RIGHT: X.Button3Mask,
-            MouseButton.X1: X.Button4Mask,
-            MouseButton.X2: X.Button5Mask,
-        }
-        mask = button_map.get(button)
-        if mask is None:
+        x_button = _BUTTON_CODES.get(button)
+        if x_button is None:
             return False
-        return bool(pointer.mask & mask)
+        self._input_shadow()
+        return x_button in self._shadow_buttons
 
     # Keyboard methods
-    def key_press(self, key: Key | str) -> None:
+    def key_press(self, key: Key | str, confirm: bool = False) -> None:
         """Press key."""
         keycode = self._get_key_code(key)
-        fake_input(self._display, X.KeyPress, detail=keycode)
-        self._safe_flush()
+        self._fake_input(X.KeyPress, detail=keycode)
+        self._shadow_keys.add(keycode)
+        self._commit(confirm)
 
-    def key_release(self, key: Key | str) -> None:
+    def key_release(self, key: Key | str, confirm: bool = False) -> None:
         """Release key."""
         keycode = self._get_key_code(key)
-        fake_input(self._display, X.KeyRelease, detail=keycode)
-        self._safe_flush()
+        self._fake_input(X.KeyRelease, detail=keycode)
+        self._shadow_keys.discard(keycode)
+        self._commit(confirm)
 
     def key_is_pressed(self, key: Key | str) -> bool:
         """Check if key is pressed."""
         keycode = self._get_key_code(key)
-        keyboard = self._display.query_keymap()
-        # keyboard is a list of 32 bytes
-        byte_index = keycode // 8
-        bit_index = keycode % 8
-        if byte_index < len(keyboard):
-            return bool(keyboard[byte_index] & (1 << bit_index))
-        return False
-
-    def key_type_unicode(self, char: str) -> None:
-        """Type Unicode text (character or string)."""
-        # For ASCII strings, type each character
-        if all(ord(c) < 128 for c in char):
-            for c in char:
-                try:
-                    self.key_press(c)
-                    time.sleep(0.01)
-                    self.key_release(c)
-                except ValueError:
-                    # If key not found, skip it
-                    pass
-            return
+        self._input_shadow()
+        return keycode in self._shadow_keys
+
+    def keyboard_state(self, keys: Collection[Key] | None = None) -> KeyboardState:
+        """Pressed keys, among ``keys`` if given, from one shadow snapshot."""
+        self._get_key_code(Key.SHIFT)  # Brings the key tables up to date
+        self._input_shadow()
+        pressed = frozenset(
+            key for keycode in self._shadow_keys for key in self._keycode_keys.get(keycode, ())
+        )
+        return KeyboardState(pressed if keys is None else pressed.intersection(keys))
+
+    def _bind_scratch_keycode(self, keysym: int) -> int:
+        """Bind ``keysym`` to a spare keycode, reusing the least recently used one."""
+        keycode = self._scratch_bindings.get(keysym)
+        if keycode is not None:
+            self._scratch_bindings.move_to_end(keysym)
+            return keycode
+        if not self._scratch_keycodes:
+            raise ValueError(f"No spare keycode to type keysym {keysym:#x}")
+        used = set(self._scratch_bindings.values())
+        keycode = next((k for k in self._scratch_keycodes if k not in used), None)
+        if keycode is None:
+            # Key events queued in this batch may still use the evicted binding;
+            # the server must generate them before the keycode is remapped
+            self._safe_sync()
+            _, keycode = self._scratch_bindings.popitem(last=False)
+        if not self._scratch_exit_hook:
+            atexit.register(self._release_scratch_keycodes)
+            self._scratch_exit_hook = True
+        self._display.change_keyboard_mapping(keycode, [(keysym, keysym)])
+        self._scratch_bindings[keysym] = keycode
+        return keycode
+
+    def _release_scratch_keycodes(self) -> None:
+        """Restore spare keycodes bound by key_type_unicode() to no keysyms."""
+        try:
+            for keycode in self._scratch_bindings.values():
+                self._display.change_keyboard_mapping(keycode, [(X.NoSymbol, X.NoSymbol)])
+            self._scratch_bindings.clear()
+            self._safe_flush()
+        except Exception:
+            # The connection may already be gone at exit
+            pass
 
-        # For Unicode, we need to use XIM or similar
-        raise NotImplementedError("Unicode typing not yet implemented for X11")
+    def key_type_unicode(self, text: str, confirm: bool = False) -> None:
+        """Type text as one pipelined batch of XTest key events.
+
+        Characters are looked up in a table built from the keyboard mapping,
+        pressing Shift where the layout needs it. Characters the layout cannot
+        type are bound to spare keycodes; those bindings stay in place for reuse
+        so clients that re-read the mapping lazily still see the right keysym.
+        """
+        keysyms = [_char_to_keysym(c) for c in text]  # Reject bad input before typing
+        shift = self._get_key_code(Key.SHIFT)  # Also brings the key tables up to date
+        codes = self._keysym_codes
+        shifted = False
+        with self.batch(confirm):
+            for keysym in keysyms:
+                code = codes.get(keysym)
+                keycode, needs_shift = code or (self._bind_scratch_keycode(keysym), False)
+                if needs_shift != shifted:
+                    self._fake_input(X.KeyPress if needs_shift else X.KeyRelease, detail=shift)
+                    shifted = needs_shift
+                self._fake_input(X.KeyPress, detail=keycode)
+                self._fake_input(X.KeyRelease, detail=keycode)
+            if shifted:
+                self._fake_input(X.KeyRelease, detail=shift)
 
     def get_keyboard_layout(self) -> str:
         """Get current keyboard layout."""
@@ -286,72 +1447,157 @@ class X11Backend(Backend):
         return "x11-default"
 
     # Display methods
-    def get_displays(self) -> list[DisplayInfo]:
-        """Get all displays."""
-        displays = []
+    @staticmethod
+    def _mode_refresh_rate(mode: Any) -> float:
+        """Vertical refresh rate of a RandR mode, computed the way xrandr does."""
+        v_total = mode.v_total
+        if mode.flags & randr.DoubleScan:
+            v_total *= 2
+        if mode.flags & randr.Interlace:
+            v_total /= 2
+        if not mode.h_total or not v_total:
+            return 0.0
+        return round(mode.dot_clock / (mode.h_total * v_total), 2)
+
+    def _screen_display_info(self) -> DisplayInfo:
+        """Describe the whole X screen as one display, for servers without RandR outputs."""
+        screen = self._display.screen()
+        bounds = Rect(x=0, y=0, width=screen.width_in_pixels, height=screen.height_in_pixels)
+        return DisplayInfo(
+            id="0",
+            name="default",
+            bounds=bounds,
+            work_area=bounds,
+            scale=1.0,
+            physical_size=Size(width=screen.width_in_mms, height=screen.height_in_mms),
+            refresh_rate=60.0,
+            rotation=0,
+            is_primary=True,
+        )
 
-        # Get RandR screen resources
-        try:
-            screen = self._display.screen()
-            window = screen.root
-            resources = randr.get_screen_resources(window)
-
-            for i, output in enumerate(resources.outputs):
-                output_info = randr.get_output_info(window, output, resources.config_timestamp)
-
-                if output_info.crtc:
-                    crtc_info = randr.get_crtc_info(
-                        window, output_info.crtc, resources.config_timestamp
-                    )
-
-                    name = bytes(output_info.name).decode("utf-8", errors="ignore")
-
-                    bounds = Rect(
-                        x=crtc_info.x, y=crtc_info.y, width=crtc_info.width, height=crtc_info.height
-                    )
-                    # Get physical size in millimeters from output_info
-                    physical_size = Size(width=output_info.mm_width, height=output_info.mm_height)
-                    displays.append(
-                        DisplayInfo(
-                            id=str(i),
-                            name=name,
-                            bounds=bounds,
-                            work_area=bounds,  # X11 doesn't easily expose work area
-                            scale=1.0,  # X11 doesn't directly expose DPI scaling
-                            physical_size=physical_size,
-                            refresh_rate=60.0,  # Default refresh rate
-                            rotation=0,  # No rotation by default
-                            is_primary=(i == 0),  # First output is primary
-                        )
-                    )
-        except Exception:
-            # Fallback to simple screen info
-            screen = self._display.screen()
-            bounds = Rect(x=0, y=0, width=screen.width_in_pixels, height=screen.height_in_pixels)
-            physical_size = Size(width=screen.width_in_mms, height=screen.height_in_mms)
+    def _read_displays(self, resources: Any) -> list[DisplayInfo]:
+        """Build displays from screen resources with two pipelined rounds of requests."""
+        major = self._display.get_extension_major(randr.extname)
+        timestamp = resources.config_timestamp
+        primary_req = randr.GetOutputPrimary(
+            display=self._display.display, defer=True, opcode=major, window=self._root
+        )
+        output_reqs = [
+            randr.GetOutputInfo(
+                display=self._display.display,
+                defer=True,
+                opcode=major,
+                output=output,
+                config_timestamp=timestamp,
+            )
+            for output in resources.outputs
+        ]
+        outputs = [self._read_reply(req) for req in output_reqs]
+        crtc_ids = {info.crtc for info in outputs if info is not None and info.crtc}
+        crtc_reqs = {
+            crtc: randr.GetCrtcInfo(
+                display=self._display.display,
+                defer=True,
+                opcode=major,
+                crtc=crtc,
+                config_timestamp=timestamp,
+            )
+            for crtc in crtc_ids
+        }
+        primary = self._read_reply(primary_req)
+        primary_output = primary.output if primary is not None else 0
+        modes = {mode.id: mode for mode in resources.modes}
+
+        displays = []
+        for i, (output, info) in enumerate(zip(resources.outputs, outputs, strict=True)):
+            if info is None or not info.crtc:
+                continue
+            crtc = self._read_reply(crtc_reqs[info.crtc])
+            if crtc is None or not crtc.mode:
+                continue
+            bounds = Rect(x=crtc.x, y=crtc.y, width=crtc.width, height=crtc.height)
+            mode = modes.get(crtc.mode)
             displays.append(
                 DisplayInfo(
-                    id="0",
-                    name="default",
+                    id=str(i),
+                    name=bytes(info.name).decode("utf-8", errors="ignore"),
                     bounds=bounds,
-                    work_area=bounds,
-                    scale=1.0,
-                    physical_size=physical_size,
-                    refresh_rate=60.0,
-                    rotation=0,
-                    is_primary=True,
+                    work_area=bounds,  # X11 doesn't easily expose work area
+                    scale=1.0,  # X11 doesn't directly expose DPI scaling
+                    physical_size=Size(width=info.mm_width, height=info.mm_height),
+                    refresh_rate=self._mode_refresh_rate(mode) if mode is not None else 60.0,
+                    rotation=_RANDR_ROTATIONS.get(crtc.rotation & 0x0F, 0),
+                    is_primary=output == primary_output,
                 )
             )
-
+        if displays and not any(d.is_primary for d in displays):
+            displays[0] = dataclasses.replace(displays[0], is_primary=True)
         return displays
 
+    def get_displays(self) -> list[DisplayInfo]:
+        """Get all displays.
+
+        Uses RRGetScreenResourcesCurrent, which returns the server's current
+        configuration without re-probing hardware. Call probe_displays() to
+        force a probe.
+        """
+        try:
+            resources = randr.get_screen_resources_current(self._root)
+            if not resources.outputs:
+                # The server has not probed its outputs yet
+                return self.probe_displays()
+            displays = self._read_displays(resources)
+        except Exception:
+            displays = []
+        return displays or [self._screen_display_info()]
+
+    def probe_displays(self) -> list[DisplayInfo]:
+        """Make the X server re-probe outputs, then return the displays.
+
+        RRGetScreenResources polls the hardware, which can take tens to
+        hundreds of milliseconds, so this is only done on request.
+        """
+        try:
+            resources = randr.get_screen_resources(self._root)
+            displays = self._read_displays(resources)
+        except Exception:
+            displays = []
+        return displays or [self._screen_display_info()]
+
     def get_primary_display(self) -> DisplayInfo:
         """Get primary display."""
         displays = self.get_displays()
         for disp in displays:
             if disp.is_primary:
                 return disp
-        return displays[0] if displays else self.get_displays()[0]
+        return displays[0]
+
+    def watch_displays(self, callback: Callable[[], None]) -> Any:
+        """Report RandR screen, CRTC and output changes from the background event reader."""
+        if not self._display_watchers:
+            reader = self._get_event_reader()
+            ext = reader.display.query_extension("RANDR")
+            if ext is None:
+                raise NotImplementedError("Display watching requires the RandR extension")
+            for offset in (randr.RRScreenChangeNotify, randr.RRNotify):
+                reader.add_handler(ext.first_event + offset, self._on_randr_notify)
+            randr.select_input(
+                reader.root,
+                randr.RRScreenChangeNotifyMask
+                | randr.RRCrtcChangeNotifyMask
+                | randr.RROutputChangeNotifyMask,
+            )
+            reader.display.flush()
+        self._display_watchers.append(callback)
+        return callback
+
+    def unwatch_displays(self, watch_handle: Any) -> None:
+        if watch_handle in self._display_watchers:
+            self._display_watchers.remove(watch_handle)
+
+    def _on_randr_notify(self, ev: Any) -> None:
+        for callback in list(self._display_watchers):
+            callback()
 
     def get_virtual_screen_rect(self) -> Rect:
         """Get virtual screen rectangle."""
@@ -367,112 +1613,487 @@ class X11Backend(Backend):
         return Rect(min_x, min_y, max_x - min_x, max_y - min_y)
 
     # Window methods
-    def list_windows(self, visible_only: bool = True) -> list[WindowInfo]:
-        """List all windows."""
-        windows = []
+    def _request_property(self, window_id: int, atom: int, length: int) -> Any:
+        """Send a GetProperty request without waiting for its reply.
 
-        def get_window_info(win: Any) -> WindowInfo | None:
-            try:
-                # Get window attributes
-                attrs = win.get_attributes()
-                if visible_only and attrs.map_state != X.IsViewable:
-                    return None
-
-                # Get geometry
-                geom = win.get_geometry()
+        ``length`` caps the amount of data read, in 32-bit units.
+        """
+        return request.GetProperty(
+            display=self._display.display,
+            defer=True,
+            delete=False,
+            window=window_id,
+            property=atom,
+            type=X.AnyPropertyType,
+            long_offset=0,
+            long_length=length,
+        )
 
-                # Get window title
-                try:
-                    title_prop = win.get_full_property(self._display.intern_atom("_NET_WM_NAME"), 0)
-                    if title_prop:
-                        title = title_prop.value.decode("utf-8", errors="ignore")
-                    else:
-                        title_prop = win.get_full_property(X.XA_WM_NAME, 0)
-                        title = (
-                            title_prop.value.decode("latin1", errors="ignore") if title_prop else ""
-                        )
-                except Exception:
-                    title = ""
+    @staticmethod
+    def _read_reply(req: Any) -> Any:
+        """Wait for a deferred request, returning None if the server rejected it."""
+        try:
+            req.reply()
+        except Exception:
+            # Windows can disappear between sending a request and reading its reply
+            return None
+        return req
+
+    @staticmethod
+    def _property_value(req: Any) -> Any:
+        """Return the value of a deferred GetProperty request, or None if unset."""
+        reply = X11Backend._read_reply(req)
+        if reply is None or not reply.property_type:
+            return None
+        return reply.value[1]
+
+    def _get_client_list(self) -> list[int] | None:
+        """Return managed windows bottom-to-top, or None without an EWMH window manager."""
+        reqs = [
+            self._request_property(self._root.id, self._display.get_atom(name), 1 << 16)
+            for name in ("_NET_CLIENT_LIST_STACKING", "_NET_CLIENT_LIST")
+        ]
+        for req in reqs:
+            value = self._property_value(req)
+            if value is not None:
+                return list(value)
+        return None
 
-                # Get window class
-                try:
-                    class_prop = win.get_full_property(X.XA_WM_CLASS, 0)
-                    class_name = (
-                        class_prop.value.decode("latin1", errors="ignore").split("\x00")[1]
-                        if class_prop
-                        else ""
-                    )
-                except Exception:
-                    class_name = ""
+    def _get_tree_window_ids(self) -> list[int]:
+        """Walk the window tree one level at a time, pipelining each level.
 
-                # Get PID
-                try:
-                    pid_prop = win.get_full_property(self._display.intern_atom("_NET_WM_PID"), 0)
-                    pid = pid_prop.value[0] if pid_prop else 0
-                except Exception:
-                    pid = 0
-
-                rect = Rect(geom.x, geom.y, geom.width, geom.height)
-                return WindowInfo(
-                    handle=win.id,
-                    title=title,
-                    class_name=class_name,
-                    pid=pid,
+        Returns window ids in the same pre-order as a recursive walk.
+        """
+        children: dict[int, list[int]] = {}
+        level = [self._root.id]
+        while level:
+            reqs = [
+                request.QueryTree(display=self._display.display, defer=True, window=wid)
+                for wid in level
+            ]
+            next_level = []
+            for wid, req in zip(level, reqs, strict=True):
+                reply = self._read_reply(req)
+                kids = [child.id for child in reply.children] if reply is not None else []
+                children[wid] = kids
+                next_level.extend(kids)
+            level = next_level
+
+        ids = []
+        stack = [self._root.id]
+        while stack:
+            wid = stack.pop()
+            ids.append(wid)
+            stack.extend(reversed(children.get(wid, [])))
+        return ids
+
+    def _get_active_window_id(self) -> int:
+        """Return the EWMH active window id, or 0 if there is none."""
+        value = self._property_value(
+            self._request_property(self._root.id, self._display.get_atom("_NET_ACTIVE_WINDOW"), 1)
+        )
+        return value[0] if value else 0
+
+    @staticmethod
+    def _decode_class(wm_class: Any) -> str:
+        parts = wm_class.decode("latin1", errors="ignore").split("\x00") if wm_class else []
+        return parts[1] if len(parts) > 1 else ""
+
+    def _decode_state(self, net_wm_state: Any) -> tuple[WindowState, bool]:
+        """Return the window state and always-on-top flag from _NET_WM_STATE."""
+        states = set(net_wm_state) if net_wm_state else set()
+        if self._display.get_atom("_NET_WM_STATE_HIDDEN") in states:
+            state = WindowState.MINIMIZED
+        elif self._display.get_atom("_NET_WM_STATE_FULLSCREEN") in states:
+            state = WindowState.FULLSCREEN
+        elif {
+            self._display.get_atom("_NET_WM_STATE_MAXIMIZED_VERT"),
+            self._display.get_atom("_NET_WM_STATE_MAXIMIZED_HORZ"),
+        } <= states:
+            state = WindowState.MAXIMIZED
+        else:
+            state = WindowState.NORMAL
+        return state, self._display.get_atom("_NET_WM_STATE_ABOVE") in states
+
+    def _request_window_group(self, wid: int, group: str) -> tuple[Any, ...]:
+        """Send the requests needed for one field group of one window."""
+        xdisplay = self._display.display
+        if group == "geometry":
+            return (
+                request.GetGeometry(display=xdisplay, defer=True, drawable=wid),
+                request.TranslateCoords(
+                    display=xdisplay,
+                    defer=True,
+                    src_wid=wid,
+                    dst_wid=self._root.id,
+                    src_x=0,
+                    src_y=0,
+                ),
+            )
+        if group == "title":
+            return (
+                self._request_property(
+                    wid, self._display.get_atom("_NET_WM_NAME"), _PROPERTY_LENGTH_CAP
+                ),
+                self._request_property(wid, X.XA_WM_NAME, _PROPERTY_LENGTH_CAP),
+            )
+        if group == "class":
+            return (self._request_property(wid, X.XA_WM_CLASS, _PROPERTY_LENGTH_CAP),)
+        if group == "pid":
+            return (self._request_property(wid, self._display.get_atom("_NET_WM_PID"), 1),)
+        if group == "state":
+            return (self._request_property(wid, self._display.get_atom("_NET_WM_STATE"), 32),)
+        return ()
+
+    def _read_window_group(self, group: str, reqs: tuple[Any, ...]) -> dict[str, Any] | None:
+        """Decode the replies for one field group, or None if the window is gone."""
+        if group == "geometry":
+            geom = self._read_reply(reqs[0])
+            coords = self._read_reply(reqs[1])
+            if geom is None:
+                return None
+            x, y = (coords.x, coords.y) if coords is not None else (geom.x, geom.y)
+            return {
+                "rect": Rect(x, y, geom.width, geom.height),
+                "client_rect": Rect(x, y, geom.width, geom.height),
+            }
+        if group == "title":
+            net_wm_name, wm_name = (self._property_value(req) for req in reqs)
+            if net_wm_name:
+                return {"title": net_wm_name.decode("utf-8", errors="ignore")}
+            return {"title": wm_name.decode("latin1", errors="ignore") if wm_name else ""}
+        if group == "class":
+            return {"class_name": self._decode_class(self._property_value(reqs[0]))}
+        if group == "pid":
+            value = self._property_value(reqs[0])
+            return {"pid": value[0] if value else 0}
+        if group == "state":
+            state, on_top = self._decode_state(self._property_value(reqs[0]))
+            return {"state": state, "is_always_on_top": on_top}
+        return {}
+
+    def _read_window_fields(
+        self, window_ids: list[int], groups: set[str]
+    ) -> dict[int, dict[str, Any]]:
+        """Fetch field groups for many windows with pipelined requests.
+
+        Every request for every window is sent before any reply is read, so the
+        cost is about one round trip regardless of the number of windows.
+        Windows whose geometry can no longer be read are left out.
+        """
+        ordered = [g for g in _WINDOW_FIELD_GROUPS if g in groups]
+        pending = [
+            (wid, [(group, self._request_window_group(wid, group)) for group in ordered])
+            for wid in window_ids
+        ]
+        active_id = self._get_active_window_id() if "active" in groups else 0
+
+        values: dict[int, dict[str, Any]] = {}
+        for wid, group_reqs in pending:
+            fields: dict[str, Any] = {}
+            for group, reqs in group_reqs:
+                decoded = self._read_window_group(group, reqs)
+                if decoded is None:
+                    break
+                fields.update(decoded)
+            else:
+                if "active" in groups:
+                    fields["is_active"] = wid == active_id
+                values[wid] = fields
+        return values
+
+    def _fetch_window_infos(
+        self,
+        window_ids: list[int],
+        visible_only: bool,
+        fields: Collection[str] | None = None,
+        batch: _LazyWindowBatch | None = None,
+    ) -> list[WindowInfo]:
+        """Build WindowInfo records for many windows with pipelined requests.
+
+        When ``visible_only`` is set the map state is read first, and the
+        remaining requests are only sent for viewable windows. With ``fields``
+        only the groups those fields belong to are fetched now; the records are
+        LazyWindowInfo instances that fetch the other groups on first access,
+        together with the other windows of ``batch``.
+        """
+        xdisplay = self._display.display
+        attr_reqs = [
+            request.GetWindowAttributes(display=xdisplay, defer=True, window=wid)
+            for wid in window_ids
+        ]
+        groups = set(_WINDOW_FIELD_GROUPS) if fields is None else _field_groups(fields)
+        if not visible_only:
+            # Nothing to filter on, so send everything before reading any reply
+            pending = self._read_window_fields(window_ids, groups)
+        visible = {}
+        for wid, req in zip(window_ids, attr_reqs, strict=True):
+            attrs = self._read_reply(req)
+            if attrs is not None and (attrs.map_state == X.IsViewable or not visible_only):
+                visible[wid] = attrs.map_state == X.IsViewable
+        if visible_only:
+            pending = self._read_window_fields(list(visible), groups)
+
+        if fields is None:
+            return [
+                WindowInfo(
+                    handle=wid,
                     process_name="",  # Not easily available
-                    rect=rect,
-                    client_rect=rect,  # Use same rect for simplicity
-                    state=WindowState.NORMAL,  # TODO: detect state properly
-                    is_visible=attrs.map_state == X.IsViewable,
-                    is_active=False,  # Will be determined by caller
-                    is_always_on_top=False,  # Not easily detectable
+                    is_visible=visible[wid],
                     opacity=1.0,  # Default opacity
                     display=None,
+                    **values,
                 )
-            except Exception:
-                return None
-
-        # Iterate through all windows
-        def traverse(win: Any) -> None:
-            info = get_window_info(win)
-            if info:
-                windows.append(info)
-            try:
-                children = win.query_tree().children
-                for child in children:
-                    traverse(child)
-            except Exception:
-                pass
+                for wid, values in pending.items()
+                if wid in visible
+            ]
+
+        if batch is None:
+            batch = _LazyWindowBatch(self)
+        return [
+            batch.add(wid, is_visible=visible[wid], **values)
+            for wid, values in pending.items()
+            if wid in visible
+        ]
+
+    def _get_window_ids(self) -> list[int]:
+        """Return the windows to enumerate.
+
+        Uses the EWMH client list when a window manager provides one, and only
+        falls back to walking the whole window tree when it does not.
+        """
+        window_ids = self._get_client_list()
+        if window_ids is None:
+            window_ids = self._get_tree_window_ids()
+        return window_ids
+
+    def _prefilter_window_ids(
+        self, window_ids: list[int], pid: int | None, class_name: str | None
+    ) -> list[int]:
+        """Drop windows whose pid or class cannot match, reading only those properties."""
+        atom_pid = self._display.get_atom("_NET_WM_PID")
+        pending = [
+            (
+                wid,
+                self._request_property(wid, atom_pid, 1) if pid is not None else None,
+                self._request_property(wid, X.XA_WM_CLASS, _PROPERTY_LENGTH_CAP)
+                if class_name
+                else None,
+            )
+            for wid in window_ids
+        ]
+        needle = class_name.lower() if class_name else ""
+        matched = []
+        for wid, pid_req, class_req in pending:
+            if pid_req is not None:
+                value = self._property_value(pid_req)
+                if (value[0] if value else 0) != pid:
+                    continue
+            if class_req is not None:
+                value = self._property_value(class_req)
+                if needle not in self._decode_class(value).lower():
+                    continue
+            matched.append(wid)
+        return matched
 
-        traverse(self._root)
-        return windows
+    def list_windows(self, visible_only: bool = True) -> list[WindowInfo]:
+        """List all windows."""
+        return self._fetch_window_infos(self._get_window_ids(), visible_only)
+
+    def iter_windows(
+        self,
+        visible_only: bool = True,
+        pid: int | None = None,
+        class_name: str | None = None,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[WindowInfo]:
+        """Yield windows in pipelined batches, filtering on pid and class first."""
+        if fields is not None:
+            _field_groups(fields)  # Reject unknown field names before sending anything
+        window_ids = self._get_window_ids()
+        if pid is not None or class_name:
+            window_ids = self._prefilter_window_ids(window_ids, pid, class_name)
+        lazy_batch = _LazyWindowBatch(self) if fields is not None else None
+        for start in range(0, len(window_ids), _ITER_BATCH_SIZE):
+            chunk = window_ids[start : start + _ITER_BATCH_SIZE]
+            yield from self._fetch_window_infos(chunk, visible_only, fields, lazy_batch)
 
     def get_active_window(self) -> WindowInfo | None:
         """Get active window."""
-        try:
-            atom = self._display.intern_atom("_NET_ACTIVE_WINDOW")
-            prop = self._root.get_full_property(atom, X.AnyPropertyType)
-            if prop:
-                win_id = prop.value[0]
-                windows = self.list_windows(visible_only=False)
-                for w in windows:
-                    if w.handle == win_id:
-                        return w
-        except Exception:
-            pass
+        active_id = self._get_active_window_id()
+        if not active_id:
+            return None
+        return self.get_window_info(active_id)
+
+    def get_window_info(self, handle: Any) -> WindowInfo | None:
+        """Get information for a single window without enumerating the others."""
+        windows = self._fetch_window_infos([self._get_window_handle(handle)], visible_only=False)
+        return windows[0] if windows else None
+
+    def _get_event_reader(self) -> _X11EventReader:
+        if self._event_reader is None:
+            self._event_reader = _X11EventReader()
+        return self._event_reader
+
+    def watch_windows(self, callback: Callable[[str, Any], None]) -> Any:
+        """Report window changes from the background event reader.
+
+        Top-level membership follows the EWMH client list when a window
+        manager publishes one, and CreateNotify/DestroyNotify on the root
+        window otherwise. Each tracked window is watched for geometry, mapping
+        and title, class and state property changes. A change to
+        _NET_CLIENT_LIST_STACKING is reported as ``"restacked"``.
+        """
+        self._window_watchers.append(callback)
+        if self._watched_clients is not None:
+            return callback
+
+        reader = self._get_event_reader()
+        self._watched_clients = set()
+        client_list = self._read_client_list(reader)
+        for wid in client_list or []:
+            self._watch_client(reader, wid)
+
+        reader.add_handler(X.PropertyNotify, self._on_property_notify)
+        reader.add_handler(X.ConfigureNotify, self._on_structure_notify)
+        reader.add_handler(X.MapNotify, self._on_structure_notify)
+        reader.add_handler(X.UnmapNotify, self._on_structure_notify)
+        reader.add_handler(X.DestroyNotify, self._on_destroy_notify)
+        if client_list is None:
+            reader.add_handler(X.CreateNotify, self._on_create_notify)
+        reader.select_root_input(X.SubstructureNotifyMask | X.PropertyChangeMask)
+        return callback
+
+    def unwatch_windows(self, watch_handle: Any) -> None:
+        if watch_handle in self._window_watchers:
+            self._window_watchers.remove(watch_handle)
+
+    def _emit_window_event(self, kind: str, wid: int) -> None:
+        for callback in list(self._window_watchers):
+            callback(kind, wid)
+
+    def _read_client_list(self, reader: _X11EventReader) -> list[int] | None:
+        for name in ("_NET_CLIENT_LIST_STACKING", "_NET_CLIENT_LIST"):
+            prop = reader.root.get_full_property(reader.display.get_atom(name), X.AnyPropertyType)
+            if prop is not None:
+                return list(prop.value)
         return None
 
+    def _watch_client(self, reader: _X11EventReader, wid: int) -> None:
+        assert self._watched_clients is not None
+        self._watched_clients.add(wid)
+        win = reader.display.create_resource_object("window", wid)
+        win.change_attributes(event_mask=X.PropertyChangeMask | X.StructureNotifyMask)
+        reader.display.flush()
+
+    def _on_property_notify(self, ev: Any) -> None:
+        reader = self._get_event_reader()
+        wid = ev.window.id
+        if wid == reader.root.id:
+            if ev.atom == reader.display.get_atom("_NET_ACTIVE_WINDOW"):
+                prop = reader.root.get_full_property(ev.atom, X.AnyPropertyType)
+                self._emit_window_event("active", prop.value[0] if prop and prop.value else 0)
+            elif ev.atom == reader.display.get_atom("_NET_CLIENT_LIST_STACKING"):
+                self._on_client_list_change(reader)
+                self._emit_window_event("restacked", 0)
+            elif ev.atom == reader.display.get_atom("_NET_CLIENT_LIST"):
+                self._on_client_list_change(reader)
+        elif wid in (self._watched_clients or ()) and ev.atom in {
+            reader.display.get_atom(name) for name in _WATCHED_WINDOW_PROPERTIES
+        }:
+            self._emit_window_event("changed", wid)
+
+    def _on_client_list_change(self, reader: _X11EventReader) -> None:
+        assert self._watched_clients is not None
+        current = set(self._read_client_list(reader) or [])
+        for wid in self._watched_clients - current:
+            self._watched_clients.discard(wid)
+            self._emit_window_event("destroyed", wid)
+        for wid in current - self._watched_clients:
+            self._watch_client(reader, wid)
+            self._emit_window_event("created", wid)
+
+    def _on_structure_notify(self, ev: Any) -> None:
+        if ev.window.id in (self._watched_clients or ()):
+            self._emit_window_event("changed", ev.window.id)
+
+    def _on_create_notify(self, ev: Any) -> None:
+        reader = self._get_event_reader()
+        if ev.parent.id == reader.root.id:
+            self._watch_client(reader, ev.window.id)
+            self._emit_window_event("created", ev.window.id)
+
+    def _on_destroy_notify(self, ev: Any) -> None:
+        if self._watched_clients is not None and ev.window.id in self._watched_clients:
+            self._watched_clients.discard(ev.window.id)
+            self._emit_window_event("destroyed", ev.window.id)
+
+    def _get_toplevel_window_ids(self) -> list[int]:
+        """Return top-level windows bottom-to-top: the client list, else the root's children."""
+        window_ids = self._get_client_list()
+        if window_ids is None:
+            tree = self._root.query_tree()
+            window_ids = [child.id for child in tree.children]
+        return window_ids
+
+    def window_stacking(self) -> list[Any]:
+        """Return top-level window ids topmost first, from one client list read."""
+        return self._get_toplevel_window_ids()[::-1]
+
     def get_window_at(self, x: int, y: int) -> WindowInfo | None:
-        """Get window at position."""
-        # Query pointer to get window at position
-        pointer = self._root.query_pointer()
-        child = pointer.child
-        if child:
-            windows = self.list_windows(visible_only=False)
-            for w in windows:
-                if w.handle == child.id:
-                    return w
+        """Get the topmost visible top-level window containing the point.
+
+        The server hit-tests the root's mapped children (TranslateCoordinates),
+        so only the window found is read. A window manager frame is resolved
+        to the managed client inside it; if none is found, for example under
+        an override-redirect popup, the visible top-level windows are scanned.
+        """
+        reply = self._root.translate_coords(self._root, x, y)
+        child = getattr(reply.child, "id", reply.child)
+        if not child:
+            return None
+        clients = self._get_client_list()
+        wid = child if clients is None else self._find_client(child, set(clients))
+        if wid is not None:
+            infos = self._fetch_window_infos([wid], visible_only=True)
+            if infos:
+                return infos[0]
+        windows = self._fetch_window_infos(self._get_toplevel_window_ids(), visible_only=True)
+        point = Point(x, y)
+        for win in reversed(windows):
+            if win.rect.contains(point):
+                return win
+        return None
+
+    def _find_client(self, wid: int, clients: set[int]) -> int | None:
+        """Return the managed client at or below ``wid``, searching its frame level by level."""
+        level = [wid]
+        for _ in range(4):
+            for candidate in level:
+                if candidate in clients:
+                    return candidate
+            reqs = [
+                request.QueryTree(display=self._display.display, defer=True, window=candidate)
+                for candidate in level
+            ]
+            level = []
+            for req in reqs:
+                reply = self._read_reply(req)
+                if reply is not None:
+                    level.extend(child.id for child in reply.children)
+            if not level:
+                break
         return None
 
+    def get_windows_at(self, points: Sequence[Point | tuple[int, int]]) -> list[WindowInfo | None]:
+        """Hit-test many points against one snapshot of the top-level windows.
+
+        Each call reads a fresh snapshot; ``Window.enable_live_index()`` keeps
+        the grid across calls and updates it from window events.
+        """
+        windows = self._fetch_window_infos(self._get_toplevel_window_ids(), visible_only=True)
+        return WindowGrid(windows, topmost_first=False).at_points(points)
+
     def focus_window(self, window: WindowInfo | int) -> None:
         """Focus window."""
         handle = self._get_window_handle(window)
@@ -754,6 +2375,24 @@ class X11Backend(Backend):
         event_obj.requestor.send_event(selection_notify)
         self._safe_sync()
 
+    def clipboard_wait_consumed(self, timeout: float = 2.0) -> bool:
+        """Serve clipboard SelectionRequests until one of them reads the text."""
+        atom_utf8 = self._display.get_atom("UTF8_STRING")
+        atom_string = self._display.get_atom("STRING")
+        deadline = time.monotonic() + timeout
+        fd = self._display.fileno()
+        while True:
+            while self._display.pending_events():
+                event_obj = self._display.next_event()
+                if event_obj.type == X.SelectionRequest:
+                    self._handle_selection_request(event_obj)
+                    if event_obj.target in (atom_utf8, atom_string):
+                        return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            select.select([fd], [], [], remaining)
+
     def clipboard_clear(self) -> None:
         """Clear clipboard."""
         self.clipboard_set_text("")
@@ -766,6 +2405,180 @@ class X11Backend(Backend):
         except Exception:
             return False
 
+    def hook_mouse(
+        self, callback: Callable[[MouseEvent], bool], event_filter: EventFilter | None = None
+    ) -> Any:
+        """Call ``callback`` for every pointer motion and button event on the display.
+
+        Events are captured with the RECORD extension, so they are observed
+        but cannot be suppressed and the callback's return value is ignored.
+        Wheel buttons are not reported. ``event_filter`` narrows the recorded
+        event types and is checked before events are decoded.
+        """
+        return self._get_recorder().add("mouse", callback, event_filter)
+
+    def hook_keyboard(
+        self, callback: Callable[[KeyboardEvent], bool], event_filter: EventFilter | None = None
+    ) -> Any:
+        """Call ``callback`` for every key press and release on the display.
+
+        See ``hook_mouse()``. Keys are named by the keysym of their keycode
+        without modifiers, as a Key member where one matches. Keys of
+        ``event_filter`` are resolved to keycodes, so other keys are dropped
+        by the record reader.
+        """
+        return self._get_recorder().add("keyboard", callback, event_filter)
+
+    def hook_mouse_batch(
+        self,
+        callback: Callable[[list[Any]], Any],
+        max_batch: int = 256,
+        max_latency: float = 0.01,
+        raw: bool = False,
+        event_filter: EventFilter | None = None,
+    ) -> Any:
+        """Deliver recorded mouse events in lists, one call per dispatcher wakeup.
+
+        See ``Backend.hook_mouse_batch()``. While only batch hooks are
+        installed, events are collected for up to ``max_latency`` seconds or
+        ``max_batch`` events before a wakeup.
+        """
+        if max_batch <= 0:
+            raise ValueError(f"max_batch must be positive, got {max_batch}")
+        hook = _BatchHook(callback, max_batch, max(max_latency, 0.0), raw)
+        return self._get_recorder().add("mouse_batch", hook, event_filter)
+
+    def hook_hotkey(self, key: Key | str, modifiers: Modifier, callback: Callable[[], Any]) -> Any:
+        """Call ``callback()`` from the event reader thread when the hotkey is pressed.
+
+        The hotkey is a passive grab of ``key`` on the root window, repeated
+        for each NumLock/CapsLock combination, so the server only sends the
+        reader the hotkey's own presses and the focused window does not see
+        them. Grabs follow the key when the keyboard mapping changes. Raises
+        GuiGuiGuiError if another client has grabbed the same hotkey.
+        """
+        hotkey = _Hotkey(_key_keysyms(key), _x_modifier_mask(modifiers), callback)
+        # Grabs are sent from this thread on the reader's connection, which
+        # Xlib.threaded locks against the reader thread reading events
+        reader = self._get_event_reader()
+        with self._hotkey_lock:
+            if not self._hotkeys:
+                self._hotkey_lock_masks = _lock_mask_variants(reader.display)
+                reader.add_handler(X.KeyPress, self._on_hotkey_press)
+                reader.add_handler(X.MappingNotify, self._on_hotkey_mapping)
+            hotkey.keycode = _hotkey_keycode(reader.display, hotkey.keysyms)
+            if not hotkey.keycode:
+                if not self._hotkeys:
+                    self._remove_hotkey_handlers(reader)
+                raise ValueError(f"Key {key!r} is not on the keyboard")
+            try:
+                self._grab_hotkey(reader, hotkey)
+            except GuiGuiGuiError:
+                if not self._hotkeys:
+                    self._remove_hotkey_handlers(reader)
+                raise
+            self._hotkeys.append(hotkey)
+        return hotkey
+
+    def _grab_hotkey(self, reader: _X11EventReader, hotkey: _Hotkey) -> None:
+        combo = (hotkey.keycode, hotkey.modifiers)
+        registered = self._hotkey_grabs.get(combo)
+        if registered is None:
+            catch = error.CatchError(error.BadAccess)
+            for lock_mask in self._hotkey_lock_masks:
+                reader.root.grab_key(
+                    hotkey.keycode,
+                    hotkey.modifiers | lock_mask,
+                    True,
+                    X.GrabModeAsync,
+                    X.GrabModeAsync,
+                    onerror=catch,
+                )
+            reader.display.sync()
+            if catch.get_error() is not None:
+                self._ungrab_key(reader, combo)
+                raise GuiGuiGuiError("Hotkey is already grabbed by another client")
+            registered = ()
+        self._hotkey_grabs[combo] = (*registered, hotkey)
+
+    def _release_hotkey(self, reader: _X11EventReader, hotkey: _Hotkey) -> None:
+        combo = (hotkey.keycode, hotkey.modifiers)
+        registered = tuple(h for h in self._hotkey_grabs.get(combo, ()) if h is not hotkey)
+        if registered:
+            self._hotkey_grabs[combo] = registered
+        elif self._hotkey_grabs.pop(combo, None) is not None:
+            self._ungrab_key(reader, combo)
+            reader.display.flush()
+
+    def _ungrab_key(self, reader: _X11EventReader, combo: tuple[int, int]) -> None:
+        for lock_mask in self._hotkey_lock_masks:
+            reader.root.ungrab_key(combo[0], combo[1] | lock_mask)
+
+    def _unhook_hotkey(self, hotkey: _Hotkey) -> None:
+        reader = self._get_event_reader()
+        with self._hotkey_lock:
+            if hotkey not in self._hotkeys:
+                return
+            self._hotkeys.remove(hotkey)
+            self._release_hotkey(reader, hotkey)
+            if not self._hotkeys:
+                self._remove_hotkey_handlers(reader)
+
+    def _remove_hotkey_handlers(self, reader: _X11EventReader) -> None:
+        reader.remove_handler(X.KeyPress, self._on_hotkey_press)
+        reader.remove_handler(X.MappingNotify, self._on_hotkey_mapping)
+
+    def _on_hotkey_press(self, ev: Any) -> None:
+        for hotkey in self._hotkey_grabs.get((ev.detail, ev.state & _HOTKEY_STATE_MASK), ()):
+            try:
+                hotkey.callback()
+            except Exception:
+                # A failing callback must not stop the other hotkeys
+                pass
+
+    def _on_hotkey_mapping(self, ev: Any) -> None:
+        """Move the grabs to the keycodes and NumLock mask of the new mapping."""
+        if ev.request == X.MappingPointer:
+            return
+        reader = self._get_event_reader()
+        reader.display.refresh_keyboard_mapping(ev)
+        with self._hotkey_lock:
+            for combo in self._hotkey_grabs:
+                self._ungrab_key(reader, combo)
+            self._hotkey_grabs.clear()
+            self._hotkey_lock_masks = _lock_mask_variants(reader.display)
+            for hotkey in self._hotkeys:
+                hotkey.keycode = _hotkey_keycode(reader.display, hotkey.keysyms)
+                if hotkey.keycode:
+                    try:
+                        self._grab_hotkey(reader, hotkey)
+                    except GuiGuiGuiError:
+                        # Another client took the combination meanwhile
+                        hotkey.keycode = 0
+            reader.display.flush()
+
+    def unhook(self, hook_handle: Any) -> None:
+        """Remove a hook or hotkey; recording stops with the last hook."""
+        if isinstance(hook_handle, _Hotkey):
+            self._unhook_hotkey(hook_handle)
+            return
+        recorder = self._recorder
+        if recorder is None or not recorder.remove(hook_handle):
+            return
+        if not recorder:
+            self._recorder = None
+            recorder.close()
+
+    @property
+    def hook_events_dropped(self) -> int:
+        """Events dropped because hook callbacks fell ``hook_buffer_size`` events behind."""
+        return self._recorder.dropped if self._recorder is not None else 0
+
+    def _get_recorder(self) -> _X11Recorder:
+        if self._recorder is None:
+            self._recorder = _X11Recorder(self.hook_buffer_size, self.hook_drop_policy)
+        return self._recorder
+
     # Permission check
     def check_permissions(self) -> dict[str, bool]:
         """Check permissions."""
@@ -9,6 +9,7 @@ from .errors import (
     WindowNotFoundError,
 )
 from .events import events
+from .hotkeys import KeyBindings
 from .keyboard import keyboard
 from .macro import (
     Action,
@@ -24,25 +25,35 @@ from .macro import (
     MouseClick,
     MouseDrag,
     MouseMove,
+    MousePath,
     MouseScroll,
     Repeat,
     Wait,
     macro,
 )
 from .mouse import mouse
+from .timing import timing
 from .types import (
     DisplayInfo,
+    EventFilter,
     Key,
     KeyboardEvent,
+    KeyboardState,
+    LazyWindowInfo,
+    Modifier,
+    MotionReport,
     MouseButton,
     MouseEvent,
+    MouseState,
+    PathReport,
     Point,
     Rect,
     Size,
+    TimingProfile,
     WindowInfo,
     WindowState,
 )
-from .window import window
+from .window import WindowIndex, window
 
 __all__ = [
     "Point",
@@ -53,8 +64,17 @@ __all__ = [
     "Key",
     "DisplayInfo",
     "WindowInfo",
+    "LazyWindowInfo",
     "MouseEvent",
     "KeyboardEvent",
+    "Modifier",
+    "EventFilter",
+    "KeyBindings",
+    "MouseState",
+    "KeyboardState",
+    "MotionReport",
+    "PathReport",
+    "TimingProfile",
     "GuiGuiGuiError",
     "BackendNotAvailableError",
     "PermissionDeniedError",
@@ -65,13 +85,16 @@ __all__ = [
     "keyboard",
     "display",
     "window",
+    "WindowIndex",
     "clipboard",
     "events",
+    "timing",
     "Macro",
     "macro",
     "Action",
     "MacroContext",
     "MouseMove",
+    "MousePath",
     "MouseClick",
     "MouseDrag",
     "MouseScroll",
@@ -1,15 +1,198 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
 from ..backend import get_backend
+from ..backend.base import Backend
 from .types import DisplayInfo, Point, Rect
 
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    # NumPy is optional; batch conversion falls back to pure Python
+    _HAS_NUMPY = False
+
+
+class _DisplayTransforms:
+    """Per-display bounds and scale factors for converting between coordinate spaces.
+
+    ``displays`` must be non-empty. Points outside every display use the
+    primary display, as to_physical() and from_physical() do.
+    """
+
+    def __init__(self, displays: list[DisplayInfo]):
+        self.displays = displays
+        self.origins = [(d.bounds.x, d.bounds.y) for d in displays]
+        self.scales = [d.scale for d in displays]
+        # Inclusive (left, top, right, bottom) in logical and physical space
+        self.logical_boxes = [
+            (d.bounds.x, d.bounds.y, d.bounds.x + d.bounds.width, d.bounds.y + d.bounds.height)
+            for d in displays
+        ]
+        self.physical_boxes = [
+            (
+                d.bounds.x,
+                d.bounds.y,
+                d.bounds.x + int(d.bounds.width * d.scale),
+                d.bounds.y + int(d.bounds.height * d.scale),
+            )
+            for d in displays
+        ]
+        self.fallback = next((i for i, d in enumerate(displays) if d.is_primary), 0)
+
+    def locate(self, x: int, y: int, physical: bool) -> int:
+        boxes = self.physical_boxes if physical else self.logical_boxes
+        for i, (left, top, right, bottom) in enumerate(boxes):
+            if left <= x <= right and top <= y <= bottom:
+                return i
+        return self.fallback
+
+    def convert(self, points: Any, physical: bool) -> Any:
+        """Convert from physical to logical space if ``physical``, else the other way."""
+        if _HAS_NUMPY and isinstance(points, np.ndarray):
+            return self._convert_array(points, physical)
+
+        result = []
+        for p in points:
+            x, y = (p.x, p.y) if isinstance(p, Point) else p
+            i = self.locate(x, y, physical)
+            ox, oy = self.origins[i]
+            scale = self.scales[i]
+            if physical:
+                result.append(Point(ox + int((x - ox) / scale), oy + int((y - oy) / scale)))
+            else:
+                result.append(Point(ox + int((x - ox) * scale), oy + int((y - oy) * scale)))
+        return result
+
+    def _convert_array(self, points: Any, physical: bool) -> Any:
+        x = points[:, 0]
+        y = points[:, 1]
+        index = np.full(len(points), self.fallback)
+        unassigned = np.ones(len(points), dtype=bool)
+        for i, (left, top, right, bottom) in enumerate(
+            self.physical_boxes if physical else self.logical_boxes
+        ):
+            hit = unassigned & (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+            index[hit] = i
+            unassigned &= ~hit
+
+        origins = np.asarray(self.origins)[index]
+        scales = np.asarray(self.scales)[index][:, None]
+        rel = points - origins
+        rel = rel / scales if physical else rel * scales
+        # np.trunc rounds toward zero, like int()
+        return (origins + np.trunc(rel)).astype(np.int64)
+
+
+@dataclass
+class DisplayCacheStats:
+    live: bool
+    displays: int
+    hits: int
+    misses: int
+    invalidations: int
+
 
 class Display:
-    def __init__(self):
-        self._backend = get_backend()
+    """Display queries served from a cached topology.
+
+    The topology is read from the backend once and reused until the backend
+    reports a layout change. Backends that cannot report changes re-read it
+    once the cache is older than ``ttl`` seconds. ``backend`` defaults to
+    the current backend.
+    """
+
+    def __init__(self, ttl: float = 1.0, backend: Backend | None = None):
+        self._backend = backend if backend is not None else get_backend()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._displays: list[DisplayInfo] | None = None
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._watch: Any = None
+        self._watch_started = False
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._transform_cache: _DisplayTransforms | None = None
+
+    def _topology(self) -> list[DisplayInfo]:
+        with self._lock:
+            displays = self._displays
+            if displays is not None and (
+                self._watch is not None or time.monotonic() - self._loaded_at < self.ttl
+            ):
+                self._hits += 1
+                return displays
+            self._misses += 1
+        return self._load(self._backend.get_displays)
+
+    def _load(self, read: Callable[[], list[DisplayInfo]]) -> list[DisplayInfo]:
+        with self._lock:
+            generation = self._generation
+            start_watch = not self._watch_started
+            self._watch_started = True
+
+        if start_watch:
+            # Watch before reading so a change during the read is not lost
+            try:
+                watch = self._backend.watch_displays(self.invalidate)
+            except NotImplementedError:
+                watch = None
+            with self._lock:
+                self._watch = watch
+
+        displays = read()
+        with self._lock:
+            # Skip caching a read that raced with an invalidation
+            if generation == self._generation:
+                self._displays = displays
+                self._loaded_at = time.monotonic()
+        return displays
+
+    def invalidate(self) -> None:
+        """Drop the cached topology so the next query re-reads it."""
+        with self._lock:
+            self._displays = None
+            self._generation += 1
+            self._invalidations += 1
+
+    def refresh(self, probe: bool = False) -> list[DisplayInfo]:
+        """Re-read the topology now.
+
+        With ``probe=True`` the backend re-detects connected displays first,
+        which can be slow (on X11 the server polls its outputs).
+        """
+        self.invalidate()
+        read = self._backend.probe_displays if probe else self._backend.get_displays
+        return list(self._load(read))
+
+    def cache_stats(self) -> DisplayCacheStats:
+        with self._lock:
+            return DisplayCacheStats(
+                live=self._watch is not None,
+                displays=len(self._displays or ()),
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+            )
+
+    def close(self) -> None:
+        """Stop watching for layout changes."""
+        with self._lock:
+            watch, self._watch = self._watch, None
+            self._watch_started = False
+        if watch is not None:
+            self._backend.unwatch_displays(watch)
 
     def all(self) -> list[DisplayInfo]:
-        return self._backend.get_displays()
+        return list(self._topology())
 
     # Alias for consistency with other modules
     def list(self) -> list[DisplayInfo]:
@@ -17,14 +200,20 @@ class Display:
         return self.all()
 
     def primary(self) -> DisplayInfo:
+        displays = self._topology()
+        for display in displays:
+            if display.is_primary:
+                return display
+        if displays:
+            return displays[0]
         return self._backend.get_primary_display()
 
     def count(self) -> int:
-        return len(self.all())
+        return len(self._topology())
 
     def at_point(self, x: int, y: int) -> DisplayInfo | None:
         point = Point(x, y)
-        for display in self.all():
+        for display in self._topology():
             if display.bounds.contains(point):
                 return display
         return None
@@ -35,18 +224,35 @@ class Display:
         return self.at_point(x, y)
 
     def virtual_rect(self) -> Rect:
-        return self._backend.get_virtual_screen_rect()
+        displays = self._topology()
+        if not displays:
+            return self._backend.get_virtual_screen_rect()
+
+        min_x = min(d.bounds.x for d in displays)
+        min_y = min(d.bounds.y for d in displays)
+        max_x = max(d.bounds.x + d.bounds.width for d in displays)
+        max_y = max(d.bounds.y + d.bounds.height for d in displays)
+
+        return Rect(min_x, min_y, max_x - min_x, max_y - min_y)
 
     # Alias for consistency
     def virtual_screen_rect(self) -> Rect:
         """Alias for virtual_rect()"""
         return self.virtual_rect()
 
+    def _transforms(self) -> _DisplayTransforms:
+        displays = self._topology()
+        cached = self._transform_cache
+        if cached is not None and cached.displays is displays:
+            return cached
+        transforms = _DisplayTransforms(displays or [self.primary()])
+        self._transform_cache = transforms
+        return transforms
+
     def to_physical(self, point: Point, display: DisplayInfo | None = None) -> Point:
         if display is None:
-            display = self.at_point(point.x, point.y)
-            if display is None:
-                display = self.primary()
+            transforms = self._transforms()
+            display = transforms.displays[transforms.locate(point.x, point.y, physical=False)]
 
         rel_x = point.x - display.bounds.x
         rel_y = point.y - display.bounds.y
@@ -58,18 +264,8 @@ class Display:
 
     def from_physical(self, point: Point, display: DisplayInfo | None = None) -> Point:
         if display is None:
-            for d in self.all():
-                phys_bounds = Rect(
-                    d.bounds.x,
-                    d.bounds.y,
-                    int(d.bounds.width * d.scale),
-                    int(d.bounds.height * d.scale),
-                )
-                if phys_bounds.contains(point):
-                    display = d
-                    break
-            if display is None:
-                display = self.primary()
+            transforms = self._transforms()
+            display = transforms.displays[transforms.locate(point.x, point.y, physical=True)]
 
         rel_x = point.x - display.bounds.x
         rel_y = point.y - display.bounds.y
@@ -79,5 +275,24 @@ class Display:
 
         return Point(display.bounds.x + log_x, display.bounds.y + log_y)
 
+    def to_physical_many(
+        self, points: Sequence[Point | tuple[int, int]] | Any, display: DisplayInfo | None = None
+    ) -> list[Point] | Any:
+        """Convert many logical points to physical coordinates.
+
+        Accepts a sequence of points or an ``(N, 2)`` NumPy array; arrays are
+        converted with vectorized operations and returned as an integer array.
+        Results match calling to_physical() on each point.
+        """
+        transforms = _DisplayTransforms([display]) if display is not None else self._transforms()
+        return transforms.convert(points, physical=False)
+
+    def from_physical_many(
+        self, points: Sequence[Point | tuple[int, int]] | Any, display: DisplayInfo | None = None
+    ) -> list[Point] | Any:
+        """Convert many physical points to logical coordinates, like to_physical_many()."""
+        transforms = _DisplayTransforms([display]) if display is not None else self._transforms()
+        return transforms.convert(points, physical=True)
+
 
 display = Display()
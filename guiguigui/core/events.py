@@ -1,31 +1,211 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any
 
 from ..backend import get_backend
-from .types import KeyboardEvent, MouseEvent
+from .hotkeys import Chord, KeyBindings, parse_chord, parse_key
+from .types import EventFilter, Key, KeyboardEvent, MouseButton, MouseEvent, Rect
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+    # Structured form of MouseEvent.row() batches; button indexes MOUSE_EVENT_BUTTONS
+    MOUSE_EVENT_DTYPE: Any = np.dtype(
+        [
+            ("x", np.int32),
+            ("y", np.int32),
+            ("button", np.int8),
+            ("pressed", np.bool_),
+            ("timestamp", np.float64),
+        ]
+    )
+except ImportError:
+    # NumPy is optional; only on_mouse_batch(as_array=True) needs it
+    _HAS_NUMPY = False
+    MOUSE_EVENT_DTYPE = None
+
+
+def _event_filter(
+    types: str | Iterable[str] | None = None,
+    buttons: Iterable[MouseButton | str] | None = None,
+    keys: Iterable[Key | str] | None = None,
+    region: Rect | None = None,
+    motion_rate: float | None = None,
+) -> EventFilter | None:
+    if all(value is None for value in (types, buttons, keys, region, motion_rate)):
+        return None
+    return EventFilter(
+        types=None if types is None else frozenset([types] if isinstance(types, str) else types),
+        buttons=None
+        if buttons is None
+        else frozenset(MouseButton(b) if isinstance(b, str) else b for b in buttons),
+        keys=None if keys is None else frozenset(parse_key(k) for k in keys),
+        region=region,
+        motion_rate=motion_rate,
+    )
 
 
 class Events:
+    """Global input hooks.
+
+    ``on_mouse()``, ``on_mouse_batch()`` and ``on_keyboard()`` take
+    declarative filters: ``types`` (any of "move", "press", "release"),
+    ``buttons``, ``keys``, a screen ``region`` and a ``motion_rate`` cap in
+    moves per second. Backends with ``hook_filters`` apply them before
+    decoding, so rejected events never become Python objects; elsewhere the
+    callback is wrapped to filter in Python.
+    """
+
     def __init__(self):
         self._backend = get_backend()
         self._hooks: dict[Any, str] = {}
+        # Key sequences, all matched by one keyboard hook
+        self.bindings = KeyBindings()
+        self._bindings_hook: Any = None
+
+    def _hook(
+        self,
+        hook: Callable[..., Any],
+        callback: Callable[[Any], Any],
+        event_filter: EventFilter | None,
+    ) -> Any:
+        if event_filter is None:
+            return hook(callback)
+        if self._backend.hook_filters:
+            return hook(callback, event_filter=event_filter)
+        accept = event_filter.predicate()
+
+        def deliver(ev: Any) -> Any:
+            if accept(ev):
+                return callback(ev)
+            return True
+
+        return hook(deliver)
+
+    def on_mouse(
+        self,
+        callback: Callable[[MouseEvent], bool],
+        *,
+        types: str | Iterable[str] | None = None,
+        buttons: Iterable[MouseButton | str] | None = None,
+        region: Rect | None = None,
+        motion_rate: float | None = None,
+    ) -> Any:
+        event_filter = _event_filter(types, buttons, None, region, motion_rate)
+        handle = self._hook(self._backend.hook_mouse, callback, event_filter)
+        self._hooks[handle] = "mouse"
+        return handle
+
+    def on_mouse_batch(
+        self,
+        callback: Callable[[Any], Any],
+        max_batch: int = 256,
+        max_latency: float = 0.01,
+        as_array: bool = False,
+        *,
+        types: str | Iterable[str] | None = None,
+        buttons: Iterable[MouseButton | str] | None = None,
+        region: Rect | None = None,
+        motion_rate: float | None = None,
+    ) -> Any:
+        """Receive mouse events in batches rather than one call per event.
+
+        ``callback`` gets a list of at most ``max_batch`` ``MouseEvent``
+        records, or with ``as_array`` a NumPy structured array of
+        ``MOUSE_EVENT_DTYPE`` built straight from the backend's raw rows.
+        Events wait at most ``max_latency`` seconds for a batch to fill.
+        """
+        options: dict[str, Any] = {}
+        event_filter = _event_filter(types, buttons, None, region, motion_rate)
+        if event_filter is not None:
+            options["event_filter"] = event_filter
+        if as_array:
+            if not _HAS_NUMPY:
+                raise ImportError(
+                    "numpy is required for as_array=True. Install with: pip install numpy"
+                )
 
-    def on_mouse(self, callback: Callable[[MouseEvent], bool]) -> Any:
-        handle = self._backend.hook_mouse(callback)
+            def deliver(rows: list[Any]) -> None:
+                callback(np.array(rows, dtype=MOUSE_EVENT_DTYPE))
+
+            handle = self._backend.hook_mouse_batch(
+                deliver, max_batch, max_latency, raw=True, **options
+            )
+        else:
+            handle = self._backend.hook_mouse_batch(callback, max_batch, max_latency, **options)
         self._hooks[handle] = "mouse"
         return handle
 
-    def on_keyboard(self, callback: Callable[[KeyboardEvent], bool]) -> Any:
-        handle = self._backend.hook_keyboard(callback)
+    def on_keyboard(
+        self,
+        callback: Callable[[KeyboardEvent], bool],
+        *,
+        types: str | Iterable[str] | None = None,
+        keys: Iterable[Key | str] | None = None,
+    ) -> Any:
+        event_filter = _event_filter(types, keys=keys)
+        handle = self._hook(self._backend.hook_keyboard, callback, event_filter)
         self._hooks[handle] = "keyboard"
         return handle
 
+    def register_hotkey(self, hotkey: str, callback: Callable[[], Any]) -> Any:
+        """Call ``callback()`` from a background thread whenever ``hotkey`` is pressed.
+
+        ``hotkey`` is modifiers and a key joined by "+", such as "ctrl+alt+k";
+        it matches whatever the state of NumLock and CapsLock. On X11 it is a
+        passive grab served by the event reader thread, so nothing runs until
+        the hotkey is pressed and the focused window does not receive it;
+        elsewhere it is matched on the keyboard hook. Remove it with
+        ``unhook()``.
+        """
+        modifiers, key = parse_chord(hotkey)
+        handle = self._backend.hook_hotkey(key, modifiers, callback)
+        self._hooks[handle] = "hotkey"
+        return handle
+
+    def register_sequence(
+        self, sequence: str | Sequence[str], callback: Callable[[], Any]
+    ) -> tuple[Chord, ...]:
+        """Call ``callback()`` when the chords of ``sequence`` are pressed in order.
+
+        ``sequence`` is chords separated by spaces, such as "ctrl+x ctrl+s",
+        each following the previous within ``bindings.timeout`` seconds. All
+        sequences are compiled into the ``bindings`` trie and fed by a single
+        hook on key presses, so a keystroke costs one lookup however many are
+        registered. Remove it with ``unhook()``.
+        """
+        handle = self.bindings.bind(sequence, callback)
+        if self._bindings_hook is None:
+            try:
+                self._bindings_hook = self._hook(
+                    self._backend.hook_keyboard,
+                    self._feed_bindings,
+                    EventFilter(types=frozenset({"press"})),
+                )
+            except Exception:
+                self.bindings.unbind(handle)
+                raise
+        self._hooks[handle] = "sequence"
+        return handle
+
+    def _feed_bindings(self, ev: KeyboardEvent) -> bool:
+        self.bindings.feed(ev)
+        return True
+
     def unhook(self, handle: Any) -> None:
-        if handle in self._hooks:
+        kind = self._hooks.get(handle)
+        if kind == "sequence":
+            self.bindings.unbind(handle)
+            if not self.bindings and self._bindings_hook is not None:
+                self._backend.unhook(self._bindings_hook)
+                self._bindings_hook = None
+        elif kind is not None:
             self._backend.unhook(handle)
-            del self._hooks[handle]
+        else:
+            return
+        del self._hooks[handle]
 
     def unhook_all(self) -> None:
         for handle in list(self._hooks.keys()):
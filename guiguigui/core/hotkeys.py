@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from .types import Key, KeyboardEvent, Modifier
+
+# A key pressed with exactly these modifiers held
+Chord = tuple[Modifier, Key | str]
+
+# Modifier bit of each modifier name accepted in hotkeys
+_HOTKEY_MODIFIERS: dict[Key | str, Modifier] = {
+    Key.SHIFT: Modifier.SHIFT,
+    Key.CTRL: Modifier.CTRL,
+    Key.CONTROL: Modifier.CTRL,
+    Key.ALT: Modifier.ALT,
+    Key.OPTION: Modifier.ALT,
+    Key.META: Modifier.ALT,
+    Key.SUPER: Modifier.SUPER,
+    Key.CMD: Modifier.SUPER,
+    Key.COMMAND: Modifier.SUPER,
+    Key.WIN: Modifier.SUPER,
+    Key.WINDOWS: Modifier.SUPER,
+}
+
+# Key members that name the same key, mapped to the one keyboard hooks report
+_KEY_ALIASES: dict[Key | str, Key] = {
+    Key.RETURN: Key.ENTER,
+    Key.ESCAPE: Key.ESC,
+    Key.CONTROL: Key.CTRL,
+    Key.OPTION: Key.ALT,
+    Key.CMD: Key.SUPER,
+    Key.COMMAND: Key.SUPER,
+    Key.WIN: Key.SUPER,
+    Key.WINDOWS: Key.SUPER,
+}
+
+# Presses of these keys only change the modifiers of the next chord
+_MODIFIER_KEY_NAMES: frozenset[Key | str] = frozenset(
+    {
+        *_HOTKEY_MODIFIERS,
+        "Shift_R",
+        "Control_R",
+        "Alt_R",
+        "Super_R",
+        "Meta_R",
+        "ISO_Level3_Shift",
+    }
+)
+
+
+def parse_key(key: Key | str) -> Key | str:
+    """The Key member a key name stands for, as keyboard hooks report it.
+
+    Names that are not Key values, such as other characters or platform key
+    names, are returned unchanged.
+    """
+    if isinstance(key, str):
+        try:
+            key = Key(key.lower())
+        except ValueError:
+            return key
+    return _KEY_ALIASES.get(key, key)
+
+
+def parse_chord(chord: str) -> Chord:
+    """Split a hotkey such as "ctrl+alt+k" into its modifiers and key."""
+    *names, last = (part.strip() for part in chord.split("+"))
+    modifiers = Modifier(0)
+    for name in names:
+        bit = _HOTKEY_MODIFIERS.get(parse_key(name))
+        if bit is None:
+            raise ValueError(f"Unknown modifier {name!r} in hotkey {chord!r}")
+        modifiers |= bit
+    if not last:
+        raise ValueError(f"Hotkey {chord!r} has no key")
+    return modifiers, parse_key(last)
+
+
+def parse_sequence(sequence: str | Sequence[str]) -> tuple[Chord, ...]:
+    """Parse chords separated by spaces, such as "ctrl+x ctrl+s", or a list of chords."""
+    chords = sequence.split() if isinstance(sequence, str) else sequence
+    if not chords:
+        raise ValueError("Empty key sequence")
+    return tuple(parse_chord(chord) for chord in chords)
+
+
+class _Node:
+    __slots__ = ("children", "callback")
+
+    def __init__(self) -> None:
+        self.children: dict[Chord, _Node] = {}
+        self.callback: Callable[[], Any] | None = None
+
+
+class KeyBindings:
+    """Chords and chord sequences compiled into a trie and matched keystroke by keystroke.
+
+    Each key press is one dict lookup from the current trie node, whatever
+    the number of bindings. A press that continues no pending sequence
+    restarts matching from the root, and a pending sequence is abandoned when
+    its next chord comes more than ``timeout`` seconds (of event time) after
+    the previous one. A binding may not be a prefix of another, so every
+    complete sequence fires at once. Presses of modifier keys are skipped.
+    """
+
+    def __init__(self, timeout: float = 1.0):
+        self.timeout = timeout
+        self._root = _Node()
+        self._node = self._root
+        self._last_time = 0.0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def pending(self) -> bool:
+        """Whether a sequence has been started but not completed."""
+        return self._node is not self._root
+
+    def bind(self, sequence: str | Sequence[str], callback: Callable[[], Any]) -> tuple[Chord, ...]:
+        """Call ``callback()`` when ``sequence`` is typed; returns the handle for ``unbind()``."""
+        chords = parse_sequence(sequence)
+        node = self._root
+        for depth, chord in enumerate(chords):
+            if node.callback is not None:
+                raise ValueError(f"{sequence!r} extends a bound sequence")
+            child = node.children.get(chord)
+            if child is None:
+                child = node.children[chord] = _Node()
+            node = child
+            if depth == len(chords) - 1 and (node.callback is not None or node.children):
+                raise ValueError(f"{sequence!r} is already bound or a prefix of a binding")
+        node.callback = callback
+        self._count += 1
+        return chords
+
+    def unbind(self, chords: tuple[Chord, ...]) -> bool:
+        path = [self._root]
+        for chord in chords:
+            child = path[-1].children.get(chord)
+            if child is None:
+                return False
+            path.append(child)
+        if path[-1].callback is None:
+            return False
+        path[-1].callback = None
+        self._count -= 1
+        # Prune the nodes that no longer lead to a binding
+        for parent, chord, node in zip(path[-2::-1], chords[::-1], path[:0:-1], strict=True):
+            if node.children or node.callback is not None:
+                break
+            del parent.children[chord]
+        self.reset()
+        return True
+
+    def reset(self) -> None:
+        """Abandon any pending sequence."""
+        self._node = self._root
+
+    def feed(self, ev: KeyboardEvent) -> bool:
+        """Advance matching by one keyboard event; returns whether it was part of a binding."""
+        if not ev.pressed or ev.key in _MODIFIER_KEY_NAMES:
+            return False
+        chord = (ev.modifier_mask, _KEY_ALIASES.get(ev.key, ev.key))
+        node = self._node
+        if node is not self._root and ev.timestamp - self._last_time > self.timeout:
+            node = self._root
+        child = node.children.get(chord)
+        if child is None and node is not self._root:
+            child = self._root.children.get(chord)
+        if child is None:
+            self._node = self._root
+            return False
+        self._last_time = ev.timestamp
+        if child.callback is None:
+            self._node = child
+            return True
+        self._node = self._root
+        child.callback()
+        return True
@@ -5,71 +5,155 @@ from collections.abc import Generator
 from contextlib import contextmanager
 
 from ..backend import get_backend
-from .types import Key
+from .timing import timing
+from .types import Key, KeyboardState, TimingProfile
+
+_MODIFIER_KEYS = (Key.SHIFT, Key.CTRL, Key.ALT, Key.CMD, Key.WIN, Key.SUPER)
 
 
 class Keyboard:
+    # Text at least this long is pasted rather than typed by write(strategy="auto")
+    paste_threshold = 256
+
     def __init__(self):
         self._backend = get_backend()
 
-    def press(self, key: Key | str) -> None:
+    def press(self, key: Key | str, confirm: bool = False) -> float | None:
         self._backend.key_press(key)
+        return self._acknowledge(confirm)
 
-    def release(self, key: Key | str) -> None:
+    def release(self, key: Key | str, confirm: bool = False) -> float | None:
         self._backend.key_release(key)
-
-    def tap(self, key: Key | str, times: int = 1, interval: float = 0.05) -> None:
+        return self._acknowledge(confirm)
+
+    def _acknowledge(
+        self, confirm: bool, profile: TimingProfile | str | None = None
+    ) -> float | None:
+        if not confirm:
+            return None
+        return self._backend.acknowledge(timing.resolve(profile).confirm_timeout)
+
+    def tap(
+        self,
+        key: Key | str,
+        times: int = 1,
+        interval: float = 0.05,
+        profile: TimingProfile | str | None = None,
+        confirm: bool = False,
+    ) -> float | None:
+        """Tap ``key`` ``times`` times, holding it for the timing profile's ``key_hold``.
+
+        With ``confirm``, waits for the taps to be delivered and returns the
+        delivery latency in seconds (None if it could not be observed).
+        """
+        timings = timing.resolve(profile)
         for i in range(times):
             self.press(key)
-            time.sleep(0.01)
+            timing.pause(timings.key_hold, timings)
             self.release(key)
             if i < times - 1:
                 time.sleep(interval)
+        return self._acknowledge(confirm, profile)
 
     def is_pressed(self, key: Key | str) -> bool:
         return self._backend.key_is_pressed(key)
 
-    def write(self, text: str, interval: float = 0.0) -> None:
-        if interval <= 0:
+    def write(
+        self, text: str, interval: float = 0.0, strategy: str = "keys", confirm: bool = False
+    ) -> float | None:
+        """Type text.
+
+        ``strategy`` is ``"keys"`` to send key events, ``"paste"`` to paste the
+        text through the clipboard, or ``"auto"`` to paste text of at least
+        ``paste_threshold`` characters when no ``interval`` is requested.
+        Pasting replaces the clipboard where it cannot be restored (see
+        ``paste()``), so it is only used when asked for. ``confirm`` works as
+        in ``tap()``.
+        """
+        if strategy not in ("auto", "keys", "paste"):
+            raise ValueError(f"Unknown write strategy: {strategy!r}")
+        if strategy == "paste" or (
+            strategy == "auto" and interval <= 0 and len(text) >= self.paste_threshold
+        ):
+            self.paste(text)
+        elif interval <= 0:
             self._backend.key_type_unicode(text)
         else:
             for char in text:
                 self._backend.key_type_unicode(char)
                 time.sleep(interval)
+        return self._acknowledge(confirm)
 
     # Alias for write
-    def type(self, text: str, interval: float = 0.0) -> None:
+    def type(
+        self, text: str, interval: float = 0.0, strategy: str = "keys", confirm: bool = False
+    ) -> float | None:
         """Alias for write()"""
-        self.write(text, interval)
-
-    def hotkey(self, *keys: Key | str, interval: float = 0.01) -> None:
-        for key in keys:
+        return self.write(text, interval, strategy, confirm)
+
+    def paste(self, text: str, timeout: float = 2.0) -> None:
+        """Paste text through the clipboard, then restore the previous clipboard.
+
+        Waits up to ``timeout`` seconds for the focused application to read the
+        clipboard before restoring it. Backends whose ``clipboard_save()``
+        cannot capture every kind of content (X11) are not restored, since
+        setting the old text back would drop images and rich text and leave
+        an owner that stops serving it; the clipboard then keeps ``text``.
+        """
+        saved = self._backend.clipboard_save()
+        self._backend.clipboard_set_text(text)
+        try:
+            self.hotkey(*self._backend.paste_keys, interval=0)
+            self._backend.clipboard_wait_consumed(timeout)
+        finally:
+            if saved is not None:
+                self._backend.clipboard_restore(saved)
+
+    def hotkey(
+        self,
+        *keys: Key | str,
+        interval: float | None = None,
+        profile: TimingProfile | str | None = None,
+        confirm: bool = False,
+    ) -> float | None:
+        """Press ``keys`` in order and release them in reverse.
+
+        ``interval`` defaults to the timing profile's ``hotkey_interval``; the
+        keys stay down together for its ``hotkey_hold``. ``confirm`` works as
+        in ``tap()``.
+        """
+        timings = timing.resolve(profile)
+        if interval is None:
+            interval = timings.hotkey_interval
+
+        # Under a syncing profile the server sees each modifier before the next key
+        sync = self._backend.sync
+        for index, key in enumerate(keys):
             self.press(key)
-            if interval > 0:
+            if index < len(keys) - 1:
+                timing.pause(interval, timings, sync)
+            elif interval > 0:
                 time.sleep(interval)
 
-        time.sleep(0.02)
+        timing.pause(timings.hotkey_hold, timings, sync)
 
         for key in reversed(keys):
             self.release(key)
             if interval > 0:
                 time.sleep(interval)
+        return self._acknowledge(confirm, profile)
 
     def press_and_hold(self, key: Key | str, duration: float) -> None:
         self.press(key)
         time.sleep(duration)
         self.release(key)
 
+    def state(self) -> KeyboardState:
+        """Snapshot of every pressed key, answered by one backend query."""
+        return self._backend.keyboard_state()
+
     def get_modifiers(self) -> set[Key]:
-        modifiers = set()
-        modifier_keys = [Key.SHIFT, Key.CTRL, Key.ALT, Key.CMD, Key.WIN, Key.SUPER]
-        for key in modifier_keys:
-            try:
-                if self.is_pressed(key):
-                    modifiers.add(key)
-            except Exception:
-                pass
-        return modifiers
+        return set(self._backend.keyboard_state(_MODIFIER_KEYS).pressed)
 
     def get_layout(self) -> str:
         return self._backend.get_keyboard_layout()
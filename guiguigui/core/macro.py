@@ -1,10 +1,14 @@
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import Any
 
-from .types import Key
+from .motion import resample, simplify
+from .types import Key, PathReport
+
+# Leftover path time below this is float noise, not a pause
+_MIN_WAIT = 1e-6
 
 
 class MacroContext:
@@ -41,6 +45,19 @@ class MouseMove(Action):
         mouse.move(self.x, self.y, self.duration)
 
 
+@dataclass
+class MousePath(Action):
+    """Pointer path replayed in one ``mouse.move_path()`` call; built by ``Macro.optimize()``."""
+
+    points: list[tuple[int, int]]
+    timestamps: list[float]
+
+    def execute(self, ctx: MacroContext) -> None:
+        from .mouse import mouse
+
+        mouse.move_path(self.points, self.timestamps)
+
+
 @dataclass
 class MouseClick(Action):
     button: str = "left"
@@ -196,10 +213,100 @@ class Loop(Action):
             iterations += 1
 
 
+@dataclass
+class _PathOptimizer:
+    tolerance: float
+    speed: float
+    rate: float
+    report: PathReport = field(default_factory=lambda: PathReport(0, 0, 0))
+
+    def optimize(self, actions: list[Action]) -> list[Action]:
+        out: list[Action] = []
+        i = 0
+        while i < len(actions):
+            action = actions[i]
+            if not isinstance(action, MouseMove):
+                out.append(self._scale(action))
+                i += 1
+                continue
+
+            # A run of moves and waits is one path; trailing waits stay waits
+            end = i + 1
+            while end < len(actions) and isinstance(actions[end], (MouseMove, Wait)):
+                end += 1
+            last = end
+            while isinstance(actions[last - 1], Wait):
+                last -= 1
+            out.extend(self._path(action, actions[i + 1 : last]))
+            out.extend(self._scale(wait) for wait in actions[last:end])
+            i = end
+        return out
+
+    def _scale(self, action: Action) -> Action:
+        if isinstance(action, Wait):
+            return replace(action, seconds=action.seconds / self.speed)
+        if isinstance(action, (MouseMove, MouseDrag)):
+            return replace(action, duration=action.duration / self.speed)
+        if isinstance(action, (Repeat, Loop)):
+            return replace(action, actions=self.optimize(action.actions))
+        if isinstance(action, Condition):
+            else_actions = action.else_actions and self.optimize(action.else_actions)
+            return replace(
+                action, then_actions=self.optimize(action.then_actions), else_actions=else_actions
+            )
+        return action
+
+    def _path(self, anchor: MouseMove, tail: list[Action]) -> list[Action]:
+        # The anchor starts from wherever the pointer is, so it is replayed as is
+        out: list[Action] = [self._scale(anchor)]
+        self.report.moves += 1
+        self.report.points += 1
+        self.report.replay_events += (
+            max(round(anchor.duration / self.speed * self.rate), 2) if anchor.duration > 0 else 1
+        )
+        if not tail:
+            return out
+
+        points = [(anchor.x, anchor.y)]
+        timestamps = [0.0]
+        elapsed = 0.0
+        for action in tail:
+            if isinstance(action, Wait):
+                elapsed += action.seconds
+            elif isinstance(action, MouseMove):
+                elapsed += action.duration
+                points.append((action.x, action.y))
+                timestamps.append(elapsed / self.speed)
+        self.report.moves += len(points) - 1
+
+        # Resting points bound the simplified stretches, so hovers keep their timing
+        bounds = {0, len(points) - 1}
+        for k in range(1, len(points)):
+            if points[k] == points[k - 1]:
+                bounds.update((k - 1, k))
+        edges = sorted(bounds)
+        keep = {0}
+        for first, last in zip(edges, edges[1:], strict=False):
+            keep.update(first + k for k in simplify(points[first : last + 1], self.tolerance))
+        kept = sorted(keep)
+        self.report.points += len(kept) - 1
+
+        path, stamps = resample([points[k] for k in kept], [timestamps[k] for k in kept], self.rate)
+        self.report.replay_events += len(path)
+        if path:
+            out.append(MousePath(path, stamps))
+        # A rest at the end of the run has no motion left to carry its time
+        rest = elapsed / self.speed - (stamps[-1] if stamps else 0.0)
+        if rest > _MIN_WAIT:
+            out.append(Wait(rest))
+        return out
+
+
 class Macro:
     def __init__(self, name: str | None = None):
         self.name = name or "unnamed"
         self.actions: list[Action] = []
+        self.last_optimization: PathReport | None = None
 
     def add(self, action: Action) -> "Macro":
         self.actions.append(action)
@@ -221,6 +328,29 @@ class Macro:
         for _ in range(times):
             self.run()
 
+    def optimize(self, tolerance: float = 1.0, speed: float = 1.0, rate: float = 60.0) -> "Macro":
+        """Copy of this macro with its pointer motion simplified and sped up.
+
+        Each run of ``MouseMove`` and ``Wait`` actions becomes its first move
+        plus one ``MousePath``: the recorded points are reduced with
+        ``motion.simplify()`` within ``tolerance`` pixels, then refilled with
+        straight steps at ``rate`` Hz. The last point before a click or drag is
+        always kept, as are points where the pointer rested. Waits and move or
+        drag durations are divided by ``speed``. The counts are recorded in
+        ``last_optimization``.
+        """
+        if tolerance < 0:
+            raise ValueError(f"tolerance must be non-negative, got {tolerance}")
+        if speed <= 0:
+            raise ValueError(f"speed must be positive, got {speed}")
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        optimizer = _PathOptimizer(tolerance, speed, rate)
+        optimized = Macro(self.name)
+        optimized.actions = optimizer.optimize(self.actions)
+        self.last_optimization = optimizer.report
+        return optimized
+
 
 def macro(name: str | None = None) -> Macro:
     return Macro(name)
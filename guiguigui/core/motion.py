@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import Any
+
+from .types import MotionReport, Point
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    # NumPy is optional; trajectories fall back to pure Python lists
+    _HAS_NUMPY = False
+
+Easing = Callable[[Any], Any]
+
+# time.sleep() overshoots by up to a scheduler tick, so the last stretch
+# before a deadline is spun on the monotonic clock instead
+_SPIN_THRESHOLD = 0.002
+
+
+def wait_until(deadline: float) -> None:
+    """Block until ``time.perf_counter()`` reaches ``deadline``."""
+    remaining = deadline - time.perf_counter()
+    if remaining > _SPIN_THRESHOLD:
+        time.sleep(remaining - _SPIN_THRESHOLD)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def linear(t: Any) -> Any:
+    return t
+
+
+def ease_in_out_cubic(t: Any) -> Any:
+    if _HAS_NUMPY and isinstance(t, np.ndarray):
+        return np.where(t < 0.5, 4 * t * t * t, 1 - (-2 * t + 2) ** 3 / 2)
+    if t < 0.5:
+        return 4 * t * t * t
+    return 1 - pow(-2 * t + 2, 3) / 2
+
+
+def minimum_jerk(t: Any) -> Any:
+    """Minimum-jerk profile, the bell-shaped velocity of a human reaching motion."""
+    return t * t * t * (10 - 15 * t + 6 * t * t)
+
+
+@lru_cache(maxsize=64)
+def _profile(steps: int, easing: Easing | None) -> Any:
+    """Eased progress at steps 1..steps, shared by every path of the same shape.
+
+    Easings written with plain arithmetic (or np.where) are evaluated over the
+    whole array at once; others are applied per step, once per shape.
+    """
+    easing = easing or linear
+    if _HAS_NUMPY:
+        t = np.arange(1, steps + 1, dtype=float) / steps
+        try:
+            progress = np.asarray(easing(t), dtype=float)
+        except (TypeError, ValueError):
+            progress = None
+        if progress is None or progress.shape != t.shape:
+            progress = np.fromiter((easing(v) for v in t.tolist()), dtype=float, count=steps)
+        progress.flags.writeable = False
+        return progress
+    return tuple(easing(i / steps) for i in range(1, steps + 1))
+
+
+@lru_cache(maxsize=64)
+def _timestamps(steps: int, duration: float) -> Any:
+    if _HAS_NUMPY:
+        # Scale the 0..1 fractions so the last timestamp is exactly ``duration``
+        stamps = np.arange(1, steps + 1, dtype=float) / steps * duration
+        stamps.flags.writeable = False
+        return stamps
+    return tuple(duration * (i / steps) for i in range(1, steps + 1))
+
+
+def trajectory(
+    start: Point, end: Point, duration: float, steps: int, easing: Easing | None = None
+) -> tuple[Any, Any]:
+    """Points and timestamps for an eased straight-line move.
+
+    Returns ``(points, timestamps)`` for steps 1..steps, ready for
+    ``Backend.mouse_move_path()``: an ``(n, 2)`` integer array and an ``n``
+    float array when NumPy is installed, lists otherwise. The eased profile
+    and timestamps are cached per (steps, duration, easing), so repeated
+    moves only pay for scaling the profile to the distance.
+    """
+    progress = _profile(steps, easing)
+    timestamps = _timestamps(steps, duration)
+    dx = end.x - start.x
+    dy = end.y - start.y
+    if _HAS_NUMPY:
+        points = np.empty((steps, 2), dtype=np.int64)
+        # astype() truncates toward zero like int()
+        points[:, 0] = (start.x + dx * progress).astype(np.int64)
+        points[:, 1] = (start.y + dy * progress).astype(np.int64)
+        return points, timestamps
+    return [(int(start.x + dx * p), int(start.y + dy * p)) for p in progress], list(timestamps)
+
+
+def play_path(
+    points: Sequence[tuple[int, int]] | Any,
+    timestamps: Sequence[float] | Any,
+    send: Callable[[int, int], None],
+) -> MotionReport:
+    """Send ``points`` through ``send`` at ``timestamps`` seconds from now.
+
+    Each point is scheduled against an absolute monotonic deadline, so time
+    spent in ``send`` does not accumulate. A point is dropped when the next
+    one is already due; the final point is always sent.
+    """
+    if hasattr(points, "tolist"):
+        points = points.tolist()
+    if hasattr(timestamps, "tolist"):
+        timestamps = timestamps.tolist()
+    if len(points) != len(timestamps):
+        raise ValueError(f"Got {len(points)} points but {len(timestamps)} timestamps")
+
+    count = len(points)
+    planned = timestamps[-1] if count else 0.0
+    dropped = 0
+    max_lateness = 0.0
+
+    t0 = time.perf_counter()
+    for i, (x, y) in enumerate(points):
+        deadline = t0 + timestamps[i]
+        if i < count - 1 and time.perf_counter() >= t0 + timestamps[i + 1]:
+            dropped += 1
+            continue
+        wait_until(deadline)
+        max_lateness = max(max_lateness, time.perf_counter() - deadline)
+        send(int(x), int(y))
+
+    return MotionReport(
+        planned=planned,
+        actual=time.perf_counter() - t0,
+        steps=count,
+        dropped=dropped,
+        rate=count / planned if planned > 0 else 0.0,
+        max_lateness=max_lateness,
+    )
+
+
+def _farthest(points: Any, first: int, last: int) -> tuple[int, float]:
+    """Index and squared distance of the point farthest from segment first-last."""
+    if _HAS_NUMPY:
+        x1, y1 = points[first]
+        dx, dy = points[last] - points[first]
+        inner = points[first + 1 : last]
+        length2 = dx * dx + dy * dy
+        if length2:
+            t = np.clip(((inner[:, 0] - x1) * dx + (inner[:, 1] - y1) * dy) / length2, 0.0, 1.0)
+            ex = inner[:, 0] - (x1 + t * dx)
+            ey = inner[:, 1] - (y1 + t * dy)
+        else:
+            ex = inner[:, 0] - x1
+            ey = inner[:, 1] - y1
+        dist2 = ex * ex + ey * ey
+        k = int(np.argmax(dist2))
+        return first + 1 + k, float(dist2[k])
+
+    x1, y1 = points[first]
+    x2, y2 = points[last]
+    dx, dy = x2 - x1, y2 - y1
+    length2 = dx * dx + dy * dy
+    best, best_dist2 = first + 1, -1.0
+    for i in range(first + 1, last):
+        px, py = points[i]
+        if length2:
+            t = min(max(((px - x1) * dx + (py - y1) * dy) / length2, 0.0), 1.0)
+            px -= x1 + t * dx
+            py -= y1 + t * dy
+        else:
+            px -= x1
+            py -= y1
+        dist2 = px * px + py * py
+        if dist2 > best_dist2:
+            best, best_dist2 = i, dist2
+    return best, best_dist2
+
+
+def simplify(points: Sequence[tuple[int, int]] | Any, tolerance: float = 1.0) -> list[int]:
+    """Indices of the points that survive Ramer-Douglas-Peucker simplification.
+
+    A point is dropped when it lies within ``tolerance`` pixels of the segment
+    joining the points kept around it, so collinear runs collapse to their
+    endpoints. Distances are to the segment, not its line, so a path that
+    doubles back keeps its turning point. The first and last points are
+    always kept.
+    """
+    if tolerance < 0:
+        raise ValueError(f"tolerance must be non-negative, got {tolerance}")
+    count = len(points)
+    if count < 3:
+        return list(range(count))
+    if _HAS_NUMPY:
+        points = np.asarray(points, dtype=float)
+    elif hasattr(points, "tolist"):
+        points = points.tolist()
+
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    limit = tolerance * tolerance
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        index, dist2 = _farthest(points, first, last)
+        if dist2 > limit:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [i for i, kept in enumerate(keep) if kept]
+
+
+def resample(
+    points: Sequence[tuple[int, int]], timestamps: Sequence[float], rate: float
+) -> tuple[list[tuple[int, int]], list[float]]:
+    """Fill the segments of a polyline with straight-line steps at ``rate`` Hz.
+
+    ``points[0]`` is where the pointer already is and is not emitted. Each
+    later segment gets at least one step, ending exactly on its vertex;
+    zero-length segments (the pointer resting) emit nothing.
+    """
+    out_points: list[tuple[int, int]] = []
+    out_timestamps: list[float] = []
+    for i in range(1, len(points)):
+        x0, y0 = points[i - 1]
+        x1, y1 = points[i]
+        if (x0, y0) == (x1, y1):
+            continue
+        t0 = timestamps[i - 1]
+        span = timestamps[i] - t0
+        steps = max(1, round(span * rate))
+        for k in range(1, steps + 1):
+            f = k / steps
+            out_points.append((int(x0 + (x1 - x0) * f), int(y0 + (y1 - y0) * f)))
+            out_timestamps.append(t0 + span * f)
+    return out_points, out_timestamps
@@ -1,39 +1,102 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager
+from typing import Any
 
 from ..backend import get_backend
-from .types import MouseButton, Point
+from .display import Display, display
+from .motion import ease_in_out_cubic, trajectory
+from .timing import timing
+from .types import MotionReport, MouseButton, MouseState, Point, TimingProfile
+
+# Motion steps are capped at 1 kHz; rates default to the display refresh rate
+_MAX_MOTION_RATE = 1000.0
+_DEFAULT_MOTION_RATE = 60.0
 
 
 class Mouse:
     def __init__(self):
         self._backend = get_backend()
+        # Display topology of this mouse's backend, for the default motion rate
+        self._display = (
+            display if display._backend is self._backend else Display(backend=self._backend)
+        )
+        # Steps per second for timed moves; None follows the display refresh rate
+        self.rate: float | None = None
+        self.last_motion: MotionReport | None = None
 
     def position(self) -> Point:
         return self._backend.mouse_position()
 
+    def state(self) -> MouseState:
+        """Snapshot of the pointer position and pressed buttons, answered by one backend query."""
+        return self._backend.mouse_state()
+
     def move(
-        self, x: int, y: int, duration: float = 0.0, easing: Callable[[float], float] | None = None
-    ) -> None:
+        self,
+        x: int,
+        y: int,
+        duration: float = 0.0,
+        easing: Callable[[float], float] | None = None,
+        rate: float | None = None,
+        confirm: bool = False,
+    ) -> float | None:
+        """Move the pointer to (x, y), over ``duration`` seconds if given.
+
+        Timed moves step at ``rate`` Hz (default: ``self.rate``, else the
+        refresh rate of the display under the pointer), capped at 1 kHz. The
+        whole trajectory is computed up front and handed to the backend's
+        ``mouse_move_path()``, which schedules each step against an absolute
+        monotonic deadline. The timing of the move is recorded in
+        ``last_motion``.
+
+        With ``confirm``, waits for the move to be delivered and returns the
+        delivery latency in seconds (None if it could not be observed).
+        """
         if duration <= 0:
             self._backend.mouse_move_to(x, y)
-            return
+            return self._acknowledge(confirm)
 
         start = self.position()
-        steps = max(int(duration * 60), 2)
-
-        for i in range(steps + 1):
-            t = i / steps
-            if easing:
-                t = easing(t)
-
-            current_x = int(start.x + (x - start.x) * t)
-            current_y = int(start.y + (y - start.y) * t)
-            self._backend.mouse_move_to(current_x, current_y)
-            time.sleep(duration / steps)
+        rate = self._motion_rate(start, rate)
+        steps = max(round(duration * rate), 2)
+        points, timestamps = trajectory(start, Point(x, y), duration, steps, easing)
+        report = self._backend.mouse_move_path(points, timestamps)
+        report.rate = rate
+        self.last_motion = report
+        return self._acknowledge(confirm)
+
+    def _acknowledge(
+        self, confirm: bool, profile: TimingProfile | str | None = None
+    ) -> float | None:
+        if not confirm:
+            return None
+        return self._backend.acknowledge(timing.resolve(profile).confirm_timeout)
+
+    def move_path(
+        self, points: Sequence[tuple[int, int]] | Any, timestamps: Sequence[float] | Any
+    ) -> None:
+        """Move the pointer through ``points``, reaching each at ``timestamps`` seconds.
+
+        See ``Backend.mouse_move_path()``; the timing of the move is recorded
+        in ``last_motion``.
+        """
+        self.last_motion = self._backend.mouse_move_path(points, timestamps)
+
+    def _motion_rate(self, start: Point, rate: float | None) -> float:
+        if rate is None:
+            rate = self.rate
+        if rate is None:
+            # The cached topology spares a display query per timed move
+            info = self._display.at_point(start.x, start.y)
+            rate = _DEFAULT_MOTION_RATE
+            if info is not None and info.refresh_rate > 0:
+                rate = info.refresh_rate
+        if rate <= 0:
+            raise ValueError(f"Motion rate must be positive, got {rate}")
+        return min(rate, _MAX_MOTION_RATE)
 
     def move_rel(self, dx: int, dy: int, duration: float = 0.0) -> None:
         if duration <= 0:
@@ -43,17 +106,29 @@ class Mouse:
             self.move(current.x + dx, current.y + dy, duration)
 
     def click(
-        self, button: MouseButton | str = MouseButton.LEFT, clicks: int = 1, interval: float = 0.1
-    ) -> None:
+        self,
+        button: MouseButton | str = MouseButton.LEFT,
+        clicks: int = 1,
+        interval: float = 0.1,
+        profile: TimingProfile | str | None = None,
+        confirm: bool = False,
+    ) -> float | None:
+        """Click ``clicks`` times, holding the button for the timing profile's ``click_hold``.
+
+        With ``confirm``, waits for the clicks to be delivered and returns the
+        delivery latency in seconds (None if it could not be observed).
+        """
         if isinstance(button, str):
             button = MouseButton(button)
+        timings = timing.resolve(profile)
 
         for i in range(clicks):
             self._backend.mouse_press(button)
-            time.sleep(0.02)
+            timing.pause(timings.click_hold, timings)
             self._backend.mouse_release(button)
             if i < clicks - 1:
                 time.sleep(interval)
+        return self._acknowledge(confirm, profile)
 
     def double_click(self, button: MouseButton | str = MouseButton.LEFT) -> None:
         self.click(button, clicks=2, interval=0.1)
@@ -67,15 +142,21 @@ class Mouse:
     def middle_click(self) -> None:
         self.click(MouseButton.MIDDLE)
 
-    def press(self, button: MouseButton | str = MouseButton.LEFT) -> None:
+    def press(
+        self, button: MouseButton | str = MouseButton.LEFT, confirm: bool = False
+    ) -> float | None:
         if isinstance(button, str):
             button = MouseButton(button)
         self._backend.mouse_press(button)
+        return self._acknowledge(confirm)
 
-    def release(self, button: MouseButton | str = MouseButton.LEFT) -> None:
+    def release(
+        self, button: MouseButton | str = MouseButton.LEFT, confirm: bool = False
+    ) -> float | None:
         if isinstance(button, str):
             button = MouseButton(button)
         self._backend.mouse_release(button)
+        return self._acknowledge(confirm)
 
     def is_pressed(self, button: MouseButton | str = MouseButton.LEFT) -> bool:
         if isinstance(button, str):
@@ -83,25 +164,45 @@ class Mouse:
         return self._backend.mouse_is_pressed(button)
 
     def drag(
-        self, x: int, y: int, button: MouseButton | str = MouseButton.LEFT, duration: float = 0.0
-    ) -> None:
+        self,
+        x: int,
+        y: int,
+        button: MouseButton | str = MouseButton.LEFT,
+        duration: float = 0.0,
+        profile: TimingProfile | str | None = None,
+        confirm: bool = False,
+    ) -> float | None:
+        """Press, move to (x, y) and release, settling for the profile's ``drag_settle``.
+
+        Applications must see the press before the motion and the motion
+        before the release, so a zero settle syncs with the server instead.
+        """
         if isinstance(button, str):
             button = MouseButton(button)
+        timings = timing.resolve(profile)
 
         self.press(button)
-        time.sleep(0.05)
+        timing.pause(timings.drag_settle, timings, self._backend.sync)
         self.move(x, y, duration)
-        time.sleep(0.05)
+        timing.pause(timings.drag_settle, timings, self._backend.sync)
         self.release(button)
+        return self._acknowledge(confirm, profile)
 
     def drag_rel(
-        self, dx: int, dy: int, button: MouseButton | str = MouseButton.LEFT, duration: float = 0.0
-    ) -> None:
+        self,
+        dx: int,
+        dy: int,
+        button: MouseButton | str = MouseButton.LEFT,
+        duration: float = 0.0,
+        profile: TimingProfile | str | None = None,
+        confirm: bool = False,
+    ) -> float | None:
         current = self.position()
-        self.drag(current.x + dx, current.y + dy, button, duration)
+        return self.drag(current.x + dx, current.y + dy, button, duration, profile, confirm)
 
-    def scroll(self, dx: int = 0, dy: int = 0) -> None:
+    def scroll(self, dx: int = 0, dy: int = 0, confirm: bool = False) -> float | None:
         self._backend.mouse_scroll(dx, dy)
+        return self._acknowledge(confirm)
 
     def scroll_up(self, clicks: int = 3) -> None:
         self.scroll(dy=clicks)
@@ -116,12 +217,6 @@ class Mouse:
         self.scroll(dx=clicks)
 
     def smooth_move(self, x: int, y: int, duration: float = 0.5) -> None:
-        def ease_in_out_cubic(t: float) -> float:
-            if t < 0.5:
-                return 4 * t * t * t
-            else:
-                return 1 - pow(-2 * t + 2, 3) / 2
-
         self.move(x, y, duration, easing=ease_in_out_cubic)
 
     @contextmanager
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from .types import Point, WindowInfo
+
+
+class WindowGrid:
+    """Uniform grid over window rectangles for point hit-tests.
+
+    Built from a window snapshot in stacking order. Each cell lists the
+    windows overlapping it topmost first, so a query only checks the few
+    windows sharing its cell instead of every window on screen.
+    """
+
+    def __init__(
+        self, windows: Iterable[WindowInfo], topmost_first: bool = True, cell_size: int = 256
+    ):
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[WindowInfo]] = {}
+        ordered = list(windows)
+        if not topmost_first:
+            ordered.reverse()
+        for win in ordered:
+            rect = win.rect
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            for cx in range(rect.left // cell_size, rect.right // cell_size + 1):
+                for cy in range(rect.top // cell_size, rect.bottom // cell_size + 1):
+                    self._cells.setdefault((cx, cy), []).append(win)
+
+    def at(self, x: int, y: int) -> WindowInfo | None:
+        """Return the topmost window containing the point, or None."""
+        for win in self._cells.get((x // self._cell_size, y // self._cell_size), ()):
+            rect = win.rect
+            if rect.x <= x <= rect.x + rect.width and rect.y <= y <= rect.y + rect.height:
+                return win
+        return None
+
+    def at_points(self, points: Sequence[Point | tuple[int, int]]) -> list[WindowInfo | None]:
+        return [self.at(p.x, p.y) if isinstance(p, Point) else self.at(p[0], p[1]) for p in points]
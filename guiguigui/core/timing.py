@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+
+from .types import TimingProfile
+
+PROFILES: dict[str, TimingProfile] = {
+    profile.name: profile
+    for profile in (
+        TimingProfile("human", 0.06, 0.1, 0.04, 0.05, 0.03),
+        TimingProfile("default", 0.02, 0.05, 0.01, 0.02, 0.01),
+        TimingProfile("fast", 0.002, 0.005, 0.001, 0.002, 0.0),
+        TimingProfile("zero", 0.0, 0.0, 0.0, 0.0, 0.0, sync=True),
+    )
+}
+
+
+class Timing:
+    """Selects the timing profile used by mouse and keyboard operations.
+
+    A profile passed to a call wins over one selected for the current thread
+    with ``use()``, which wins over the global one set with ``set()``.
+    """
+
+    def __init__(self):
+        self._global = PROFILES["default"]
+        self._local = threading.local()
+
+    def register(self, profile: TimingProfile) -> None:
+        PROFILES[profile.name] = profile
+
+    def get(self, name: str) -> TimingProfile:
+        try:
+            return PROFILES[name]
+        except KeyError:
+            raise ValueError(f"Unknown timing profile: {name!r}") from None
+
+    def set(self, profile: TimingProfile | str) -> None:
+        """Select the profile for every thread without one of its own."""
+        self._global = self.resolve(profile)
+
+    def current(self) -> TimingProfile:
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else self._global
+
+    def resolve(self, profile: TimingProfile | str | None = None) -> TimingProfile:
+        if profile is None:
+            return self.current()
+        if isinstance(profile, str):
+            return self.get(profile)
+        return profile
+
+    @contextmanager
+    def use(self, profile: TimingProfile | str) -> Generator[TimingProfile, None, None]:
+        """Select a profile for the current thread inside the block."""
+        resolved = self.resolve(profile)
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(resolved)
+        try:
+            yield resolved
+        finally:
+            stack.pop()
+
+    @staticmethod
+    def pause(
+        seconds: float, profile: TimingProfile, sync: Callable[[], None] | None = None
+    ) -> None:
+        """Sleep for ``seconds``; for a zero pause, call ``sync`` if the profile asks to."""
+        if seconds > 0:
+            time.sleep(seconds)
+        elif sync is not None and profile.sync:
+            sync()
+
+
+timing = Timing()
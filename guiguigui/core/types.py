@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+from enum import Enum, IntFlag
 from typing import Any
 
 
@@ -195,17 +196,246 @@ class WindowInfo:
     display: DisplayInfo | None = None
 
 
-@dataclass
+WINDOW_INFO_FIELDS = frozenset(f.name for f in fields(WindowInfo))
+
+
+class LazyWindowInfo(WindowInfo):
+    """WindowInfo whose fields are read from the backend on first access.
+
+    ``loader(info, name)`` is called for a field that has not been set yet and
+    must set it, typically together with the same field of other windows
+    listed at the same time.
+    """
+
+    def __init__(
+        self,
+        handle: Any,
+        loader: Callable[[LazyWindowInfo, str], None] | None = None,
+        **values: Any,
+    ) -> None:
+        self.handle = handle
+        self._loader = loader
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes that have not been set yet
+        loader = self.__dict__.get("_loader")
+        if name not in WINDOW_INFO_FIELDS or loader is None:
+            raise AttributeError(name)
+        loader(self, name)
+        return self.__dict__[name]
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self.__dict__
+
+
+class Modifier(IntFlag):
+    """Bits of the modifier mask carried by keyboard events."""
+
+    SHIFT = 1
+    CTRL = 2
+    ALT = 4
+    SUPER = 8
+
+
+# The Key reported for each modifier bit
+MODIFIER_KEYS = {
+    Modifier.SHIFT: Key.SHIFT,
+    Modifier.CTRL: Key.CTRL,
+    Modifier.ALT: Key.ALT,
+    Modifier.SUPER: Key.SUPER,
+}
+
+_MODIFIER_BITS = {key: bit for bit, key in MODIFIER_KEYS.items()}
+
+# Button of a raw mouse event row, indexed by its button code (0 for motion)
+MOUSE_EVENT_BUTTONS: tuple[MouseButton | None, ...] = (None, *MouseButton)
+
+
+@dataclass(slots=True)
 class MouseEvent:
-    position: Point
+    x: int
+    y: int
     button: MouseButton | None
     pressed: bool
     timestamp: float
 
+    @property
+    def position(self) -> Point:
+        return Point(self.x, self.y)
+
+    def row(self) -> tuple[int, int, int, bool, float]:
+        """The raw row form of batch hooks: (x, y, button code, pressed, timestamp)."""
+        return (
+            self.x,
+            self.y,
+            MOUSE_EVENT_BUTTONS.index(self.button),
+            self.pressed,
+            self.timestamp,
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class KeyboardEvent:
     key: Key | str
     pressed: bool
-    modifiers: set[Key]
+    modifier_mask: Modifier
     timestamp: float
+
+    def __post_init__(self) -> None:
+        mask: Any = self.modifier_mask
+        if isinstance(mask, Modifier):
+            return
+        if isinstance(mask, (set, frozenset)):
+            # A set of modifier keys, as events carried before the mask
+            bits = Modifier(0)
+            for key in mask:
+                bit = _MODIFIER_BITS.get(key)
+                if bit is None:
+                    raise ValueError(f"{key!r} is not a modifier key")
+                bits |= bit
+            self.modifier_mask = bits
+        else:
+            self.modifier_mask = Modifier(mask)
+
+    @property
+    def modifiers(self) -> set[Key]:
+        return {key for bit, key in MODIFIER_KEYS.items() if self.modifier_mask & bit}
+
+
+# Event kinds an EventFilter can select
+EVENT_TYPES = frozenset({"move", "press", "release"})
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Which events a hook wants, so backends can drop the rest before decoding them.
+
+    ``None`` fields match everything. ``types`` is a subset of ``EVENT_TYPES``;
+    ``buttons`` limits button events and ``keys`` key events; ``region``
+    keeps pointer events inside a rectangle (edges included, like
+    ``Rect.contains()``); ``motion_rate`` keeps at most that many moves per
+    second of event time. Motion sampling keeps state for one hook, so only
+    ``predicate()`` applies it.
+    """
+
+    types: frozenset[str] | None = None
+    buttons: frozenset[MouseButton] | None = None
+    keys: frozenset[Key | str] | None = None
+    region: Rect | None = None
+    motion_rate: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.types is not None and not self.types <= EVENT_TYPES:
+            unknown = ", ".join(sorted(self.types - EVENT_TYPES))
+            raise ValueError(f"Unknown event type(s): {unknown}")
+        if self.motion_rate is not None and self.motion_rate <= 0:
+            raise ValueError(f"Motion rate must be positive, got {self.motion_rate}")
+
+    @property
+    def motion_interval(self) -> float:
+        """Minimum seconds between two accepted moves."""
+        return 1 / self.motion_rate if self.motion_rate else 0.0
+
+    def wants(self, event_type: str) -> bool:
+        return self.types is None or event_type in self.types
+
+    def accepts(self, ev: MouseEvent | KeyboardEvent) -> bool:
+        if isinstance(ev, KeyboardEvent):
+            return self.wants("press" if ev.pressed else "release") and (
+                self.keys is None or ev.key in self.keys
+            )
+        if ev.button is None:
+            if not self.wants("move"):
+                return False
+        elif not self.wants("press" if ev.pressed else "release") or (
+            self.buttons is not None and ev.button not in self.buttons
+        ):
+            return False
+        return self.region is None or self.region.contains(Point(ev.x, ev.y))
+
+    def predicate(self) -> Callable[[MouseEvent | KeyboardEvent], bool]:
+        """``accepts()`` plus motion sampling, with fresh sampling state for one hook."""
+        interval = self.motion_interval
+        if not interval:
+            return self.accepts
+        last_move = float("-inf")
+
+        def accept(ev: MouseEvent | KeyboardEvent) -> bool:
+            nonlocal last_move
+            if not self.accepts(ev):
+                return False
+            if isinstance(ev, MouseEvent) and ev.button is None:
+                if ev.timestamp - last_move < interval:
+                    return False
+                last_move = ev.timestamp
+            return True
+
+        return accept
+
+
+@dataclass
+class MouseState:
+    position: Point
+    buttons: frozenset[MouseButton]
+
+    def is_pressed(self, button: MouseButton) -> bool:
+        return button in self.buttons
+
+
+@dataclass
+class KeyboardState:
+    pressed: frozenset[Key]
+
+    def is_pressed(self, key: Key) -> bool:
+        return key in self.pressed
+
+
+@dataclass
+class MotionReport:
+    """Planned versus actual timing of one timed pointer move."""
+
+    planned: float
+    actual: float
+    steps: int
+    dropped: int
+    rate: float
+    max_lateness: float
+
+    @property
+    def error(self) -> float:
+        return self.actual - self.planned
+
+
+@dataclass
+class PathReport:
+    """Pointer motion in a macro before and after ``Macro.optimize()``."""
+
+    moves: int
+    points: int
+    replay_events: int
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of recorded move steps removed by simplification."""
+        return 1 - self.points / self.moves if self.moves else 0.0
+
+
+@dataclass(frozen=True)
+class TimingProfile:
+    """Pauses, in seconds, inserted around injected input.
+
+    With ``sync``, a pause of zero that keeps events in order (the press
+    before a drag moves, modifiers before a hotkey's key) becomes a server
+    round trip instead of being dropped.
+    """
+
+    name: str
+    click_hold: float  # press to release in a click
+    drag_settle: float  # after the press and before the release of a drag
+    key_hold: float  # press to release in a tap or typed character
+    hotkey_hold: float  # with every hotkey key held down
+    hotkey_interval: float  # between the keys of a hotkey
+    sync: bool = False
+    confirm_timeout: float = 1.0  # how long confirm=True waits for delivery
@@ -1,22 +1,460 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
 import re
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Collection, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
 
 from ..backend import get_backend
-from .types import Rect, WindowInfo, WindowState
+from ..backend.base import Backend
+from .spatial import WindowGrid
+from .types import Point, Rect, WindowInfo, WindowState
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass
+class _WindowQuery:
+    """Search criteria normalised once per query instead of once per candidate."""
+
+    title: str | None = None
+    pattern: re.Pattern[str] | None = None
+    class_name: str | None = None
+    pid: int | None = None
+    process_name: str | None = None
+    predicate: Callable[[WindowInfo], bool] | None = None
+
+    @classmethod
+    def create(
+        cls,
+        title: str | None,
+        class_name: str | None,
+        pid: int | None,
+        process_name: str | None,
+        regex: bool,
+        predicate: Callable[[WindowInfo], bool] | None,
+    ) -> _WindowQuery:
+        return cls(
+            title=title.lower() if title and not regex else None,
+            pattern=_compile_pattern(title) if title and regex else None,
+            class_name=class_name.lower() if class_name else None,
+            pid=pid,
+            process_name=process_name.lower() if process_name else None,
+            predicate=predicate,
+        )
+
+    def fields(self) -> set[str]:
+        """Return the WindowInfo fields the criteria read."""
+        names = set()
+        if self.title is not None or self.pattern is not None:
+            names.add("title")
+        if self.class_name is not None:
+            names.add("class_name")
+        if self.pid is not None:
+            names.add("pid")
+        if self.process_name is not None:
+            names.add("process_name")
+        return names
+
+    def matches(
+        self, win: WindowInfo, title_lower: str | None = None, class_lower: str | None = None
+    ) -> bool:
+        if self.pid is not None and win.pid != self.pid:
+            return False
+        if self.process_name is not None and self.process_name != win.process_name.lower():
+            return False
+        if self.class_name is not None:
+            if class_lower is None:
+                class_lower = win.class_name.lower()
+            if self.class_name not in class_lower:
+                return False
+        if self.title is not None:
+            if title_lower is None:
+                title_lower = win.title.lower()
+            if self.title not in title_lower:
+                return False
+        if self.pattern is not None and not self.pattern.search(win.title):
+            return False
+        return self.predicate is None or self.predicate(win)
+
+
+class _QueryIndex:
+    """Secondary indexes over window records.
+
+    pid, class name and process name are hashed; titles are indexed by
+    lower-cased trigrams. A query starts from the smallest candidate set any
+    of its criteria yields and verifies the remaining criteria on those
+    candidates only.
+    """
+
+    def __init__(self) -> None:
+        self._seq = 0
+        self._records: dict[Any, tuple[int, WindowInfo, str, str]] = {}
+        self._by_pid: dict[int, set[Any]] = {}
+        self._by_class: dict[str, set[Any]] = {}
+        self._by_process: dict[str, set[Any]] = {}
+        self._by_trigram: dict[str, set[Any]] = {}
+
+    def add(self, win: WindowInfo) -> None:
+        previous = self._records.get(win.handle)
+        if previous is not None:
+            self.remove(win.handle)
+            seq = previous[0]
+        else:
+            self._seq += 1
+            seq = self._seq
+        title = win.title.lower()
+        class_name = win.class_name.lower()
+        self._records[win.handle] = (seq, win, title, class_name)
+        self._by_pid.setdefault(win.pid, set()).add(win.handle)
+        self._by_class.setdefault(class_name, set()).add(win.handle)
+        self._by_process.setdefault(win.process_name.lower(), set()).add(win.handle)
+        for gram in _trigrams(title):
+            self._by_trigram.setdefault(gram, set()).add(win.handle)
+
+    def remove(self, handle: Any) -> None:
+        record = self._records.pop(handle, None)
+        if record is None:
+            return
+        _, win, title, class_name = record
+        self._discard(self._by_pid, win.pid, handle)
+        self._discard(self._by_class, class_name, handle)
+        self._discard(self._by_process, win.process_name.lower(), handle)
+        for gram in _trigrams(title):
+            self._discard(self._by_trigram, gram, handle)
+
+    @staticmethod
+    def _discard(index: dict[Any, set[Any]], key: Any, handle: Any) -> None:
+        handles = index.get(key)
+        if handles is not None:
+            handles.discard(handle)
+            if not handles:
+                del index[key]
+
+    def _candidates(self, query: _WindowQuery) -> set[Any] | None:
+        """Return the most selective candidate set, or None to scan everything."""
+        options: list[set[Any]] = []
+        if query.pid is not None:
+            options.append(self._by_pid.get(query.pid, set()))
+        if query.process_name is not None:
+            options.append(self._by_process.get(query.process_name, set()))
+        if query.title is not None and len(query.title) >= 3:
+            postings = sorted(
+                (self._by_trigram.get(gram, set()) for gram in _trigrams(query.title)), key=len
+            )
+            options.append(set.intersection(*postings))
+        if query.class_name is not None:
+            matched: set[Any] = set()
+            for name, handles in self._by_class.items():
+                if query.class_name in name:
+                    matched |= handles
+            options.append(matched)
+        return min(options, key=len) if options else None
+
+    def query(self, query: _WindowQuery) -> list[WindowInfo]:
+        candidates = self._candidates(query)
+        if candidates is None:
+            records = list(self._records.values())
+        else:
+            records = sorted((self._records[h] for h in candidates), key=lambda r: r[0])
+        return [
+            win
+            for _, win, title, class_name in records
+            if query.matches(win, title_lower=title, class_lower=class_name)
+        ]
+
+
+@dataclass
+class WindowIndexStats:
+    live: bool
+    windows: int
+    pending: int
+    events: int
+    refreshes: int
+    since_refresh: float
+    since_event: float | None
+
+
+class WindowIndex:
+    """Window records kept current from backend window events.
+
+    Lookups are dictionary hits. Events only mark windows as changed; changed
+    windows are re-read from the backend on the next lookup. Backends that
+    cannot report window events still get a snapshot that is updated by
+    ``refresh()``.
+
+    Point hit-tests are answered from a WindowGrid over the snapshot in
+    stacking order. The grid is dropped when a window event changes the
+    snapshot or the stacking order and rebuilt on the next hit-test.
+    """
+
+    def __init__(self, backend: Backend):
+        self._backend = backend
+        self._lock = threading.RLock()
+        self._windows: dict[Any, WindowInfo] = {}
+        self._queries = _QueryIndex()
+        self._dirty: set[Any] = set()
+        self._active: Any = None
+        # Handles topmost first; re-read from the backend after a "restacked" event
+        self._stacking: list[Any] = []
+        self._restacked = False
+        self._grid: WindowGrid | None = None
+        self._watch: Any = None
+        self._events = 0
+        self._refreshes = 0
+        self._refreshed_at = 0.0
+        self._event_at: float | None = None
+
+    @property
+    def live(self) -> bool:
+        return self._watch is not None
+
+    def start(self) -> None:
+        try:
+            self._watch = self._backend.watch_windows(self._on_event)
+        except NotImplementedError:
+            self._watch = None
+        self.refresh()
+
+    def stop(self) -> None:
+        if self._watch is not None:
+            self._backend.unwatch_windows(self._watch)
+            self._watch = None
+
+    def refresh(self) -> None:
+        """Re-read every window from the backend."""
+        windows = self._backend.list_windows(visible_only=False)
+        active = self._backend.get_active_window()
+        with self._lock:
+            self._windows = {w.handle: w for w in windows}
+            self._queries = _QueryIndex()
+            for w in windows:
+                self._queries.add(w)
+            self._dirty.clear()
+            self._stacking = [w.handle for w in windows]
+            if not self._backend.windows_topmost_first:
+                self._stacking.reverse()
+            self._restacked = False
+            self._grid = None
+            self._active = active.handle if active is not None else None
+            self._refreshes += 1
+            self._refreshed_at = time.monotonic()
+
+    def stats(self) -> WindowIndexStats:
+        now = time.monotonic()
+        with self._lock:
+            return WindowIndexStats(
+                live=self.live,
+                windows=len(self._windows),
+                pending=len(self._dirty),
+                events=self._events,
+                refreshes=self._refreshes,
+                since_refresh=now - self._refreshed_at,
+                since_event=now - self._event_at if self._event_at is not None else None,
+            )
+
+    def _on_event(self, kind: str, handle: Any) -> None:
+        with self._lock:
+            self._events += 1
+            self._event_at = time.monotonic()
+            if kind == "destroyed":
+                self._windows.pop(handle, None)
+                self._queries.remove(handle)
+                self._dirty.discard(handle)
+                self._grid = None
+            elif kind == "active":
+                self._active = handle or None
+            elif kind == "restacked":
+                self._restacked = True
+                self._grid = None
+            elif kind == "created" or handle in self._windows:
+                self._dirty.add(handle)
+
+    def _resolve(self) -> None:
+        """Re-read the windows changed since the last lookup."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        for handle in dirty:
+            info = self._backend.get_window_info(handle)
+            with self._lock:
+                self._grid = None
+                if info is None:
+                    self._windows.pop(handle, None)
+                    self._queries.remove(handle)
+                else:
+                    if handle not in self._windows:
+                        # New windows open on top until the backend reports a restack
+                        if handle in self._stacking:
+                            self._stacking.remove(handle)
+                        self._stacking.insert(0, handle)
+                    self._windows[handle] = info
+                    self._queries.add(info)
+
+    def get(self, handle: Any) -> WindowInfo | None:
+        if self._dirty:
+            self._resolve()
+        with self._lock:
+            info = self._windows.get(handle)
+            if info is not None and info.is_active != (handle == self._active):
+                info = dataclasses.replace(info, is_active=handle == self._active)
+                self._windows[handle] = info
+            return info
+
+    def windows(self, visible_only: bool = True) -> list[WindowInfo]:
+        if self._dirty:
+            self._resolve()
+        with self._lock:
+            handles = list(self._windows)
+        windows = [self.get(handle) for handle in handles]
+        return [w for w in windows if w is not None and (w.is_visible or not visible_only)]
+
+    def active(self) -> WindowInfo | None:
+        return self.get(self._active) if self._active is not None else None
+
+    def _hit_grid(self) -> WindowGrid:
+        if self._dirty:
+            self._resolve()
+        if self._restacked:
+            self._restacked = False
+            stacking = self._backend.window_stacking()
+            with self._lock:
+                self._stacking = stacking
+                self._grid = None
+        with self._lock:
+            if self._grid is None:
+                windows = self._windows
+                visible = [
+                    windows[h] for h in self._stacking if h in windows and windows[h].is_visible
+                ]
+                self._stacking = [h for h in self._stacking if h in windows]
+                self._grid = WindowGrid(visible, topmost_first=True)
+            return self._grid
+
+    def at(self, x: int, y: int) -> WindowInfo | None:
+        """Return the topmost visible window containing the point."""
+        win = self._hit_grid().at(x, y)
+        return self.get(win.handle) if win is not None else None
+
+    def at_points(self, points: Sequence[Point | tuple[int, int]]) -> list[WindowInfo | None]:
+        """Return the topmost visible window under each point."""
+        hits = self._hit_grid().at_points(points)
+        return [self.get(win.handle) if win is not None else None for win in hits]
+
+    def _query(self, query: _WindowQuery, visible_only: bool) -> list[WindowInfo]:
+        if self._dirty:
+            self._resolve()
+        with self._lock:
+            matches = self._queries.query(query)
+        windows = [self.get(w.handle) for w in matches if w.is_visible or not visible_only]
+        return [w for w in windows if w is not None]
 
 
 class Window:
     def __init__(self):
         self._backend = get_backend()
-
-    def list(self, visible_only: bool = True) -> list[WindowInfo]:
+        self._index: WindowIndex | None = None
+
+    @property
+    def live_index(self) -> WindowIndex | None:
+        return self._index
+
+    def enable_live_index(self) -> WindowIndex:
+        """Serve lookups from a WindowIndex kept current by window events."""
+        if self._index is None:
+            self._index = WindowIndex(self._backend)
+            self._index.start()
+        return self._index
+
+    def disable_live_index(self) -> None:
+        if self._index is not None:
+            self._index.stop()
+            self._index = None
+
+    def list(
+        self, visible_only: bool = True, fields: Collection[str] | None = None
+    ) -> list[WindowInfo]:
+        """List windows.
+
+        ``fields`` names the WindowInfo fields the caller needs. Backends that
+        support it only read those up front and read the others on first
+        access, batched across the listed windows.
+        """
+        if self._index is not None:
+            return self._index.windows(visible_only)
+        if fields is not None:
+            return list(self._backend.iter_windows(visible_only, fields=fields))
         return self._backend.list_windows(visible_only)
 
     def active(self) -> WindowInfo | None:
+        if self._index is not None:
+            return self._index.active()
         return self._backend.get_active_window()
 
+    def iter(
+        self,
+        title: str | None = None,
+        class_name: str | None = None,
+        pid: int | None = None,
+        process_name: str | None = None,
+        regex: bool = False,
+        predicate: Callable[[WindowInfo], bool] | None = None,
+        visible_only: bool = True,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[WindowInfo]:
+        """Yield matching windows as the backend reads them.
+
+        The pid and class name criteria are passed down so the backend can
+        skip windows early, and callers can stop at the first hit without
+        paying for the rest of the enumeration. ``fields`` works as in
+        ``list()``; fields used by the criteria are always read up front.
+        """
+        query = _WindowQuery.create(title, class_name, pid, process_name, regex, predicate)
+        if self._index is not None:
+            yield from self._index._query(query, visible_only)
+            return
+        if fields is not None:
+            fields = set(fields) | query.fields()
+        windows = self._backend.iter_windows(
+            visible_only, pid=pid, class_name=class_name, fields=fields
+        )
+        for win in windows:
+            if query.matches(win):
+                yield win
+
+    def find_all(
+        self,
+        title: str | None = None,
+        class_name: str | None = None,
+        pid: int | None = None,
+        process_name: str | None = None,
+        regex: bool = False,
+        predicate: Callable[[WindowInfo], bool] | None = None,
+        visible_only: bool = True,
+        fields: Collection[str] | None = None,
+    ) -> list[WindowInfo]:
+        """Find every window matching the given criteria.
+
+        The secondary indexes (pid, class, process name and title trigrams)
+        only exist in the live index, so only ``enable_live_index()`` makes
+        this faster than a scan. Without it the backend's windows are
+        streamed through the query once, as in ``iter()``.
+        """
+        windows = self.iter(
+            title, class_name, pid, process_name, regex, predicate, visible_only, fields
+        )
+        return list(windows)
+
     def find(
         self,
         title: str | None = None,
@@ -25,38 +463,21 @@ class Window:
         process_name: str | None = None,
         regex: bool = False,
         predicate: Callable[[WindowInfo], bool] | None = None,
+        visible_only: bool = True,
+        fields: Collection[str] | None = None,
     ) -> WindowInfo | None:
         """Find a window matching the given criteria.
 
         Returns the first matching window or None if not found.
         """
-        windows = self.list(visible_only=True)
-
-        for win in windows:
-            if title:
-                if regex:
-                    if not re.search(title, win.title):
-                        continue
-                elif title.lower() not in win.title.lower():
-                    continue
-
-            if class_name and class_name.lower() not in win.class_name.lower():
-                continue
-
-            if pid is not None and win.pid != pid:
-                continue
-
-            if process_name and process_name.lower() != win.process_name.lower():
-                continue
-
-            if predicate and not predicate(win):
-                continue
-
-            return win
-
-        return None
+        windows = self.iter(
+            title, class_name, pid, process_name, regex, predicate, visible_only, fields
+        )
+        return next(windows, None)
 
     def at_point(self, x: int, y: int) -> WindowInfo | None:
+        if self._index is not None:
+            return self._index.at(x, y)
         return self._backend.get_window_at(x, y)
 
     # Alias for at_point
@@ -64,6 +485,16 @@ class Window:
         """Alias for at_point()"""
         return self.at_point(x, y)
 
+    def at_points(self, points: Sequence[Point | tuple[int, int]]) -> list[WindowInfo | None]:
+        """Return the topmost window under each point, hit-testing one window snapshot.
+
+        With a live index the points are hit-tested against its grid, which is
+        kept across calls; otherwise each call takes a fresh snapshot.
+        """
+        if self._index is not None:
+            return self._index.at_points(points)
+        return self._backend.get_windows_at(points)
+
     def focus(self, window: WindowInfo | int) -> None:
         handle = window.handle if isinstance(window, WindowInfo) else window
         self._backend.focus_window(handle)
@@ -72,23 +503,28 @@ class Window:
         handle = window.handle if isinstance(window, WindowInfo) else window
         self._backend.close_window(handle)
 
+    def _lookup(self, handle: Any) -> WindowInfo:
+        if self._index is not None:
+            info = self._index.get(handle)
+            if info is not None:
+                return info
+        else:
+            for w in self.list(visible_only=False):
+                if w.handle == handle:
+                    return w
+        raise ValueError("Window not found")
+
     def position(self, window: WindowInfo | int) -> tuple[int, int]:
         if isinstance(window, WindowInfo):
             return (window.rect.x, window.rect.y)
-        windows = self.list(visible_only=False)
-        for w in windows:
-            if w.handle == window:
-                return (w.rect.x, w.rect.y)
-        raise ValueError("Window not found")
+        w = self._lookup(window)
+        return (w.rect.x, w.rect.y)
 
     def size(self, window: WindowInfo | int) -> tuple[int, int]:
         if isinstance(window, WindowInfo):
             return (window.rect.width, window.rect.height)
-        windows = self.list(visible_only=False)
-        for w in windows:
-            if w.handle == window:
-                return (w.rect.width, w.rect.height)
-        raise ValueError("Window not found")
+        w = self._lookup(window)
+        return (w.rect.width, w.rect.height)
 
     def move(self, window: WindowInfo | int, x: int, y: int) -> None:
         handle = window.handle if isinstance(window, WindowInfo) else window
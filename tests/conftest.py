@@ -7,8 +7,11 @@ import pytest
 from guiguigui.backend.base import Backend
 from guiguigui.core.types import (
     DisplayInfo,
+    EventFilter,
     Key,
+    KeyboardEvent,
     MouseButton,
+    MouseEvent,
     Point,
     Rect,
     Size,
@@ -23,9 +26,17 @@ class MockBackend(Backend):
         self._pressed_buttons: set[MouseButton] = set()
         self._pressed_keys: set[Key | str] = set()
         self._clipboard_text = ""
+        self.typed_text: list[str] = []
+        self.pasted_text: list[str] = []
         self._windows: list[WindowInfo] = []
         self._displays: list[DisplayInfo] = []
         self._active_window: WindowInfo | None = None
+        self._window_watchers: list[Any] = []
+        self._display_watchers: list[Any] = []
+        self.display_reads = 0
+        # handle -> (kind, callback, event_filter) of each hook_mouse()/hook_keyboard() call
+        self.hooks: dict[int, tuple[str, Any, EventFilter | None]] = {}
+        self._next_hook = 1
 
     def mouse_position(self) -> Point:
         return self._mouse_position
@@ -58,12 +69,13 @@ class MockBackend(Backend):
         return key in self._pressed_keys
 
     def key_type_unicode(self, text: str) -> None:
-        pass
+        self.typed_text.append(text)
 
     def get_keyboard_layout(self) -> str:
         return "en_US"
 
     def get_displays(self) -> list[DisplayInfo]:
+        self.display_reads += 1
         if not self._displays:
             self._displays = [
                 DisplayInfo(
@@ -98,6 +110,17 @@ class MockBackend(Backend):
                 return display
         return displays[0]
 
+    def watch_displays(self, callback: Any) -> Any:
+        self._display_watchers.append(callback)
+        return callback
+
+    def unwatch_displays(self, watch_handle: Any) -> None:
+        self._display_watchers.remove(watch_handle)
+
+    def emit_display_change(self) -> None:
+        for callback in list(self._display_watchers):
+            callback()
+
     def get_virtual_screen_rect(self) -> Rect:
         displays = self.get_displays()
         if not displays:
@@ -118,6 +141,17 @@ class MockBackend(Backend):
     def get_active_window(self) -> WindowInfo | None:
         return self._active_window
 
+    def watch_windows(self, callback: Any) -> Any:
+        self._window_watchers.append(callback)
+        return callback
+
+    def unwatch_windows(self, watch_handle: Any) -> None:
+        self._window_watchers.remove(watch_handle)
+
+    def emit_window_event(self, kind: str, handle: Any) -> None:
+        for callback in list(self._window_watchers):
+            callback(kind, handle)
+
     def get_window_at(self, x: int, y: int) -> WindowInfo | None:
         point = Point(x, y)
         for window in self._windows:
@@ -178,12 +212,47 @@ class MockBackend(Backend):
     def clipboard_set_text(self, text: str) -> None:
         self._clipboard_text = text
 
+    def clipboard_wait_consumed(self, timeout: float = 2.0) -> bool:
+        self.pasted_text.append(self._clipboard_text)
+        return True
+
+    def clipboard_save(self) -> Any:
+        return self._clipboard_text
+
+    def clipboard_restore(self, saved: Any) -> None:
+        self._clipboard_text = saved
+
     def clipboard_clear(self) -> None:
         self._clipboard_text = ""
 
     def clipboard_has_text(self) -> bool:
         return bool(self._clipboard_text)
 
+    def hook_mouse(self, callback: Any, event_filter: EventFilter | None = None) -> Any:
+        return self._add_hook("mouse", callback, event_filter)
+
+    def hook_keyboard(self, callback: Any, event_filter: EventFilter | None = None) -> Any:
+        return self._add_hook("keyboard", callback, event_filter)
+
+    def _add_hook(self, kind: str, callback: Any, event_filter: EventFilter | None) -> int:
+        handle = self._next_hook
+        self._next_hook += 1
+        self.hooks[handle] = (kind, callback, event_filter)
+        return handle
+
+    def unhook(self, hook_handle: Any) -> None:
+        self.hooks.pop(hook_handle, None)
+
+    def emit_mouse_event(self, ev: MouseEvent) -> None:
+        for kind, callback, _ in list(self.hooks.values()):
+            if kind == "mouse":
+                callback(ev)
+
+    def emit_keyboard_event(self, ev: KeyboardEvent) -> None:
+        for kind, callback, _ in list(self.hooks.values()):
+            if kind == "keyboard":
+                callback(ev)
+
     def check_permissions(self) -> dict[str, bool]:
         return {
             "accessibility": True,
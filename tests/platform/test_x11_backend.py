@@ -112,6 +112,50 @@ class TestX11KeyMapping:
             assert key in backend._key_code_map, f"Key {key} should be in key code map"
 
 
+class TestX11KeyTable:
+    """Test the keycode table built from the keyboard mapping."""
+
+    def test_every_key_member_mapped(self) -> None:
+        """Test that every Key member resolves, including F13-F20 and lock keys."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Key
+
+        backend = X11Backend()
+        for key in Key:
+            assert isinstance(backend._get_key_code(key), int), key
+
+    def test_key_value_and_alias_strings(self) -> None:
+        """Test that Key values, legacy names and X keysym names all resolve."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Key
+
+        backend = X11Backend()
+        pageup = backend._get_key_code(Key.PAGEUP)
+        assert backend._get_key_code("pageup") == pageup
+        assert backend._get_key_code("page_up") == pageup
+        assert backend._get_key_code("PageUp") == pageup
+        assert backend._get_key_code("Prior") == pageup
+        assert backend._get_key_code("A") == backend._get_key_code("a")
+
+    def test_mapping_notify_rebuilds_table(self) -> None:
+        """Test that a keyboard mapping change triggers a table rebuild."""
+        import time
+
+        from guiguigui.backend import x11
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        generation = x11._keymap_generation
+        backend.key_type_unicode("\u00a7\u2603")
+        deadline = time.monotonic() + 2.0
+        while x11._keymap_generation == generation and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert x11._keymap_generation != generation
+        backend._get_key_code("a")
+        assert backend._keymap_generation == x11._keymap_generation
+        backend._release_scratch_keycodes()
+
+
 class TestX11MouseButton:
     """Test mouse button operations for X11."""
 
@@ -316,23 +360,268 @@ class TestX11Window:
 
 
 class TestX11EventHooks:
-    """Test event hook methods."""
+    """Test global input hooks recorded through the RECORD extension."""
+
+    def test_hook_mouse_reports_motion(self) -> None:
+        """Test that injected pointer motion reaches a mouse hook."""
+        import threading
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Point
+
+        backend = X11Backend()
+        seen = threading.Event()
+        events: list = []
+
+        def on_mouse(ev) -> bool:
+            events.append(ev)
+            if ev.position == Point(123, 45):
+                seen.set()
+            return True
+
+        handle = backend.hook_mouse(on_mouse)
+        try:
+            backend.mouse_move_to(123, 45, confirm=True)
+            assert seen.wait(2.0)
+            assert events[-1].button is None
+            assert events[-1].position == Point(123, 45)
+        finally:
+            backend.unhook(handle)
+        assert backend._recorder is None
+
+    def test_hook_keyboard_reports_keys(self) -> None:
+        """Test that injected key presses reach a keyboard hook with their Key."""
+        import threading
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Key
+
+        backend = X11Backend()
+        released = threading.Event()
+        events: list = []
+
+        def on_key(ev) -> bool:
+            events.append(ev)
+            if ev.key == Key.F9 and not ev.pressed:
+                released.set()
+            return True
+
+        handle = backend.hook_keyboard(on_key)
+        try:
+            backend.key_press(Key.F9)
+            backend.key_release(Key.F9, confirm=True)
+            assert released.wait(2.0)
+            assert [(ev.key, ev.pressed) for ev in events if ev.key == Key.F9] == [
+                (Key.F9, True),
+                (Key.F9, False),
+            ]
+        finally:
+            backend.unhook(handle)
+
+    def test_hook_is_live_on_return(self) -> None:
+        """Test that input sent right after hook_keyboard() returns is recorded."""
+        import threading
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Key
+
+        backend = X11Backend()
+        pressed = threading.Event()
+
+        def on_key(ev) -> None:
+            if ev.key == Key.F10 and ev.pressed:
+                pressed.set()
+
+        handle = backend.hook_keyboard(on_key)
+        try:
+            assert backend._recorder is not None
+            assert backend._recorder._recording.is_set()
+            backend.key_press(Key.F10)
+            backend.key_release(Key.F10, confirm=True)
+            assert pressed.wait(2.0)
+        finally:
+            backend.unhook(handle)
+
+    def test_hook_mouse_batch(self) -> None:
+        """Test that batch hooks receive raw rows for recorded motion."""
+        import threading
 
-    def test_hook_methods_raise_not_implemented(self) -> None:
-        """Test that hook methods raise NotImplementedError."""
         from guiguigui.backend.x11 import X11Backend
 
         backend = X11Backend()
+        seen = threading.Event()
+        rows: list = []
+
+        def on_batch(batch: list) -> None:
+            assert len(batch) <= 4
+            rows.extend(batch)
+            if (300, 200) in [(x, y) for x, y, *_ in batch]:
+                seen.set()
+
+        handle = backend.hook_mouse_batch(on_batch, max_batch=4, max_latency=0.02, raw=True)
+        try:
+            with backend.batch():
+                for i in range(10):
+                    backend.mouse_move_to(291 + i, 200)
+            assert seen.wait(2.0)
+            assert rows[-1][2] == 0
+        finally:
+            backend.unhook(handle)
+
+    def test_hook_keyboard_filter(self) -> None:
+        """Test that a filtered keyboard hook records key presses of its keys only."""
+        import threading
+
+        from Xlib import X
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import EventFilter, Key
+
+        backend = X11Backend()
+        seen = threading.Event()
+        events: list = []
+
+        def on_key(ev) -> bool:
+            events.append(ev)
+            seen.set()
+            return True
+
+        event_filter = EventFilter(types=frozenset({"press"}), keys=frozenset({Key.F10}))
+        handle = backend.hook_keyboard(on_key, event_filter)
+        try:
+            assert backend._recorder._record_types == {X.KeyPress}
+            backend.key_press(Key.F9)
+            backend.key_release(Key.F9)
+            backend.key_press(Key.F10)
+            backend.key_release(Key.F10, confirm=True)
+            assert seen.wait(2.0)
+            assert [(ev.key, ev.pressed) for ev in events] == [(Key.F10, True)]
+        finally:
+            backend.unhook(handle)
+
+    def test_hooks_widen_live_context(self) -> None:
+        """Test that adding and removing hooks keeps the recording context and its reader."""
+        from Xlib import X
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import EventFilter
+
+        backend = X11Backend()
+        keys = backend.hook_keyboard(lambda ev: None, EventFilter(types=frozenset({"press"})))
+        try:
+            recorder = backend._recorder
+            assert recorder is not None
+            context, reader = recorder._context, recorder._reader
+            mouse = backend.hook_mouse(lambda ev: None)
+            assert recorder._record_types > {X.KeyPress, X.MotionNotify}
+            backend.unhook(mouse)
+            assert X.MotionNotify in recorder._record_types
+            assert recorder._details[X.MotionNotify] == frozenset()
+            assert recorder._context == context
+            assert recorder._reader is reader and reader.is_alive()
+        finally:
+            backend.unhook(keys)
+
+    def test_hook_hotkey(self) -> None:
+        """Test that a grabbed hotkey fires with and without NumLock/CapsLock."""
+        import threading
+
+        from Xlib import X
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Key, Modifier
+
+        backend = X11Backend()
+        fired = threading.Semaphore(0)
+        handle = backend.hook_hotkey(Key.F11, Modifier.CTRL | Modifier.ALT, fired.release)
+        try:
+            assert len(backend._hotkey_grabs) == 1
+            assert 0 in backend._hotkey_lock_masks
+            assert X.LockMask in backend._hotkey_lock_masks
+            for locked in (False, True):
+                if locked:
+                    backend.key_press(Key.CAPSLOCK)
+                    backend.key_release(Key.CAPSLOCK)
+                backend.key_press(Key.CTRL)
+                backend.key_press(Key.ALT)
+                backend.key_press(Key.F11)
+                backend.key_release(Key.F11)
+                backend.key_release(Key.ALT)
+                backend.key_release(Key.CTRL, confirm=True)
+                assert fired.acquire(timeout=2.0)
+            backend.key_press(Key.CAPSLOCK)
+            backend.key_release(Key.CAPSLOCK)
+        finally:
+            backend.unhook(handle)
+        assert not backend._hotkey_grabs
+
+    def test_hook_hotkey_while_events_flow(self) -> None:
+        """Test that hotkeys can be grabbed and released while the reader is handling events."""
+        import threading
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Key, Modifier
+
+        backend = X11Backend()
+        typist = X11Backend()
+        presses = threading.Semaphore(0)
+        flowing = backend.hook_hotkey(Key.F12, Modifier.CTRL, presses.release)
+        stop = threading.Event()
+
+        def type_hotkey() -> None:
+            while not stop.is_set():
+                typist.key_press(Key.CTRL)
+                typist.key_press(Key.F12)
+                typist.key_release(Key.F12)
+                typist.key_release(Key.CTRL, confirm=True)
+
+        thread = threading.Thread(target=type_hotkey)
+        thread.start()
+        try:
+            assert presses.acquire(timeout=2.0)
+            for _ in range(50):
+                handle = backend.hook_hotkey(Key.F11, Modifier.CTRL | Modifier.SHIFT, lambda: None)
+                backend.unhook(handle)
+            assert presses.acquire(timeout=2.0)
+        finally:
+            stop.set()
+            thread.join(timeout=2.0)
+            backend.unhook(flowing)
+        assert not backend._hotkey_grabs
+
+    def test_record_ranges(self) -> None:
+        """Test that recorded event types are grouped into contiguous ranges."""
+        from Xlib import X
+
+        from guiguigui.backend.x11 import _record_ranges
+
+        ranges = _record_ranges({X.KeyPress, X.ButtonPress, X.ButtonRelease, X.MotionNotify})
+        assert [r["device_events"] for r in ranges] == [
+            (X.KeyPress, X.KeyPress),
+            (X.ButtonPress, X.MotionNotify),
+        ]
+
+    def test_unhook_unknown_handle(self) -> None:
+        """Test that unhooking an unknown handle is ignored."""
+        from guiguigui.backend.x11 import X11Backend
 
-        # Hook methods should raise NotImplementedError
-        with pytest.raises(NotImplementedError):
-            backend.hook_mouse(lambda event: True)
+        X11Backend().unhook(12345)
 
-        with pytest.raises(NotImplementedError):
-            backend.hook_keyboard(lambda event: True)
+    def test_ring_drop_policies(self) -> None:
+        """Test that a full ring drops the oldest or the newest event."""
+        from guiguigui.backend.x11 import _EventRing
 
-        with pytest.raises(NotImplementedError):
-            backend.unhook(None)
+        for policy, kept in (("oldest", [(2,), (3,)]), ("newest", [(1,), (2,)])):
+            ring = _EventRing(2, policy)
+            for i in (1, 2, 3):
+                ring.put((i,))
+            assert ring.dropped == 1
+            assert ring.drain() == kept
+            ring.close()
+            assert ring.drain() is None
+
+        with pytest.raises(ValueError):
+            _EventRing(2, "block")
 
 
 class TestX11CoordinateSystem:
@@ -593,16 +882,69 @@ class TestX11KeyboardTyping:
 
         backend = X11Backend()
 
-        # Note: Will raise NotImplementedError, but test that it doesn't crash the backend
         try:
             backend.key_type_unicode("你好")
-        except NotImplementedError:
-            pass  # Expected for X11
+            keysyms = set(backend._scratch_bindings)
+            assert {0x01000000 | ord("你"), 0x01000000 | ord("好")} <= keysyms
+
+            # Characters outside the Basic Multilingual Plane get a spare keycode too
+            globe = 0x01000000 | ord("🌍")
+            backend.key_type_unicode("🌍", confirm=True)
+            keycode = backend._scratch_bindings[globe]
+            assert backend._display.get_keyboard_mapping(keycode, 1)[0][0] == globe
+        finally:
+            backend._release_scratch_keycodes()
+
+    def test_key_type_unicode_evicts_after_sync(self) -> None:
+        """Test that evicting a spare keycode mid-batch syncs first and registers one exit hook."""
+        from unittest import mock
 
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        backend._scratch_keycodes = backend._scratch_keycodes[:1]
+        with (
+            mock.patch.object(backend, "_safe_sync", wraps=backend._safe_sync) as sync,
+            mock.patch("atexit.register") as register,
+        ):
+            backend.key_type_unicode("你好你")
         try:
-            backend.key_type_unicode("🌍")
-        except NotImplementedError:
-            pass  # Expected for X11
+            assert sync.call_count >= 2
+            assert register.call_count == 1
+            assert list(backend._scratch_bindings) == [0x01000000 | ord("你")]
+        finally:
+            backend._release_scratch_keycodes()
+
+    def test_key_type_unicode_uses_shift(self) -> None:
+        """Test that shifted characters resolve to their keycode with Shift."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        codes = backend._keysym_codes
+        assert codes[ord("A")] == (codes[ord("a")][0], True)
+        assert codes[ord("!")][1]
+
+    def test_key_type_unicode_rejects_control_characters(self) -> None:
+        """Test that untypeable characters raise before anything is sent."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        with pytest.raises(ValueError):
+            backend.key_type_unicode("ab\x01")
+
+    @pytest.mark.slow
+    def test_key_type_unicode_throughput(self) -> None:
+        """Test that typing reaches thousands of characters per second."""
+        import time
+
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        text = "The quick brown fox jumps over the lazy dog! 0123456789\n" * 100
+        start = time.perf_counter()
+        backend.key_type_unicode(text, confirm=True)
+        chars_per_second = len(text) / (time.perf_counter() - start)
+        assert chars_per_second > 2000, f"{chars_per_second:.0f} chars/s"
 
     def test_key_type_unicode_special_chars(self) -> None:
         """Test typing special characters."""
@@ -1117,3 +1459,569 @@ class TestX11MouseMoveDuration:
 
         # Relative move with duration
         backend.mouse_move_rel(20, 20, duration=0.05)
+
+
+class TestX11BufferedInput:
+    """Test buffered input injection and asynchronous error collection."""
+
+    def test_batch_flushes_on_exit(self) -> None:
+        """Test that events queued in a batch are delivered when it closes."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import MouseButton
+
+        backend = X11Backend()
+
+        with backend.batch():
+            backend.mouse_move_to(120, 130)
+            backend.mouse_press(MouseButton.LEFT)
+            backend.mouse_release(MouseButton.LEFT)
+
+        pos = backend.mouse_position()
+        assert (pos.x, pos.y) == (120, 130)
+
+    def test_nested_batches(self) -> None:
+        """Test that only the outermost batch flushes."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+
+        with backend.batch():
+            with backend.batch():
+                backend.mouse_move_to(140, 150)
+            assert backend._batch_depth == 1
+        assert backend._batch_depth == 0
+
+    def test_confirm_syncs_once(self) -> None:
+        """Test that confirm waits for the server to process the event."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+
+        backend.mouse_move_to(160, 170, confirm=True)
+        pos = backend.mouse_position()
+        assert (pos.x, pos.y) == (160, 170)
+
+    def test_errors_collected_asynchronously(self) -> None:
+        """Test that X errors are collected instead of raised on flush."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        backend.drain_errors()
+
+        bogus = backend._display.create_resource_object("window", 0x3FFFFFFF)
+        bogus.configure(x=1)
+        backend._safe_sync()
+
+        assert len(backend.drain_errors()) == 1
+        assert backend.drain_errors() == []
+
+    def test_confirm_raises_only_its_own_errors(self) -> None:
+        """Test that confirm raises errors of its batch and leaves earlier ones collected."""
+        from Xlib import error
+
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        backend.drain_errors()
+        bogus = backend._display.create_resource_object("window", 0x3FFFFFFF)
+
+        bogus.configure(x=1)
+        backend.mouse_move_to(180, 190, confirm=True)
+        assert len(backend.drain_errors()) == 1
+
+        with pytest.raises(error.BadWindow):
+            with backend.batch(confirm=True):
+                backend.mouse_move_to(200, 210)
+                bogus.configure(x=2)
+        assert backend.drain_errors() == []
+
+
+class TestX11WindowEnumeration:
+    """Test EWMH-based, pipelined window enumeration."""
+
+    @staticmethod
+    def _create_windows(backend, count: int) -> list:
+        from Xlib import X
+
+        windows = []
+        for i in range(count):
+            win = backend._root.create_window(i % 100, i % 100, 50, 40, 0, X.CopyFromParent)
+            win.set_wm_name(f"guiguigui-test-{i}")
+            win.set_wm_class("guiguigui", "GuiGuiGuiTest")
+            win.map()
+            windows.append(win)
+        backend._display.sync()
+        return windows
+
+    @staticmethod
+    def _set_client_list(backend, windows: list) -> None:
+        from Xlib import X
+
+        atom = backend._display.get_atom("_NET_CLIENT_LIST_STACKING")
+        backend._root.change_property(atom, X.XA_WINDOW, 32, [w.id for w in windows])
+        backend._display.sync()
+
+    @staticmethod
+    def _cleanup(backend, windows: list) -> None:
+        backend._root.delete_property(backend._display.get_atom("_NET_CLIENT_LIST_STACKING"))
+        for win in windows:
+            win.destroy()
+        backend._display.sync()
+
+    def test_list_windows_uses_client_list(self) -> None:
+        """Test that only EWMH client windows are listed when the property exists."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        windows = self._create_windows(backend, 3)
+        try:
+            self._set_client_list(backend, windows)
+            listed = backend.list_windows(visible_only=False)
+            assert [w.handle for w in listed] == [w.id for w in windows]
+            assert listed[0].title == "guiguigui-test-0"
+            assert listed[0].class_name == "GuiGuiGuiTest"
+        finally:
+            self._cleanup(backend, windows)
+
+    def test_list_windows_falls_back_to_tree_walk(self) -> None:
+        """Test that the tree walk is used without an EWMH window manager."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        windows = self._create_windows(backend, 2)
+        try:
+            if backend._get_client_list() is not None:
+                pytest.skip("An EWMH window manager is running")
+            handles = [w.handle for w in backend.list_windows(visible_only=False)]
+            assert handles[0] == backend._root.id
+            assert all(w.id in handles for w in windows)
+        finally:
+            self._cleanup(backend, windows)
+
+    def test_list_windows_skips_destroyed_windows(self) -> None:
+        """Test that stale ids in the client list are ignored."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        windows = self._create_windows(backend, 2)
+        try:
+            self._set_client_list(backend, windows)
+            windows[0].destroy()
+            backend._display.sync()
+            listed = backend.list_windows(visible_only=False)
+            assert [w.handle for w in listed] == [windows[1].id]
+        finally:
+            self._cleanup(backend, windows[1:])
+
+    @pytest.mark.slow
+    def test_list_windows_benchmark_1000_windows(self) -> None:
+        """Test that enumerating 1,000 client windows meets the 100ms target."""
+        import time
+
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        windows = self._create_windows(backend, 1000)
+        try:
+            self._set_client_list(backend, windows)
+            backend.list_windows()  # Warm up the atom cache
+
+            start = time.perf_counter()
+            listed = backend.list_windows()
+            elapsed = time.perf_counter() - start
+
+            assert len(listed) == 1000
+            assert elapsed < 0.1, f"Enumerating 1000 windows took {elapsed * 1000:.1f}ms"
+        finally:
+            self._cleanup(backend, windows)
+
+
+class TestX11WindowWatch:
+    """Test window change notifications from the background event reader."""
+
+    def test_reader_connection_is_locked(self) -> None:
+        """Test that the reader connection shared with caller threads uses real locks."""
+        import threading
+
+        from guiguigui.backend.x11 import X11Backend
+
+        reader = X11Backend()._get_event_reader()
+        try:
+            lock = reader.display.display.send_recv_lock
+            assert isinstance(lock, type(threading.Lock()))
+        finally:
+            reader.close()
+
+    def test_watch_reports_title_change(self) -> None:
+        """Test that a title change on a client window is reported."""
+        import threading
+
+        from Xlib import X
+
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        win = backend._root.create_window(0, 0, 50, 40, 0, X.CopyFromParent)
+        atom = backend._display.get_atom("_NET_CLIENT_LIST_STACKING")
+        backend._root.change_property(atom, X.XA_WINDOW, 32, [win.id])
+        backend._display.sync()
+
+        changed = threading.Event()
+
+        def on_event(kind: str, handle: int) -> None:
+            if kind == "changed" and handle == win.id:
+                changed.set()
+
+        handle = backend.watch_windows(on_event)
+        try:
+            win.set_wm_name("renamed")
+            backend._display.sync()
+            assert changed.wait(2.0)
+            info = backend.get_window_info(win.id)
+            assert info is not None
+            assert info.title == "renamed"
+        finally:
+            backend.unwatch_windows(handle)
+            backend._root.delete_property(atom)
+            win.destroy()
+            backend._display.sync()
+
+
+class TestX11WindowStreaming:
+    """Test streaming window enumeration with filter pushdown."""
+
+    def test_iter_windows_pid_pushdown(self) -> None:
+        """Test that iter_windows only yields windows with the requested pid."""
+        from Xlib import X
+
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        atom_pid = backend._display.get_atom("_NET_WM_PID")
+        atom_list = backend._display.get_atom("_NET_CLIENT_LIST_STACKING")
+        windows = []
+        for pid in (111, 222, 111):
+            win = backend._root.create_window(0, 0, 50, 40, 0, X.CopyFromParent)
+            win.change_property(atom_pid, X.XA_CARDINAL, 32, [pid])
+            windows.append(win)
+        backend._root.change_property(atom_list, X.XA_WINDOW, 32, [w.id for w in windows])
+        backend._display.sync()
+        try:
+            found = list(backend.iter_windows(visible_only=False, pid=111))
+            assert [w.handle for w in found] == [windows[0].id, windows[2].id]
+            assert all(w.pid == 111 for w in found)
+
+            first = next(backend.iter_windows(visible_only=False, pid=222))
+            assert first.handle == windows[1].id
+        finally:
+            backend._root.delete_property(atom_list)
+            for win in windows:
+                win.destroy()
+            backend._display.sync()
+
+
+class TestX11LazyWindowInfo:
+    """Test on-demand window field fetching."""
+
+    def test_lazy_fields_fetched_in_batch(self) -> None:
+        """Test that touching a field on one window loads it for the whole batch."""
+        from Xlib import X
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import LazyWindowInfo
+
+        backend = X11Backend()
+        atom_list = backend._display.get_atom("_NET_CLIENT_LIST_STACKING")
+        windows = []
+        for i in range(3):
+            win = backend._root.create_window(10 * i, 0, 50, 40, 0, X.CopyFromParent)
+            win.set_wm_name(f"lazy-{i}")
+            windows.append(win)
+        backend._root.change_property(atom_list, X.XA_WINDOW, 32, [w.id for w in windows])
+        backend._display.sync()
+        try:
+            listed = list(backend.iter_windows(visible_only=False, fields=["rect"]))
+            assert all(isinstance(w, LazyWindowInfo) for w in listed)
+            assert all(w.is_loaded("rect") for w in listed)
+            assert not any(w.is_loaded("title") for w in listed)
+
+            assert listed[0].title == "lazy-0"
+            assert all(w.is_loaded("title") for w in listed)
+            assert [w.title for w in listed] == ["lazy-0", "lazy-1", "lazy-2"]
+        finally:
+            backend._root.delete_property(atom_list)
+            for win in windows:
+                win.destroy()
+            backend._display.sync()
+
+    def test_rect_defaults_not_shared(self) -> None:
+        """Test that each default rect is a separate object."""
+        from guiguigui.backend.x11 import _field_default
+        from guiguigui.core.types import Rect
+
+        first = _field_default("rect")
+        first.x = 5
+        assert _field_default("rect") == Rect(0, 0, 0, 0)
+        assert _field_default("client_rect") is not _field_default("client_rect")
+
+    def test_unknown_field_rejected(self) -> None:
+        """Test that unknown field names raise ValueError."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        with pytest.raises(ValueError):
+            list(backend.iter_windows(fields=["colour"]))
+
+
+class TestX11WindowHitTest:
+    """Test geometric hit-testing over top-level windows."""
+
+    def test_get_window_at_returns_topmost(self) -> None:
+        """Test that overlapping windows resolve to the one highest in the stack."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        windows = TestX11WindowEnumeration._create_windows(backend, 2)
+        try:
+            TestX11WindowEnumeration._set_client_list(backend, windows)
+            # Both windows cover (20, 20); the second is higher in the stack
+            assert backend.get_window_at(20, 20).handle == windows[1].id
+            hits = backend.get_windows_at([(20, 20), (5000, 5000)])
+            assert hits[0].handle == windows[1].id
+            assert hits[1] is None
+        finally:
+            TestX11WindowEnumeration._cleanup(backend, windows)
+
+
+class TestX11DisplayWatch:
+    """Test RandR change notifications for the display cache."""
+
+    def test_watch_displays_dispatches_randr_events(self) -> None:
+        """Test that RandR notifications reach registered watchers."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        calls = []
+        try:
+            handle = backend.watch_displays(lambda: calls.append(1))
+        except NotImplementedError:
+            pytest.skip("RandR not available")
+        backend._on_randr_notify(None)
+        backend.unwatch_displays(handle)
+        backend._on_randr_notify(None)
+        assert calls == [1]
+
+
+class TestX11DisplayDiscovery:
+    """Test RandR display discovery."""
+
+    def test_get_displays_uses_current_resources(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that plain discovery never forces a hardware probe."""
+        from Xlib.ext import randr
+
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        probes = []
+        original = randr.get_screen_resources
+        monkeypatch.setattr(
+            randr, "get_screen_resources", lambda w: probes.append(w) or original(w)
+        )
+        displays = backend.get_displays()
+        assert displays
+        assert sum(d.is_primary for d in displays) == 1
+        assert all(d.rotation in (0, 90, 180, 270) for d in displays)
+        current = randr.get_screen_resources_current(backend._root)
+        if current.outputs:
+            assert probes == []
+
+    def test_mode_refresh_rate(self) -> None:
+        """Test refresh rate computation from RandR mode timings."""
+        from types import SimpleNamespace
+
+        from guiguigui.backend.x11 import X11Backend
+
+        mode = SimpleNamespace(dot_clock=148500000, h_total=2200, v_total=1125, flags=0)
+        assert X11Backend._mode_refresh_rate(mode) == 60.0
+
+
+class TestX11ClipboardPaste:
+    """Test waiting for pasted clipboard text to be read."""
+
+    def test_wait_consumed_times_out_without_reader(self) -> None:
+        """Test that waiting returns False when nobody requests the clipboard."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        backend.clipboard_set_text("guiguigui paste test")
+        assert backend.clipboard_wait_consumed(timeout=0.05) is False
+
+
+class TestX11InputShadow:
+    """Test the shadow model of pointer, key and button state."""
+
+    def test_queries_share_one_round_trip(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that any number of state queries cost a single reconcile while fresh."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Key, MouseButton
+
+        backend = X11Backend()
+        backend.input_shadow_ttl = 60.0
+        syncs = []
+        original = backend._sync_input_shadow
+        monkeypatch.setattr(backend, "_sync_input_shadow", lambda: syncs.append(1) or original())
+
+        backend.mouse_position()
+        backend.mouse_is_pressed(MouseButton.LEFT)
+        backend.key_is_pressed(Key.SHIFT)
+        backend.keyboard_state()
+        backend.mouse_state()
+        assert len(syncs) == 1
+
+    def test_injections_update_shadow(self) -> None:
+        """Test that injected input is reflected without querying the server."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Key, MouseButton, Point
+
+        backend = X11Backend()
+        backend.input_shadow_ttl = 60.0
+        backend.mouse_move_to(15, 25)
+        backend.key_press(Key.SHIFT)
+        try:
+            assert backend.mouse_position() == Point(15, 25)
+            assert Key.SHIFT in backend.keyboard_state().pressed
+        finally:
+            backend.key_release(Key.SHIFT)
+        assert not backend.keyboard_state().is_pressed(Key.SHIFT)
+        assert not backend.mouse_state().is_pressed(MouseButton.LEFT)
+
+    def test_reconciles_with_server(self) -> None:
+        """Test that a stale shadow is replaced by the server's state."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Point
+
+        backend = X11Backend()
+        backend.mouse_move_to(40, 50, confirm=True)
+        backend.input_shadow_ttl = 0.0
+        backend._shadow_pointer = Point(-1, -1)
+        assert backend.mouse_position() == Point(40, 50)
+
+
+class TestX11RelativeMotion:
+    """Test XTest relative pointer motion."""
+
+    def test_move_rel_needs_no_pointer_query(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a burst of relative moves never queries the pointer."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        syncs = []
+        original = backend._sync_input_shadow
+        monkeypatch.setattr(backend, "_sync_input_shadow", lambda: syncs.append(1) or original())
+        with backend.batch():
+            for _ in range(100):
+                backend.mouse_move_rel(1, 0)
+                backend.mouse_move_rel(-1, 0)
+        assert syncs == []
+
+    def test_move_rel_moves_pointer(self) -> None:
+        """Test that a small relative move lands where expected."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Point
+
+        backend = X11Backend()
+        backend.mouse_move_to(100, 100)
+        backend.mouse_move_rel(3, -2, confirm=True)
+        assert backend.mouse_position() == Point(103, 98)
+
+
+class TestX11MotionPath:
+    """Test timed pointer paths submitted in one call."""
+
+    def test_move_path_reaches_end(self) -> None:
+        """Test that a timed path ends at its last point on schedule."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.motion import minimum_jerk, trajectory
+        from guiguigui.core.types import Point
+
+        backend = X11Backend()
+        backend.mouse_move_to(100, 100, confirm=True)
+        points, timestamps = trajectory(Point(100, 100), Point(400, 300), 0.2, 40, minimum_jerk)
+        report = backend.mouse_move_path(points, timestamps, confirm=True)
+        assert report.steps == 40
+        assert abs(report.error) < 0.01
+        assert backend.mouse_position() == Point(400, 300)
+
+    def test_timed_move_to_uses_path(self) -> None:
+        """Test that mouse_move_to with a duration ends at the target."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import Point
+
+        backend = X11Backend()
+        backend.mouse_move_to(50, 50, confirm=True)
+        backend.mouse_move_to(250, 150, duration=0.1, confirm=True)
+        assert backend.mouse_position() == Point(250, 150)
+
+
+class TestX11Acknowledge:
+    """Test waiting for injected input to be processed by the server."""
+
+    def test_acknowledge_returns_latency(self) -> None:
+        """Test that acknowledge() measures from the injection to the server reply."""
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import MouseButton
+
+        backend = X11Backend()
+        backend.mouse_press(MouseButton.LEFT)
+        backend.mouse_release(MouseButton.LEFT)
+        latency = backend.acknowledge(timeout=2.0)
+        assert latency is not None
+        assert 0 <= latency < 2.0
+
+    def test_acknowledge_without_input(self) -> None:
+        """Test that acknowledge() with nothing sent measures a bare round trip."""
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        backend.acknowledge()
+        latency = backend.acknowledge()
+        assert latency is not None
+        assert latency < 1.0
+
+    def test_acknowledge_timeout_resets_latency_start(self) -> None:
+        """Test that a timed-out acknowledge() does not leave the next one measuring from it."""
+        from unittest import mock
+
+        from guiguigui.backend.x11 import X11Backend
+        from guiguigui.core.types import MouseButton
+
+        backend = X11Backend()
+        backend.mouse_press(MouseButton.LEFT)
+        backend.mouse_release(MouseButton.LEFT)
+        with mock.patch("guiguigui.backend.x11._reply_arrived", return_value=False):
+            assert backend.acknowledge(timeout=0.05) is None
+        assert backend._input_sent_at is None
+
+    def test_acknowledge_raises_only_its_own_errors(self) -> None:
+        """Test that acknowledge() raises errors of the input it waited for, not earlier ones."""
+        from Xlib import error
+
+        from guiguigui.backend.x11 import X11Backend
+
+        backend = X11Backend()
+        backend.acknowledge()
+        backend.drain_errors()
+        bogus = backend._display.create_resource_object("window", 0x3FFFFFFF)
+
+        bogus.configure(x=1)
+        backend._safe_sync()
+        backend.mouse_move_to(60, 70)
+        backend.acknowledge(timeout=2.0)
+        assert len(backend.drain_errors()) == 1
+
+        with backend.batch():
+            backend.mouse_move_to(80, 90)
+            bogus.configure(x=2)
+        with pytest.raises(error.BadWindow):
+            backend.acknowledge(timeout=2.0)
+        assert backend.drain_errors() == []
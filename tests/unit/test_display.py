@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import pytest
+
 from guiguigui.core.display import Display
-from guiguigui.core.types import Rect
+from guiguigui.core.types import Point, Rect
 from tests.conftest import MockBackend
 
 
@@ -64,3 +66,97 @@ class TestDisplay:
         assert not secondary.is_primary
         assert secondary.scale == 2.0
         assert secondary.bounds == Rect(1920, 0, 1920, 1080)
+
+
+class TestDisplayCache:
+    def test_topology_read_once(self, mock_backend: MockBackend) -> None:
+        display = Display()
+        display.count()
+        display.at(100, 100)
+        display.primary()
+        display.to_physical(Point(2000, 100))
+        display.from_physical(Point(100, 100))
+
+        assert mock_backend.display_reads == 1
+        stats = display.cache_stats()
+        assert stats.live
+        assert stats.misses == 1
+        assert stats.hits == 4
+
+    def test_change_notification_invalidates(self, mock_backend: MockBackend) -> None:
+        display = Display()
+        assert display.count() == 2
+
+        mock_backend._displays = mock_backend._displays[:1]
+        assert display.count() == 2
+        mock_backend.emit_display_change()
+        assert display.count() == 1
+        assert display.cache_stats().invalidations == 1
+
+    def test_ttl_without_notifications(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def unsupported(callback: object) -> None:
+            raise NotImplementedError
+
+        monkeypatch.setattr(mock_backend, "watch_displays", unsupported)
+        display = Display(ttl=60.0)
+        display.count()
+        display.count()
+        assert mock_backend.display_reads == 1
+        assert not display.cache_stats().live
+
+        display.ttl = 0.0
+        display.count()
+        assert mock_backend.display_reads == 2
+
+    def test_close_stops_watching(self, mock_backend: MockBackend) -> None:
+        display = Display()
+        display.count()
+        display.close()
+        assert mock_backend._display_watchers == []
+
+    def test_refresh_probe(self, mock_backend: MockBackend) -> None:
+        display = Display()
+        display.count()
+        displays = display.refresh(probe=True)
+
+        assert len(displays) == 2
+        assert mock_backend.display_reads == 2
+        display.count()
+        assert mock_backend.display_reads == 2
+
+
+class TestDisplayBatchConversion:
+    POINTS = [(0, 0), (100, 50), (1920, 1080), (2000, 100), (3839, 1079), (5000, 5000), (-10, 7)]
+
+    def test_to_physical_many_matches_scalar(self, mock_backend: MockBackend) -> None:
+        display = Display()
+        expected = [display.to_physical(Point(x, y)) for x, y in self.POINTS]
+        assert display.to_physical_many(self.POINTS) == expected
+        assert display.to_physical_many([Point(x, y) for x, y in self.POINTS]) == expected
+
+    def test_from_physical_many_matches_scalar(self, mock_backend: MockBackend) -> None:
+        display = Display()
+        points = [*self.POINTS, (4500, 2000), (5761, 2161)]
+        expected = [display.from_physical(Point(x, y)) for x, y in points]
+        assert display.from_physical_many(points) == expected
+
+    def test_explicit_display(self, mock_backend: MockBackend) -> None:
+        display = Display()
+        secondary = display.list()[1]
+        assert display.to_physical_many([(1930, 10)], secondary) == [Point(1940, 20)]
+        assert display.from_physical_many([(1940, 20)], secondary) == [Point(1930, 10)]
+
+    def test_numpy_arrays(self, mock_backend: MockBackend) -> None:
+        np = pytest.importorskip("numpy")
+        display = Display()
+        points = np.array(self.POINTS)
+
+        physical = display.to_physical_many(points)
+        assert physical.shape == (len(self.POINTS), 2)
+        assert [Point(int(x), int(y)) for x, y in physical] == display.to_physical_many(self.POINTS)
+        logical = display.from_physical_many(physical)
+        assert [Point(int(x), int(y)) for x, y in logical] == display.from_physical_many(
+            [(int(x), int(y)) for x, y in physical]
+        )
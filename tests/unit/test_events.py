@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from guiguigui.core.events import _HAS_NUMPY, MOUSE_EVENT_DTYPE, Events
+from guiguigui.core.types import (
+    EventFilter,
+    Key,
+    KeyboardEvent,
+    Modifier,
+    MouseButton,
+    MouseEvent,
+    Point,
+    Rect,
+)
+from tests.conftest import MockBackend
+
+
+class TestEventRecords:
+    def test_slots(self) -> None:
+        ev = MouseEvent(1, 2, MouseButton.LEFT, True, 0.5)
+        assert not hasattr(ev, "__dict__")
+        assert ev.position == Point(1, 2)
+        assert ev.row() == (1, 2, 1, True, 0.5)
+        assert MouseEvent(3, 4, None, False, 0.0).row()[2] == 0
+
+    def test_modifier_mask(self) -> None:
+        ev = KeyboardEvent(Key.A, True, Modifier.SHIFT | Modifier.CTRL, 0.0)
+        assert ev.modifiers == {Key.SHIFT, Key.CTRL}
+        assert ev.modifier_mask & Modifier.CTRL
+        assert KeyboardEvent(Key.A, True, Modifier(0), 0.0).modifiers == set()
+
+    def test_modifier_mask_conversion(self) -> None:
+        mask = KeyboardEvent(Key.A, True, 3, 0.0).modifier_mask  # type: ignore[arg-type]
+        assert isinstance(mask, Modifier)
+        assert mask == Modifier.SHIFT | Modifier.CTRL
+        legacy = KeyboardEvent(Key.A, True, {Key.SHIFT, Key.ALT}, 0.0)  # type: ignore[arg-type]
+        assert legacy.modifier_mask == Modifier.SHIFT | Modifier.ALT
+        with pytest.raises(ValueError):
+            KeyboardEvent(Key.A, True, {Key.A}, 0.0)  # type: ignore[arg-type]
+
+
+class TestMouseBatch:
+    def test_fallback_delivers_lists(self, mock_backend: MockBackend) -> None:
+        batches: list[Any] = []
+        events = Events()
+        handle = events.on_mouse_batch(batches.append)
+        ev = MouseEvent(5, 6, None, False, 1.0)
+        mock_backend.emit_mouse_event(ev)
+        assert batches == [[ev]]
+        events.unhook(handle)
+        assert not events._hooks
+        assert not mock_backend.hooks
+
+    def test_as_array(self, mock_backend: MockBackend) -> None:
+        if not _HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        batches: list[Any] = []
+        Events().on_mouse_batch(batches.append, as_array=True)
+        mock_backend.emit_mouse_event(MouseEvent(5, 6, MouseButton.RIGHT, True, 1.5))
+        array = batches[0]
+        assert array.dtype == MOUSE_EVENT_DTYPE
+        assert array["x"].tolist() == [5]
+        assert array["button"].tolist() == [2]
+        assert array["pressed"].tolist() == [True]
+
+
+class TestEventFilter:
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            EventFilter(types=frozenset({"scroll"}))
+        with pytest.raises(ValueError):
+            EventFilter(motion_rate=0)
+        assert EventFilter(motion_rate=50).motion_interval == pytest.approx(0.02)
+
+    def test_accepts_mouse(self) -> None:
+        flt = EventFilter(
+            types=frozenset({"move", "press"}),
+            buttons=frozenset({MouseButton.LEFT}),
+            region=Rect(0, 0, 10, 10),
+        )
+        assert flt.accepts(MouseEvent(10, 10, None, False, 0.0))
+        assert flt.accepts(MouseEvent(1, 1, MouseButton.LEFT, True, 0.0))
+        assert not flt.accepts(MouseEvent(1, 1, MouseButton.LEFT, False, 0.0))
+        assert not flt.accepts(MouseEvent(1, 1, MouseButton.RIGHT, True, 0.0))
+        assert not flt.accepts(MouseEvent(11, 1, None, False, 0.0))
+
+    def test_accepts_keyboard(self) -> None:
+        flt = EventFilter(types=frozenset({"press"}), keys=frozenset({Key.A}))
+        assert flt.accepts(KeyboardEvent(Key.A, True, Modifier(0), 0.0))
+        assert not flt.accepts(KeyboardEvent(Key.A, False, Modifier(0), 0.0))
+        assert not flt.accepts(KeyboardEvent(Key.B, True, Modifier(0), 0.0))
+
+    def test_motion_sampling(self) -> None:
+        accept = EventFilter(motion_rate=10).predicate()
+        times = [0.0, 0.05, 0.1, 0.15, 0.25]
+        kept = [t for t in times if accept(MouseEvent(0, 0, None, False, t))]
+        assert kept == [0.0, 0.1, 0.25]
+        # Button events are never sampled away
+        assert accept(MouseEvent(0, 0, MouseButton.LEFT, True, 0.26))
+
+
+class TestHookFilters:
+    def test_unfiltered_hook_gets_callback(self, mock_backend: MockBackend) -> None:
+        events = Events()
+        events.on_keyboard(print)
+        assert list(mock_backend.hooks.values()) == [("keyboard", print, None)]
+
+    def test_python_fallback(self, mock_backend: MockBackend) -> None:
+        seen: list[Any] = []
+        Events().on_keyboard(seen.append, types="press", keys=["Enter", "é"])
+        [(_, _, event_filter)] = mock_backend.hooks.values()
+        assert event_filter is None
+        for ev in (
+            KeyboardEvent(Key.ENTER, True, Modifier(0), 0.0),
+            KeyboardEvent(Key.ENTER, False, Modifier(0), 0.0),
+            KeyboardEvent("é", True, Modifier(0), 0.0),
+            KeyboardEvent(Key.A, True, Modifier(0), 0.0),
+        ):
+            mock_backend.emit_keyboard_event(ev)
+        assert [(ev.key, ev.pressed) for ev in seen] == [(Key.ENTER, True), ("é", True)]
+
+    def test_pushdown(self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        events = Events()
+        monkeypatch.setattr(mock_backend, "hook_filters", True)
+        events.on_mouse(print, buttons=["left"], region=Rect(0, 0, 5, 5))
+        [(_, callback, event_filter)] = mock_backend.hooks.values()
+        assert callback is print
+        assert event_filter == EventFilter(
+            buttons=frozenset({MouseButton.LEFT}), region=Rect(0, 0, 5, 5)
+        )
+
+    def test_batch_fallback(self, mock_backend: MockBackend) -> None:
+        batches: list[Any] = []
+        Events().on_mouse_batch(batches.append, types=["press"])
+        mock_backend.emit_mouse_event(MouseEvent(1, 2, None, False, 0.0))
+        mock_backend.emit_mouse_event(MouseEvent(1, 2, MouseButton.LEFT, True, 0.0))
+        assert batches == [[MouseEvent(1, 2, MouseButton.LEFT, True, 0.0)]]
+
+
+class TestHotkeys:
+    def test_keyboard_hook_fallback(self, mock_backend: MockBackend) -> None:
+        hits: list[int] = []
+        events = Events()
+        handle = events.register_hotkey("ctrl+alt+k", lambda: hits.append(1))
+        emit = mock_backend.emit_keyboard_event
+        emit(KeyboardEvent(Key.K, True, Modifier.CTRL | Modifier.ALT, 0.0))
+        emit(KeyboardEvent(Key.K, False, Modifier.CTRL | Modifier.ALT, 0.0))
+        emit(KeyboardEvent(Key.K, True, Modifier.CTRL, 0.0))
+        emit(KeyboardEvent(Key.J, True, Modifier.CTRL | Modifier.ALT, 0.0))
+        assert hits == [1]
+        events.unhook(handle)
+        assert not events._hooks
+        assert not mock_backend.hooks
+
+
+class TestSequences:
+    def test_one_hook_for_all_sequences(self, mock_backend: MockBackend) -> None:
+        hits: list[str] = []
+        events = Events()
+        save = events.register_sequence("ctrl+x ctrl+s", lambda: hits.append("save"))
+        quit_ = events.register_sequence("ctrl+x ctrl+c", lambda: hits.append("quit"))
+        assert len(mock_backend.hooks) == 1
+        for key in (Key.X, Key.S, Key.X, Key.C):
+            mock_backend.emit_keyboard_event(KeyboardEvent(key, True, Modifier.CTRL, 0.0))
+            mock_backend.emit_keyboard_event(KeyboardEvent(key, False, Modifier.CTRL, 0.0))
+        assert hits == ["save", "quit"]
+
+        events.unhook(save)
+        assert len(mock_backend.hooks) == 1
+        events.unhook(quit_)
+        assert not mock_backend.hooks
+        assert not events._hooks
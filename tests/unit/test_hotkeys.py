@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+
+from guiguigui.core.hotkeys import KeyBindings, parse_chord, parse_key, parse_sequence
+from guiguigui.core.types import Key, KeyboardEvent, Modifier
+
+
+def press(key: Key | str, modifiers: int = 0, timestamp: float = 0.0) -> KeyboardEvent:
+    return KeyboardEvent(key, True, Modifier(modifiers), timestamp)
+
+
+class TestParse:
+    def test_chord(self) -> None:
+        assert parse_chord("ctrl+alt+k") == (Modifier.CTRL | Modifier.ALT, Key.K)
+        assert parse_chord("Cmd + Shift + F5") == (Modifier.SUPER | Modifier.SHIFT, Key.F5)
+        assert parse_chord("escape") == (Modifier(0), Key.ESC)
+        assert parse_chord("ctrl+KP_Add") == (Modifier.CTRL, "KP_Add")
+        with pytest.raises(ValueError):
+            parse_chord("hyper+k")
+        with pytest.raises(ValueError):
+            parse_chord("ctrl+")
+
+    def test_key_aliases(self) -> None:
+        assert parse_key("return") == Key.ENTER
+        assert parse_key(Key.COMMAND) == Key.SUPER
+        assert parse_key("é") == "é"
+
+    def test_sequence(self) -> None:
+        assert parse_sequence("ctrl+x ctrl+s") == (
+            (Modifier.CTRL, Key.X),
+            (Modifier.CTRL, Key.S),
+        )
+        assert parse_sequence(["ctrl+x", "k"]) == ((Modifier.CTRL, Key.X), (Modifier(0), Key.K))
+        with pytest.raises(ValueError):
+            parse_sequence("  ")
+
+
+class TestKeyBindings:
+    def test_chord_and_sequence(self) -> None:
+        hits: list[str] = []
+        bindings = KeyBindings()
+        bindings.bind("ctrl+alt+k", lambda: hits.append("k"))
+        bindings.bind("ctrl+x ctrl+s", lambda: hits.append("save"))
+        assert len(bindings) == 2
+
+        assert bindings.feed(press(Key.K, Modifier.CTRL | Modifier.ALT))
+        assert bindings.feed(press(Key.X, Modifier.CTRL))
+        assert bindings.pending
+        assert not bindings.feed(KeyboardEvent(Key.X, False, Modifier.CTRL, 0.0))
+        assert not bindings.feed(press(Key.CTRL, Modifier.CTRL))
+        assert bindings.feed(press(Key.S, Modifier.CTRL))
+        assert not bindings.pending
+        assert hits == ["k", "save"]
+        assert not bindings.feed(press(Key.S, Modifier.CTRL))
+
+    def test_mismatch_restarts_from_root(self) -> None:
+        hits: list[str] = []
+        bindings = KeyBindings()
+        bindings.bind("ctrl+x ctrl+s", lambda: hits.append("save"))
+        bindings.bind("ctrl+k", lambda: hits.append("kill"))
+        bindings.feed(press(Key.X, Modifier.CTRL))
+        assert bindings.feed(press(Key.K, Modifier.CTRL))
+        assert not bindings.feed(press(Key.A))
+        bindings.feed(press(Key.X, Modifier.CTRL))
+        bindings.feed(press(Key.A))
+        assert not bindings.pending
+        assert hits == ["kill"]
+
+    def test_timeout(self) -> None:
+        hits: list[str] = []
+        bindings = KeyBindings(timeout=0.5)
+        bindings.bind("ctrl+x ctrl+s", lambda: hits.append("save"))
+        bindings.feed(press(Key.X, Modifier.CTRL, 1.0))
+        assert not bindings.feed(press(Key.S, Modifier.CTRL, 1.6))
+        bindings.feed(press(Key.X, Modifier.CTRL, 2.0))
+        bindings.feed(press(Key.S, Modifier.CTRL, 2.4))
+        assert hits == ["save"]
+
+    def test_prefix_conflicts(self) -> None:
+        bindings = KeyBindings()
+        bindings.bind("ctrl+x ctrl+s", print)
+        with pytest.raises(ValueError):
+            bindings.bind("ctrl+x", print)
+        with pytest.raises(ValueError):
+            bindings.bind("ctrl+x ctrl+s", print)
+        with pytest.raises(ValueError):
+            bindings.bind("ctrl+x ctrl+s k", print)
+        assert len(bindings) == 1
+
+    def test_unbind_prunes(self) -> None:
+        bindings = KeyBindings()
+        save = bindings.bind("ctrl+x ctrl+s", print)
+        bindings.bind("ctrl+x ctrl+c", print)
+        assert bindings.unbind(save)
+        assert not bindings.unbind(save)
+        assert bindings.bind("ctrl+x ctrl+s", print)
+        bindings.unbind(parse_sequence("ctrl+x ctrl+s"))
+        bindings.unbind(parse_sequence("ctrl+x ctrl+c"))
+        assert len(bindings) == 0
+        assert not bindings._root.children
+        # A former prefix can now be bound on its own
+        bindings.bind("ctrl+x", print)
+
+    def test_alias_keys_match(self) -> None:
+        hits: list[int] = []
+        bindings = KeyBindings()
+        bindings.bind("ctrl+return", lambda: hits.append(1))
+        bindings.feed(press(Key.ENTER, Modifier.CTRL))
+        assert hits == [1]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from guiguigui.core.keyboard import Keyboard
 from guiguigui.core.types import Key
 from tests.conftest import MockBackend
@@ -60,7 +62,109 @@ class TestKeyboard:
             assert keyboard.is_pressed(Key.SHIFT)
         assert not keyboard.is_pressed(Key.SHIFT)
 
+    def test_state_and_modifiers(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        keyboard.press(Key.SHIFT)
+        keyboard.press(Key.A)
+
+        state = keyboard.state()
+        assert state.is_pressed(Key.A)
+        assert not state.is_pressed(Key.B)
+        assert keyboard.get_modifiers() == {Key.SHIFT}
+
+    def test_modifiers_query_only_modifier_keys(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        queried: list[Key | str] = []
+
+        def key_is_pressed(key: Key | str) -> bool:
+            queried.append(key)
+            return key in mock_backend._pressed_keys
+
+        monkeypatch.setattr(mock_backend, "key_is_pressed", key_is_pressed)
+        keyboard = Keyboard()
+        keyboard.press(Key.CTRL)
+        keyboard.press(Key.A)
+        assert keyboard.get_modifiers() == {Key.CTRL}
+        assert Key.A not in queried
+        assert len(queried) <= 6
+
     def test_layout(self, mock_backend: MockBackend) -> None:
         keyboard = Keyboard()
         layout = keyboard.layout()
         assert layout == "en_US"
+
+
+class TestKeyboardPaste:
+    def test_auto_pastes_long_text(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        mock_backend._clipboard_text = "previous"
+        text = "x" * keyboard.paste_threshold
+
+        keyboard.write(text, strategy="auto")
+        assert mock_backend.pasted_text == [text]
+        assert mock_backend.typed_text == []
+        assert mock_backend._clipboard_text == "previous"
+        assert not mock_backend._pressed_keys
+
+    def test_auto_types_short_text(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        keyboard.write("short", strategy="auto")
+        assert mock_backend.typed_text == ["short"]
+        assert mock_backend.pasted_text == []
+
+    def test_default_never_pastes(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        keyboard.write("x" * keyboard.paste_threshold)
+        assert mock_backend.pasted_text == []
+
+    def test_unrestorable_clipboard_is_left_alone(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(mock_backend, "clipboard_save", lambda: None)
+        set_texts: list[str] = []
+        set_text = mock_backend.clipboard_set_text
+
+        def record_set_text(text: str) -> None:
+            set_texts.append(text)
+            set_text(text)
+
+        monkeypatch.setattr(mock_backend, "clipboard_set_text", record_set_text)
+        mock_backend._clipboard_text = "previous"
+        Keyboard().paste("pasted")
+        assert set_texts == ["pasted"]
+        assert mock_backend._clipboard_text == "pasted"
+
+    def test_explicit_strategies(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        keyboard.write("tiny", strategy="paste")
+        keyboard.write("y" * 1000, strategy="keys")
+        assert mock_backend.pasted_text == ["tiny"]
+        assert mock_backend.typed_text == ["y" * 1000]
+        assert mock_backend._clipboard_text == ""
+
+    def test_unknown_strategy(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        with pytest.raises(ValueError):
+            keyboard.write("text", strategy="telepathy")
+
+
+class TestKeyboardConfirm:
+    def test_confirm_uses_profile_timeout(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from guiguigui.core.types import TimingProfile
+
+        timeouts: list[float] = []
+
+        def acknowledge(timeout: float = 1.0) -> float:
+            timeouts.append(timeout)
+            return 0.001
+
+        monkeypatch.setattr(mock_backend, "acknowledge", acknowledge)
+        keyboard = Keyboard()
+        patient = TimingProfile("patient", 0.0, 0.0, 0.0, 0.0, 0.0, confirm_timeout=5.0)
+        assert keyboard.tap(Key.A, profile=patient, confirm=True) == 0.001
+        assert keyboard.hotkey(Key.CTRL, Key.V, confirm=True) == 0.001
+        assert keyboard.write("hi", confirm=True) == 0.001
+        assert timeouts == [5.0, 1.0, 1.0]
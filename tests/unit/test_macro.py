@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import time
 
+import pytest
+
 from guiguigui.core.macro import (
     Action,
     Condition,
@@ -11,10 +13,12 @@ from guiguigui.core.macro import (
     MacroContext,
     MouseClick,
     MouseMove,
+    MousePath,
     Repeat,
     Wait,
 )
-from guiguigui.core.types import Key
+from guiguigui.core.types import Key, Point
+from tests.conftest import MockBackend
 
 
 class CustomAction(Action):
@@ -181,3 +185,75 @@ class TestMacro:
         assert not ctx.should_stop
         ctx.stop()
         assert ctx.should_stop
+
+
+class TestMacroOptimize:
+    @staticmethod
+    def _recorded() -> Macro:
+        macro = Macro("recorded")
+        macro.add(MouseMove(0, 0))
+        for x in range(1, 101):
+            macro.add(Wait(0.005)).add(MouseMove(x, x // 50))
+        macro.add(MouseClick())
+        for y in range(1, 41):
+            macro.add(Wait(0.005)).add(MouseMove(100, 2 + y))
+        macro.add(Wait(0.2))
+        return macro
+
+    def test_simplifies_runs(self) -> None:
+        macro = self._recorded()
+        optimized = macro.optimize(tolerance=1.0, rate=60)
+
+        kinds = [type(a) for a in optimized.actions]
+        assert kinds == [MouseMove, MousePath, MouseClick, Wait, MouseMove, MousePath, Wait]
+        first, second = optimized.actions[1], optimized.actions[5]
+        assert isinstance(first, MousePath) and isinstance(second, MousePath)
+        assert first.points[-1] == (100, 2)
+        assert first.timestamps[-1] == pytest.approx(0.5)
+        assert second.points[-1] == (100, 42)
+        assert optimized.actions[-1] == Wait(0.2)
+
+        report = macro.last_optimization
+        assert report is not None
+        assert report.moves == 141
+        assert report.points < 10
+        assert report.reduction > 0.9
+        assert report.replay_events == 2 + len(first.points) + len(second.points)
+
+    def test_speed(self) -> None:
+        optimized = self._recorded().optimize(speed=4)
+        path = optimized.actions[1]
+        assert isinstance(path, MousePath)
+        assert path.timestamps[-1] == pytest.approx(0.125)
+        assert optimized.actions[-1] == Wait(0.05)
+
+        with pytest.raises(ValueError):
+            Macro().optimize(speed=0)
+
+    def test_rest_keeps_its_time(self) -> None:
+        macro = Macro()
+        macro.add(MouseMove(0, 0)).add(MouseMove(50, 0, 0.1))
+        macro.add(Wait(0.3)).add(MouseMove(50, 0)).add(MouseMove(100, 0, 0.1))
+        path = macro.optimize(rate=100).actions[1]
+        assert isinstance(path, MousePath)
+        assert path.points[9] == (50, 0)
+        assert path.timestamps[9] == pytest.approx(0.1)
+        assert path.timestamps[10] == pytest.approx(0.41)
+        assert path.points[-1] == (100, 0)
+
+    def test_nested_actions(self) -> None:
+        inner = [MouseMove(0, 0), MouseMove(5, 0), MouseMove(10, 0), Wait(1.0)]
+        optimized = Macro().add(Repeat(inner, times=2)).optimize(speed=2)
+        repeat = optimized.actions[0]
+        assert isinstance(repeat, Repeat)
+        assert [type(a) for a in repeat.actions] == [MouseMove, MousePath, Wait]
+        assert repeat.actions[-1] == Wait(0.5)
+
+    def test_replay(self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        from guiguigui.core.mouse import mouse
+
+        monkeypatch.setattr(mouse, "_backend", mock_backend)
+        optimized = self._recorded().optimize(speed=10)
+        optimized.actions = [a for a in optimized.actions if not isinstance(a, MouseClick)]
+        optimized.run()
+        assert mock_backend._mouse_position == Point(100, 42)
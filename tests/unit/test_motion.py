@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from guiguigui.core import motion
+from guiguigui.core.motion import (
+    ease_in_out_cubic,
+    minimum_jerk,
+    play_path,
+    resample,
+    simplify,
+    trajectory,
+)
+from guiguigui.core.types import Point
+
+
+def _as_lists(points: Any, timestamps: Any) -> tuple[list[tuple[int, int]], list[float]]:
+    if hasattr(points, "tolist"):
+        points = points.tolist()
+    if hasattr(timestamps, "tolist"):
+        timestamps = timestamps.tolist()
+    return [tuple(p) for p in points], list(timestamps)
+
+
+class TestTrajectory:
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_matches_per_step_easing(self, monkeypatch: pytest.MonkeyPatch, numpy: bool) -> None:
+        if numpy and not motion._HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(motion, "_HAS_NUMPY", numpy)
+        motion._profile.cache_clear()
+        motion._timestamps.cache_clear()
+
+        start, end = Point(10, 20), Point(-300, 900)
+        for easing in (None, ease_in_out_cubic, minimum_jerk, lambda t: t**0.5):
+            points, timestamps = _as_lists(*trajectory(start, end, 0.5, 30, easing))
+            f = easing or (lambda t: t)
+            expected = [
+                (int(10 + -310 * f(i / 30)), int(20 + 880 * f(i / 30))) for i in range(1, 31)
+            ]
+            assert points == expected
+            assert timestamps == pytest.approx([0.5 * i / 30 for i in range(1, 31)])
+            assert points[-1] == (end.x, end.y)
+
+    def test_profile_is_cached(self) -> None:
+        motion._profile.cache_clear()
+        trajectory(Point(0, 0), Point(100, 0), 1.0, 60, minimum_jerk)
+        trajectory(Point(5, 5), Point(900, 300), 1.0, 60, minimum_jerk)
+        info = motion._profile.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+class TestPlayPath:
+    def test_sends_every_point(self) -> None:
+        sent: list[tuple[int, int]] = []
+        report = play_path(
+            [(1, 1), (2, 2), (3, 3)], [0.01, 0.02, 0.03], lambda x, y: sent.append((x, y))
+        )
+        assert sent == [(1, 1), (2, 2), (3, 3)]
+        assert report.steps == 3
+        assert report.dropped == 0
+        assert report.planned == 0.03
+        assert report.actual >= 0.03
+
+    def test_length_mismatch(self) -> None:
+        with pytest.raises(ValueError):
+            play_path([(1, 1)], [0.1, 0.2], lambda x, y: None)
+
+
+class TestSimplify:
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_collinear_run_collapses(self, monkeypatch: pytest.MonkeyPatch, numpy: bool) -> None:
+        if numpy and not motion._HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(motion, "_HAS_NUMPY", numpy)
+        points = [(i, 2 * i) for i in range(50)] + [(49 + i, 98) for i in range(1, 30)]
+        assert simplify(points, 0.5) == [0, 49, 78]
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_keeps_turning_point(self, monkeypatch: pytest.MonkeyPatch, numpy: bool) -> None:
+        if numpy and not motion._HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(motion, "_HAS_NUMPY", numpy)
+        assert simplify([(0, 0), (10, 0), (20, 0), (10, 0), (0, 0)], 1.0) == [0, 2, 4]
+
+    def test_tolerance(self) -> None:
+        points = [(0, 0), (5, 1), (10, 0)]
+        assert simplify(points, 2.0) == [0, 2]
+        assert simplify(points, 0.5) == [0, 1, 2]
+        with pytest.raises(ValueError):
+            simplify(points, -1)
+
+
+class TestResample:
+    def test_fills_segments(self) -> None:
+        points, timestamps = resample([(0, 0), (10, 0), (10, 0), (10, 20)], [0, 0.1, 0.5, 0.6], 20)
+        assert points == [(5, 0), (10, 0), (10, 10), (10, 20)]
+        assert timestamps == pytest.approx([0.05, 0.1, 0.55, 0.6])
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import time
 
+import pytest
+
 from guiguigui.core.mouse import Mouse
 from guiguigui.core.types import MouseButton, Point
 from tests.conftest import MockBackend
@@ -78,3 +80,116 @@ class TestMouse:
         with mouse.pressed(MouseButton.RIGHT):
             assert mouse.is_pressed(MouseButton.RIGHT)
         assert not mouse.is_pressed(MouseButton.RIGHT)
+
+    def test_state(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        mouse.move(10, 20)
+        mouse.press(MouseButton.RIGHT)
+
+        state = mouse.state()
+        assert state.position == Point(10, 20)
+        assert state.is_pressed(MouseButton.RIGHT)
+        assert not state.is_pressed(MouseButton.LEFT)
+        mouse.release(MouseButton.RIGHT)
+
+    def test_state_skips_unsupported_buttons(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def mouse_is_pressed(button: MouseButton) -> bool:
+            if button in (MouseButton.X1, MouseButton.X2):
+                raise ValueError(f"Unsupported button: {button}")
+            return button in mock_backend._pressed_buttons
+
+        monkeypatch.setattr(mock_backend, "mouse_is_pressed", mouse_is_pressed)
+        mouse = Mouse()
+        mouse.press(MouseButton.LEFT)
+        assert mouse.state().buttons == frozenset({MouseButton.LEFT})
+        mouse.release(MouseButton.LEFT)
+
+
+class TestMouseMotionTiming:
+    def test_report(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        mock_backend._mouse_position = Point(0, 0)
+        mouse.move(300, 300, duration=0.1, rate=60)
+
+        report = mouse.last_motion
+        assert report is not None
+        assert report.planned == 0.1
+        assert report.rate == 60.0
+        assert report.steps == 6
+        assert report.dropped == 0
+        assert report.error >= 0
+        assert mock_backend._mouse_position == Point(300, 300)
+
+    def test_rate(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        mouse.move(100, 100, duration=0.05, rate=1000)
+        assert mouse.last_motion is not None
+        assert mouse.last_motion.steps == 50
+
+        mouse.rate = 5000
+        mouse.move(0, 0, duration=0.01)
+        assert mouse.last_motion.rate == 1000
+        assert mouse.last_motion.steps == 10
+
+        with pytest.raises(ValueError):
+            mouse.move(1, 1, duration=0.1, rate=0)
+
+    def test_rate_uses_cached_displays(self, mock_backend: MockBackend) -> None:
+        mock_backend.get_displays()[0].refresh_rate = 144.0
+        mock_backend.display_reads = 0
+        mouse = Mouse()
+        mouse.move(100, 100, duration=0.01)
+        mouse.move(0, 0, duration=0.01)
+        assert mouse.last_motion is not None
+        assert mouse.last_motion.rate == 144.0
+        assert mock_backend.display_reads == 1
+
+    def test_overdue_steps_are_dropped(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        move_to = mock_backend.mouse_move_to
+
+        def slow_move_to(x: int, y: int) -> None:
+            time.sleep(0.02)
+            move_to(x, y)
+
+        mock_backend.mouse_move_to = slow_move_to  # type: ignore[method-assign]
+        mouse.move(500, 500, duration=0.1, rate=200)
+
+        report = mouse.last_motion
+        assert report is not None
+        assert report.dropped > 0
+        assert report.actual < 0.15
+        assert mock_backend._mouse_position == Point(500, 500)
+
+    @pytest.mark.slow
+    def test_long_move_keeps_schedule(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        mouse.move(1900, 1000, duration=2.0)
+        assert mouse.last_motion is not None
+        assert abs(mouse.last_motion.error) < 0.001
+
+
+class TestMouseConfirm:
+    def test_confirm_returns_latency(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        timeouts: list[float] = []
+
+        def acknowledge(timeout: float = 1.0) -> float:
+            timeouts.append(timeout)
+            return 0.002
+
+        monkeypatch.setattr(mock_backend, "acknowledge", acknowledge)
+        mouse = Mouse()
+        assert mouse.click() is None
+        assert timeouts == []
+        assert mouse.click(confirm=True, profile="zero") == 0.002
+        assert mouse.move(5, 5, confirm=True) == 0.002
+        assert timeouts == [1.0, 1.0]
+
+    def test_confirm_without_observation(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        assert mouse.press(confirm=True) is None
+        mouse.release()
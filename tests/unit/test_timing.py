@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from guiguigui.core.keyboard import Keyboard
+from guiguigui.core.mouse import Mouse
+from guiguigui.core.timing import PROFILES, Timing, timing
+from guiguigui.core.types import Key, MouseButton, Point, TimingProfile
+from tests.conftest import MockBackend
+
+
+class TestTiming:
+    def test_resolution_order(self) -> None:
+        timings = Timing()
+        assert timings.current().name == "default"
+        timings.set("fast")
+        assert timings.current().name == "fast"
+        with timings.use("zero"):
+            assert timings.current().name == "zero"
+            assert timings.resolve("human").name == "human"
+            with timings.use(PROFILES["human"]):
+                assert timings.current().name == "human"
+            assert timings.current().name == "zero"
+        assert timings.current().name == "fast"
+
+    def test_use_is_per_thread(self) -> None:
+        timings = Timing()
+        seen: list[str] = []
+        with timings.use("zero"):
+            thread = threading.Thread(target=lambda: seen.append(timings.current().name))
+            thread.start()
+            thread.join()
+        assert seen == ["default"]
+
+    def test_unknown_profile(self) -> None:
+        with pytest.raises(ValueError):
+            Timing().set("slow")
+
+    def test_register(self) -> None:
+        timings = Timing()
+        profile = TimingProfile("test", 0.0, 0.0, 0.0, 0.0, 0.0)
+        timings.register(profile)
+        try:
+            assert timings.get("test") is profile
+        finally:
+            del PROFILES["test"]
+
+
+class TestTimingProfiles:
+    def test_zero_clicks_do_not_sleep(self, mock_backend: MockBackend) -> None:
+        mouse = Mouse()
+        start = time.perf_counter()
+        for _ in range(1000):
+            mouse.click(profile="zero")
+        assert time.perf_counter() - start < 0.5
+        assert not mouse.is_pressed(MouseButton.LEFT)
+
+    def test_zero_drag_syncs(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        syncs: list[bool] = []
+        monkeypatch.setattr(mock_backend, "sync", lambda: syncs.append(True))
+        mouse = Mouse()
+        with timing.use("zero"):
+            mouse.drag(40, 50)
+        assert syncs == [True, True]
+        assert mock_backend._mouse_position == Point(40, 50)
+
+        mouse.drag(10, 10, profile="fast")
+        assert syncs == [True, True]
+
+    def test_zero_hotkey_syncs(
+        self, mock_backend: MockBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        syncs: list[frozenset[Key | str]] = []
+        monkeypatch.setattr(
+            mock_backend, "sync", lambda: syncs.append(frozenset(mock_backend._pressed_keys))
+        )
+        keyboard = Keyboard()
+        keyboard.hotkey(Key.CTRL, Key.SHIFT, Key.A, profile="zero")
+        assert syncs == [
+            {Key.CTRL},
+            {Key.CTRL, Key.SHIFT},
+            {Key.CTRL, Key.SHIFT, Key.A},
+        ]
+
+        keyboard.hotkey(Key.CTRL, Key.C, profile="fast")
+        assert len(syncs) == 3
+
+    def test_keyboard_profile(self, mock_backend: MockBackend) -> None:
+        keyboard = Keyboard()
+        start = time.perf_counter()
+        with timing.use("zero"):
+            for _ in range(500):
+                keyboard.tap(Key.A)
+                keyboard.hotkey(Key.CTRL, Key.C)
+        assert time.perf_counter() - start < 0.5
+        assert not keyboard.is_pressed(Key.CTRL)
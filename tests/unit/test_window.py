@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from guiguigui.core.types import Rect, WindowInfo, WindowState
+import dataclasses
+
+import pytest
+
+from guiguigui.core.spatial import WindowGrid
+from guiguigui.core.types import Point, Rect, WindowInfo, WindowState
 from guiguigui.core.window import Window
 from tests.conftest import MockBackend
 
@@ -282,3 +287,340 @@ class TestWindow:
 
         window.set_always_on_top(sample_window, True)
         assert sample_window.is_always_on_top
+
+
+def _make_window(handle: int, title: str, is_visible: bool = True) -> WindowInfo:
+    return WindowInfo(
+        handle=handle,
+        title=title,
+        class_name="Class",
+        pid=100 + handle,
+        process_name="app",
+        rect=Rect(0, 0, 800, 600),
+        client_rect=Rect(0, 0, 800, 600),
+        state=WindowState.NORMAL,
+        is_visible=is_visible,
+        is_active=False,
+        is_always_on_top=False,
+        opacity=1.0,
+    )
+
+
+class TestWindowIndex:
+    def test_enable_builds_snapshot(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        mock_backend._windows = [_make_window(1, "One"), _make_window(2, "Two", False)]
+
+        index = window.enable_live_index()
+        assert index.live
+        assert [w.title for w in window.list()] == ["One"]
+        assert len(window.list(visible_only=False)) == 2
+        assert index.stats().windows == 2
+
+    def test_lookups_do_not_enumerate(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        mock_backend._windows = [_make_window(1, "One")]
+        window.enable_live_index()
+        mock_backend._windows = []
+
+        assert window.find(title="One") is not None
+        assert window.position(1) == (0, 0)
+        assert window.size(1) == (800, 600)
+
+    def test_created_and_destroyed_events(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        window.enable_live_index()
+
+        mock_backend._windows = [_make_window(3, "New")]
+        mock_backend.emit_window_event("created", 3)
+        assert window.live_index is not None
+        assert window.live_index.stats().pending == 1
+        assert window.find(title="New") is not None
+
+        mock_backend.emit_window_event("destroyed", 3)
+        assert window.find(title="New") is None
+
+    def test_changed_event_updates_record(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        win = _make_window(1, "Before")
+        mock_backend._windows = [win]
+        window.enable_live_index()
+
+        mock_backend._windows = [_make_window(1, "After")]
+        mock_backend.emit_window_event("changed", 1)
+        assert window.find(title="After") is not None
+        assert window.live_index is not None
+        assert window.live_index.stats().events == 1
+
+    def test_active_event(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        mock_backend._windows = [_make_window(1, "One"), _make_window(2, "Two")]
+        window.enable_live_index()
+        assert window.active() is None
+
+        mock_backend.emit_window_event("active", 2)
+        active = window.active()
+        assert active is not None
+        assert active.handle == 2
+        assert active.is_active
+
+    def test_refresh_and_disable(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        window.enable_live_index()
+        mock_backend._windows = [_make_window(1, "One")]
+        assert window.list() == []
+
+        assert window.live_index is not None
+        window.live_index.refresh()
+        assert len(window.list()) == 1
+        assert window.live_index.stats().refreshes == 2
+
+        window.disable_live_index()
+        assert window.live_index is None
+        assert mock_backend._window_watchers == []
+
+    def test_unknown_handle_raises(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        window.enable_live_index()
+
+        with pytest.raises(ValueError):
+            window.position(42)
+
+
+class TestWindowQuery:
+    def _populate(self, mock_backend: MockBackend) -> None:
+        mock_backend._windows = [
+            _make_window(1, "Editor - notes.txt"),
+            _make_window(2, "Terminal"),
+            _make_window(3, "Editor - todo.md"),
+            _make_window(4, "Hidden Editor", is_visible=False),
+        ]
+        mock_backend._windows[1].class_name = "XTerm"
+        mock_backend._windows[1].process_name = "xterm"
+
+    def test_find_all_scan(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        self._populate(mock_backend)
+
+        assert [w.handle for w in window.find_all(title="editor")] == [1, 3]
+        assert [w.handle for w in window.find_all(class_name="term")] == [2]
+        assert window.find_all(title="missing") == []
+
+    def test_find_all_indexed_matches_scan(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        self._populate(mock_backend)
+        queries = [
+            {"title": "editor"},
+            {"title": "ED"},
+            {"title": "Editor.*md", "regex": True},
+            {"class_name": "term"},
+            {"class_name": "cla"},
+            {"pid": 102},
+            {"process_name": "XTERM"},
+            {"title": "editor", "pid": 103},
+            {"title": "notes", "predicate": lambda w: w.handle == 3},
+        ]
+        expected = [[w.handle for w in window.find_all(**q)] for q in queries]
+
+        window.enable_live_index()
+        assert [[w.handle for w in window.find_all(**q)] for q in queries] == expected
+
+    def test_find_all_hidden_windows(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        self._populate(mock_backend)
+        expected = [1, 3, 4]
+        assert [w.handle for w in window.find_all(title="editor", visible_only=False)] == expected
+
+        window.enable_live_index()
+        assert [w.handle for w in window.find_all(title="editor", visible_only=False)] == expected
+        hidden = window.find(title="hidden", visible_only=False)
+        assert hidden is not None
+        assert hidden.handle == 4
+
+    def test_indexed_find_tracks_changes(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        self._populate(mock_backend)
+        window.enable_live_index()
+
+        mock_backend._windows[0].title = "Browser"
+        mock_backend.emit_window_event("changed", 1)
+        assert [w.handle for w in window.find_all(title="editor")] == [3]
+        assert window.find(title="browser") is not None
+
+        mock_backend.emit_window_event("destroyed", 3)
+        assert window.find(title="editor") is None
+
+    def test_find_returns_first_in_order(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        self._populate(mock_backend)
+        window.enable_live_index()
+
+        found = window.find(title="editor")
+        assert found is not None
+        assert found.handle == 1
+
+    def test_regex_compiled_once(self, mock_backend: MockBackend) -> None:
+        from guiguigui.core.window import _compile_pattern
+
+        window = Window()
+        self._populate(mock_backend)
+        _compile_pattern.cache_clear()
+
+        for _ in range(5):
+            window.find(title="^Term", regex=True)
+        info = _compile_pattern.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+
+class TestWindowIter:
+    def test_iter_yields_matches(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        mock_backend._windows = [_make_window(1, "One"), _make_window(2, "Two")]
+
+        assert [w.handle for w in window.iter(title="o")] == [1, 2]
+        assert [w.handle for w in window.iter(title="two")] == [2]
+
+    def test_find_stops_at_first_hit(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        windows = [_make_window(i, f"Window {i}") for i in range(1, 6)]
+        read = []
+
+        def iter_windows(visible_only=True, pid=None, class_name=None, fields=None):
+            for win in windows:
+                read.append(win.handle)
+                yield win
+
+        mock_backend.iter_windows = iter_windows  # type: ignore[method-assign]
+
+        found = window.find(title="Window 2")
+        assert found is not None
+        assert found.handle == 2
+        assert read == [1, 2]
+
+    def test_filters_pushed_down(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        hints = []
+
+        def iter_windows(visible_only=True, pid=None, class_name=None, fields=None):
+            hints.append((visible_only, pid, class_name, fields))
+            yield from ()
+
+        mock_backend.iter_windows = iter_windows  # type: ignore[method-assign]
+
+        assert window.find(pid=1234, class_name="Term") is None
+        assert hints == [(True, 1234, "Term", None)]
+
+        window.find(title="x", fields=["rect"])
+        assert hints[-1][3] == {"rect", "title"}
+
+    def test_iter_include_hidden(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        mock_backend._windows = [_make_window(1, "One"), _make_window(2, "Two", False)]
+
+        assert [w.handle for w in window.iter()] == [1]
+        assert [w.handle for w in window.iter(visible_only=False)] == [1, 2]
+
+
+class TestLazyWindowInfo:
+    def test_fields_resolved_on_first_access(self) -> None:
+        from guiguigui.core.types import LazyWindowInfo
+
+        loads = []
+
+        def loader(info: LazyWindowInfo, name: str) -> None:
+            loads.append(name)
+            setattr(info, name, f"{name}-{info.handle}")
+
+        info = LazyWindowInfo(7, loader, rect=Rect(0, 0, 10, 10))
+        assert info.rect == Rect(0, 0, 10, 10)
+        assert not info.is_loaded("title")
+        assert info.title == "title-7"
+        assert info.title == "title-7"
+        assert loads == ["title"]
+        assert isinstance(info, WindowInfo)
+
+    def test_unknown_attribute(self) -> None:
+        from guiguigui.core.types import LazyWindowInfo
+
+        info = LazyWindowInfo(1, lambda i, n: None)
+        with pytest.raises(AttributeError):
+            _ = info.missing
+
+    def test_list_passes_fields(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        mock_backend._windows = [_make_window(1, "One")]
+
+        windows = window.list(fields=["rect"])
+        assert [w.handle for w in windows] == [1]
+
+
+class TestWindowHitTest:
+    def test_at_points_topmost_first(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        top = dataclasses.replace(_make_window(1, "Top"), rect=Rect(100, 100, 200, 200))
+        bottom = _make_window(2, "Bottom")
+        hidden = _make_window(3, "Hidden", is_visible=False)
+        mock_backend._windows = [hidden, top, bottom]
+
+        hits = window.at_points([(150, 150), Point(10, 10), (900, 900)])
+        assert [h.title if h else None for h in hits] == ["Top", "Bottom", None]
+
+    def test_grid_bottom_to_top(self) -> None:
+        low = dataclasses.replace(_make_window(1, "Low"), rect=Rect(0, 0, 1000, 1000))
+        high = dataclasses.replace(_make_window(2, "High"), rect=Rect(500, 500, 10, 10))
+        grid = WindowGrid([low, high], topmost_first=False, cell_size=64)
+
+        assert grid.at(505, 505) is high
+        assert grid.at(510, 510) is high  # Edges are inclusive, like Rect.contains
+        assert grid.at(511, 511) is low
+        assert grid.at(-1, 0) is None
+
+    def test_grid_skips_empty_rects(self) -> None:
+        empty = dataclasses.replace(_make_window(1, "Empty"), rect=Rect(0, 0, 0, 0))
+        assert WindowGrid([empty]).at(0, 0) is None
+
+    def test_live_index_answers_hit_tests(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        top = dataclasses.replace(_make_window(1, "Top"), rect=Rect(100, 100, 200, 200))
+        mock_backend._windows = [top, _make_window(2, "Bottom")]
+        window.enable_live_index()
+        mock_backend._windows = []
+
+        hit = window.at_point(150, 150)
+        assert hit is not None
+        assert hit.title == "Top"
+        hits = window.at_points([(150, 150), (10, 10)])
+        assert [h.title if h else None for h in hits] == ["Top", "Bottom"]
+
+    def test_live_grid_follows_window_events(self, mock_backend: MockBackend) -> None:
+        window = Window()
+        top = dataclasses.replace(_make_window(1, "Top"), rect=Rect(100, 100, 200, 200))
+        bottom = _make_window(2, "Bottom")
+        mock_backend._windows = [top, bottom]
+        window.enable_live_index()
+        assert window.at_points([(150, 150)])[0] is not None
+
+        mock_backend._windows = [dataclasses.replace(top, rect=Rect(500, 500, 10, 10)), bottom]
+        mock_backend.emit_window_event("changed", 1)
+        hit = window.at_point(150, 150)
+        assert hit is not None
+        assert hit.title == "Bottom"
+
+        new = dataclasses.replace(_make_window(3, "New"), rect=Rect(0, 0, 50, 50))
+        mock_backend._windows.append(new)
+        mock_backend.emit_window_event("created", 3)
+        hit = window.at_point(10, 10)
+        assert hit is not None
+        assert hit.title == "New"
+
+        mock_backend._windows = [bottom, new]
+        mock_backend.emit_window_event("restacked", 0)
+        hit = window.at_point(10, 10)
+        assert hit is not None
+        assert hit.title == "Bottom"
+
+        mock_backend.emit_window_event("destroyed", 2)
+        hit = window.at_point(10, 10)
+        assert hit is not None
+        assert hit.title == "New"